@@ -2,6 +2,7 @@ param(
     [ValidateSet(
         "All",
         "Audit",
+        "Benchmark",
         "Flake",
         "Install",
         "Tests"
@@ -27,6 +28,15 @@ switch ($ScriptAction) {
         Invoke-AuditScript
     }
     "Audit" { Invoke-AuditScript }
+    "Benchmark" {
+        # Throughput depends on the machine so the first run on a machine records the baseline later runs compare to.
+        $Baseline = "./benchmarks/baseline.json"
+        if (Test-Path $Baseline) {
+            python -m benchmarks --baseline $Baseline
+        } else {
+            python -m benchmarks --output $Baseline
+        }
+    }
     "Flake" { Invoke-FlakeScript }
     "Install" { Invoke-InstallScript }
     "Tests" {
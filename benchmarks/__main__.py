@@ -0,0 +1,37 @@
+from typing import Tuple
+from pathlib import Path
+import sys
+
+import click
+
+from .suite import (DEFAULT_SIZES, DEFAULT_THRESHOLD, BenchmarkResult, available_dictionaries, run_benchmarks, save_results, load_results,
+                    find_regressions)
+
+
+def _print_result(result: BenchmarkResult):
+    print(f'{result.operation:<6} {result.dictionary:<12} {result.size:>10} bytes '
+          f'{result.mb_per_second:>10.2f} MB/s {result.peak_memory:>12} bytes peak')
+
+
+@click.command()
+@click.option('--dictionary', '-d', multiple=True, type=click.Choice(available_dictionaries()), help='Defaults to every dictionary.')
+@click.option('--size', '-s', multiple=True, type=click.IntRange(min=1), help='Input size in bytes. Defaults to 16 bytes up to 100 MB.')
+@click.option('--output', '-o', type=click.Path(dir_okay=False, path_type=Path), help='Save the results as JSON.')
+@click.option('--baseline', '-b', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Fail if results regress from this JSON file.')
+@click.option('--threshold', '-t', type=click.FloatRange(min=0), default=DEFAULT_THRESHOLD, help='Allowed relative regression.')
+def main(dictionary: Tuple[str], size: Tuple[int], output: Path | None, baseline: Path | None, threshold: float):
+    results = run_benchmarks(dictionary or available_dictionaries(), size or DEFAULT_SIZES, _print_result)
+
+    if output is not None:
+        save_results(results, output)
+
+    if baseline is not None:
+        regressions = find_regressions(results, load_results(baseline), threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+from typing import Callable, Dict, Iterable, List, Tuple
+from functools import partial
+from pathlib import Path
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+import yaml
+
+from encoder import Encoder, Decoder
+
+
+DICTIONARY_FOLDER = Path(__file__).parent.parent.joinpath('dictionaries').absolute()
+
+KIB = 1024
+MIB = 1024 * KIB
+DEFAULT_SIZES = (16, KIB, 64 * KIB, MIB, 16 * MIB, 100 * MIB)
+DEFAULT_THRESHOLD = 0.2
+
+# Small inputs are repeated until at least this many seconds have been spent so the timer resolution does not
+# dominate the measurement. The best of the repeats is kept.
+_MIN_MEASUREMENT_SECONDS = 0.2
+_MAX_REPEATS = 10000
+
+
+class BenchmarkResult:
+
+    def __init__(self, dictionary: str, operation: str, size: int, mb_per_second: float, peak_memory: int):
+        self.dictionary = dictionary
+        self.operation = operation
+        self.size = size
+        self.mb_per_second = mb_per_second
+        self.peak_memory = peak_memory
+
+    @property
+    def key(self) -> Tuple[str, str, int]:
+        return self.dictionary, self.operation, self.size
+
+    def to_json(self) -> Dict:
+        return {
+            'dictionary': self.dictionary,
+            'operation': self.operation,
+            'size': self.size,
+            'mb_per_second': self.mb_per_second,
+            'peak_memory': self.peak_memory
+        }
+
+    @staticmethod
+    def from_json(value: Dict) -> 'BenchmarkResult':
+        return BenchmarkResult(value['dictionary'], value['operation'], value['size'], value['mb_per_second'], value['peak_memory'])
+
+
+def available_dictionaries() -> List[str]:
+    return sorted(path.stem for path in DICTIONARY_FOLDER.glob('*.yml'))
+
+
+def _read_dictionary(dictionary: str) -> Tuple[Dict[str, str], str]:
+    with open(DICTIONARY_FOLDER.joinpath(f'{dictionary}.yml'), 'r') as file:
+        contents = yaml.safe_load(file)
+        return contents['mappings'], contents['padding']
+
+
+def _best_seconds(operation: Callable[[], object]) -> float:
+    best = None
+    spent = 0.0
+    repeats = 0
+    while spent < _MIN_MEASUREMENT_SECONDS and repeats < _MAX_REPEATS:
+        start = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        spent = spent + elapsed
+        repeats = repeats + 1
+    return best
+
+
+def _peak_memory(operation: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(dictionary: str, operation: str, size: int, function: Callable[[], object]) -> BenchmarkResult:
+    function()
+    seconds = _best_seconds(function)
+    mb_per_second = size / MIB / seconds if seconds > 0 else float('inf')
+    return BenchmarkResult(dictionary, operation, size, mb_per_second, _peak_memory(function))
+
+
+def run_benchmarks(dictionaries: Iterable[str], sizes: Iterable[int], progress: Callable[[BenchmarkResult], None] | None = None) -> List[BenchmarkResult]:
+    """
+    Measures the encode and decode throughput, in MB/s, and the peak memory, as reported by tracemalloc, of each
+    dictionary at each input size. Throughput is measured without tracemalloc running so its overhead does not skew
+    the timings.
+
+    :param dictionaries: The names of the dictionaries, in the dictionaries folder, to benchmark.
+    :param sizes: The sizes, in bytes, of the random inputs to encode and decode.
+    :param progress: An optional callback invoked with each result as soon as it has been measured.
+    :return: The result of each measurement.
+    """
+
+    results = []
+    for dictionary in dictionaries:
+        mappings, padding = _read_dictionary(dictionary)
+        encoder = Encoder(mappings, padding)
+        decoder = Decoder(mappings, padding)
+        for size in sizes:
+            value = os.urandom(size)
+            encoded = encoder.encode_bytes(value)
+            for operation, function in (('encode', partial(encoder.encode_bytes, value)), ('decode', partial(decoder.decode, encoded))):
+                result = _measure(dictionary, operation, size, function)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return results
+
+
+def save_results(results: List[BenchmarkResult], path: Path):
+    contents = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': [result.to_json() for result in results]
+    }
+    with open(path, 'w') as file:
+        json.dump(contents, file, indent=2)
+
+
+def load_results(path: Path) -> List[BenchmarkResult]:
+    with open(path, 'r') as file:
+        return [BenchmarkResult.from_json(value) for value in json.load(file)['results']]
+
+
+def find_regressions(results: List[BenchmarkResult], baseline: List[BenchmarkResult], threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    Compares the results against a baseline. A result has regressed when its throughput drops, or its peak memory
+    grows, by more than the threshold relative to the matching baseline result. Results without a matching baseline
+    result are ignored.
+
+    :param results: The results of the current run.
+    :param baseline: The results of the baseline run.
+    :param threshold: The allowed relative change, for example 0.2 allows a 20% drop in throughput.
+    :return: A description of each regression. An empty list means nothing has regressed.
+    """
+
+    baseline_results = {result.key: result for result in baseline}
+    regressions = []
+    for result in results:
+        expected = baseline_results.get(result.key)
+        if expected is None:
+            continue
+        name = f'{result.operation} {result.dictionary} {result.size} bytes'
+        if result.mb_per_second < expected.mb_per_second * (1 - threshold):
+            regressions.append(f'{name}: throughput dropped from [{expected.mb_per_second:.2f}] to [{result.mb_per_second:.2f}] MB/s')
+        if result.peak_memory > expected.peak_memory * (1 + threshold):
+            regressions.append(f'{name}: peak memory grew from [{expected.peak_memory}] to [{result.peak_memory}] bytes')
+    return regressions
@@ -1,3 +1,9 @@
 from .lib.encode import encode_string, encode_bytes, Encoder
 from .lib.decode import decode_to_string, decode_to_bytes, Decoder
-from .lib.generator import generate_encoding_dictionary
+from .lib.bit_packing import MalformedEncodingError
+from .lib.generator import generate_encoding_dictionary, generate_mappings, generate_compact_table, dump_encoding_dictionary
+from .lib.codec_cache import codec_cache_info, clear_codec_cache, CodecCache
+from .lib.compiled_dictionary import compile_dictionary, load_compiled_dictionary
+from .lib.text_codec import register_codec, unregister_codec
+from .lib.profiling import CodecStats, StageStats
+from .lib.compact_table import CompactTable
@@ -0,0 +1,231 @@
+from typing import Any, Dict, List, Sequence
+from operator import lshift
+import math
+
+
+_BITS_IN_BYTE = 8
+
+
+class MalformedEncodingError(ValueError):
+
+    """
+    Raised when an encoded value cannot be decoded. The position is the index, counted in encoded characters and
+    excluding line breaks, of the first character that could not be decoded.
+    """
+
+    def __init__(self, reason: str, position: int = 0):
+        super().__init__(reason, position)
+        self.reason = reason
+        self.position = position
+
+    def __str__(self) -> str:
+        return f'{self.reason} Position: [{self.position}]'
+
+    def moved(self, offset: int) -> 'MalformedEncodingError':
+        """
+        Creates a copy of this error with the position moved by the offset, for example the offset of the chunk that
+        was being decoded within the whole encoded value.
+
+        :param offset: The number of encoded characters to move the position by.
+        :return: A copy of this error with the moved position.
+        """
+
+        return MalformedEncodingError(self.reason, self.position + offset)
+
+
+def unknown_representation_error(representation: str | bytes | int, position: int) -> MalformedEncodingError:
+    """
+    Creates the error raised when an encoded value contains a representation that is not in the encoding dictionary.
+
+    :param representation: The unknown representation. Bytes are shown as ASCII and integers as the character of
+        that byte value.
+    :param position: The position of the first character of the unknown representation.
+    :return: The error describing the unknown representation.
+    """
+
+    if isinstance(representation, int):
+        representation = chr(representation)
+    elif not isinstance(representation, str):
+        representation = str(representation, 'ascii', 'replace')
+    return MalformedEncodingError(f'Could not find a binary key in encoding dictionary that maps to representation: '
+                                  f'[{representation}].', position)
+
+
+def aligned_block_length(binary_key_length: int) -> int:
+    """
+    Calculates the smallest number of bytes that can be split into a whole number of binary keys. For example
+    a binary key length of 6 gives a block length of 3 bytes as 24 bits make up exactly 4 binary keys.
+
+    :param binary_key_length: The length, in bits, of each binary key.
+    :return: The number of bytes in the smallest block that contains a whole number of binary keys.
+    """
+
+    return math.lcm(_BITS_IN_BYTE, binary_key_length) // _BITS_IN_BYTE
+
+
+def aligned_group_length(binary_key_length: int, representation_length: int) -> int:
+    """
+    Calculates the number of encoded characters produced by encoding a single aligned block of bytes.
+
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param representation_length: The number of characters in each encoded representation.
+    :return: The number of encoded characters in the encoded representation of an aligned block.
+    """
+
+    return aligned_block_length(binary_key_length) * _BITS_IN_BYTE // binary_key_length * representation_length
+
+
+def _empty(representations: Sequence[Any]) -> Any:
+    # Representations may be either str or bytes and are joined by an empty value of the same type.
+    return representations[0][:0]
+
+
+def encode_aligned(value: bytes, representations: Sequence[str | bytes], binary_key_length: int) -> str | bytes:
+    """
+    Encodes the input bytes by pulling each binary key directly out of the bytes using integer shifts and masks
+    and looking up the representation of each key by its integer value.
+
+    :param value: The bytes to encode. The length must be a multiple of the aligned block length for the binary
+        key length.
+    :param representations: The encoded representations, as either str or bytes, indexed by the integer value of
+        their binary key.
+    :param binary_key_length: The length, in bits, of each binary key.
+    :return: The encoded representation of the input bytes of the same type as the representations.
+    """
+
+    block_length = aligned_block_length(binary_key_length)
+    symbols_per_block = block_length * _BITS_IN_BYTE // binary_key_length
+    shifts = range((symbols_per_block - 1) * binary_key_length, -1, -binary_key_length)
+    mask = (1 << binary_key_length) - 1
+
+    if block_length == 1:
+        blocks = value
+    else:
+        from_bytes = int.from_bytes
+        blocks = (from_bytes(value[i:i + block_length], 'big') for i in range(0, len(value), block_length))
+
+    return _empty(representations).join([representations[(block >> shift) & mask] for block in blocks for shift in shifts])
+
+
+def encode_tail(value: bytes, representations: Sequence[str | bytes], binary_key_length: int,
+                padding_character: str | bytes) -> str | bytes:
+    """
+    Encodes the trailing bytes that do not fill a complete aligned block. The final binary key is right padded with
+    zeros and one padding character is appended for every missing bit, or every two missing bits when the binary
+    key length is even.
+
+    :param value: The trailing bytes to encode. The length must be less than the aligned block length.
+    :param representations: The encoded representations, as either str or bytes, indexed by the integer value of
+        their binary key.
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param padding_character: The padding character of the same type as the representations.
+    :return: The encoded, and padded, representation of the trailing bytes of the same type as the representations.
+    """
+
+    return encode_bits(int.from_bytes(value, 'big'), len(value) * _BITS_IN_BYTE, representations, binary_key_length, padding_character)
+
+
+def encode_bits(block: int, bit_count: int, representations: Sequence[str | bytes], binary_key_length: int,
+                padding_character: str | bytes) -> str | bytes:
+    """
+    Encodes the lowest bit_count bits of the block. The final binary key is right padded with zeros and one padding
+    character is appended for every missing bit, or every two missing bits when the binary key length is even.
+
+    :param block: The integer value of the bits to encode.
+    :param bit_count: The number of bits to encode.
+    :param representations: The encoded representations, as either str or bytes, indexed by the integer value of
+        their binary key.
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param padding_character: The padding character of the same type as the representations.
+    :return: The encoded, and padded, representation of the bits of the same type as the representations.
+    """
+
+    if bit_count == 0:
+        return _empty(representations)
+
+    symbol_count = -(-bit_count // binary_key_length)
+    missing_bits = symbol_count * binary_key_length - bit_count
+    block = block << missing_bits
+    mask = (1 << binary_key_length) - 1
+    shifts = range((symbol_count - 1) * binary_key_length, -1, -binary_key_length)
+    encoded = _empty(representations).join([representations[(block >> shift) & mask] for shift in shifts])
+
+    padding_length = missing_bits // 2 if binary_key_length % 2 == 0 else missing_bits
+    return encoded + padding_character * padding_length
+
+
+def _get_symbol_values(encoded: str | bytes, symbol_values: Dict[Any, int], representation_length: int) -> List[int]:
+    try:
+        if representation_length == 1:
+            return [symbol_values[character] for character in encoded]
+        return [symbol_values[encoded[i:i + representation_length]] for i in range(0, len(encoded), representation_length)]
+    except KeyError as error:
+        # The position is only worked out once a lookup has failed so the lookups above carry no per symbol checks.
+        position = next(i for i in range(0, len(encoded), representation_length)
+                        if (encoded[i] if representation_length == 1 else encoded[i:i + representation_length]) == error.args[0])
+        raise unknown_representation_error(error.args[0], position) from None
+
+
+def decode_aligned(encoded: str | bytes, symbol_values: Dict[Any, int], binary_key_length: int, representation_length: int) -> bytes:
+    """
+    Decodes the input encoded string by looking up the integer value of each representation and packing the values
+    of each aligned group of representations back into bytes using integer shifts.
+
+    :param encoded: The encoded string to decode, or the ASCII bytes of the encoded string. The length must be a
+        multiple of the aligned group length and the string must not contain any padding.
+    :param symbol_values: The integer value of the binary key of each representation keyed by the representation.
+        When decoding bytes single character representations are keyed by their byte value and longer representations
+        by their bytes.
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param representation_length: The number of characters in each encoded representation.
+    :return: The decoded bytes.
+    """
+
+    block_length = aligned_block_length(binary_key_length)
+    symbols_per_block = block_length * _BITS_IN_BYTE // binary_key_length
+    values = _get_symbol_values(encoded, symbol_values, representation_length)
+
+    if symbols_per_block == 1:
+        if block_length == 1:
+            return bytes(values)
+        return b''.join([value.to_bytes(block_length, 'big') for value in values])
+
+    shifts = range((symbols_per_block - 1) * binary_key_length, -1, -binary_key_length)
+    groups = zip(*([iter(values)] * symbols_per_block))
+    if block_length == 1:
+        return bytes([sum(map(lshift, group, shifts)) for group in groups])
+    return b''.join([sum(map(lshift, group, shifts)).to_bytes(block_length, 'big') for group in groups])
+
+
+def decode_tail(encoded: str, symbol_values: Dict[str, int], binary_key_length: int, representation_length: int,
+                padding_character: str) -> bytes:
+    """
+    Decodes the trailing, and possibly padded, representations of an encoded string. Every trailing padding character
+    removes one bit, or two bits when the binary key length is even, from the end of the final binary key.
+
+    :param encoded: The trailing encoded characters to decode, including any padding.
+    :param symbol_values: The integer value of the binary key of each representation keyed by the representation.
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param representation_length: The number of characters in each encoded representation.
+    :param padding_character: The padding character.
+    :return: The decoded bytes.
+    :raises MalformedEncodingError: If the trailing characters are not a valid, padded, encoding.
+    """
+
+    unpadded = encoded.rstrip(padding_character)
+    if len(unpadded) % representation_length != 0:
+        position = len(unpadded) - len(unpadded) % representation_length
+        raise MalformedEncodingError(f'The encoded value is malformed. The trailing characters [{unpadded[position:]}] do not '
+                                     f'make up a complete representation of length [{representation_length}].', position)
+
+    values = _get_symbol_values(unpadded, symbol_values, representation_length)
+    removed_bits = (len(encoded) - len(unpadded)) * (2 if binary_key_length % 2 == 0 else 1)
+    bit_count = len(values) * binary_key_length - removed_bits
+    if bit_count < 0 or removed_bits >= binary_key_length or bit_count % _BITS_IN_BYTE != 0:
+        raise MalformedEncodingError(f'The encoded value is malformed. The trailing characters [{encoded}] do not decode '
+                                     'to a whole number of bytes.', max(len(unpadded) - representation_length, 0))
+
+    block = 0
+    for value in values:
+        block = block << binary_key_length | value
+    return (block >> removed_bits).to_bytes(bit_count // _BITS_IN_BYTE, 'big')
@@ -0,0 +1,138 @@
+from typing import Dict, Hashable, NamedTuple, Tuple, Type, TypeVar
+from collections import OrderedDict
+from threading import Lock
+
+from .base64_defaults import get_or_default_dictionary, get_or_default_padding
+from .encoding_definition_table import EncodingDefinitionTable
+
+
+_DEFAULT_MAXSIZE = 32
+_DEFAULT_DICTIONARY_FINGERPRINT = 'default'
+
+T = TypeVar('T', bound=EncodingDefinitionTable)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _fingerprint(encoding_dictionary: Dict[str, str] | None, padding_character: str | None) -> Tuple[Hashable, str]:
+    dictionary_fingerprint = _DEFAULT_DICTIONARY_FINGERPRINT if encoding_dictionary is None else frozenset(encoding_dictionary.items())
+    return dictionary_fingerprint, get_or_default_padding(padding_character)
+
+
+class CodecCache:
+
+    """
+    A bounded, least recently used, cache of compiled and validated encoding tables such as the Encoder and Decoder.
+
+    Tables are keyed by their type and a fingerprint of the encoding dictionary and padding character so repeated
+    calls with an equal dictionary reuse the already validated table instead of building a new one. Building the
+    fingerprint hashes every entry of the dictionary so the fingerprint of each recently used dictionary object is
+    remembered and reused for as long as the dictionary still equals the snapshot taken when it was fingerprinted.
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError(f'The maximum cache size must be greater than 0. Instead received: [{maxsize}]')
+        self._maxsize = maxsize
+        self._tables: OrderedDict = OrderedDict()
+        # Maps the id of a dictionary and the padding character to a copy of the dictionary and its fingerprint.
+        self._fingerprints: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def get(self, table_type: Type[T], encoding_dictionary: Dict[str, str] | None, padding_character: str | None) -> T:
+        key = (table_type, self._fingerprint(encoding_dictionary, padding_character))
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._hits = self._hits + 1
+                self._tables.move_to_end(key)
+                return table
+            self._misses = self._misses + 1
+
+        table = table_type(get_or_default_dictionary(encoding_dictionary), get_or_default_padding(padding_character))
+
+        with self._lock:
+            self._tables[key] = table
+            self._tables.move_to_end(key)
+            while len(self._tables) > self._maxsize:
+                self._tables.popitem(last=False)
+        return table
+
+    def _fingerprint(self, encoding_dictionary: Dict[str, str] | None, padding_character: str | None) -> Tuple[Hashable, str]:
+        if encoding_dictionary is None:
+            return _fingerprint(encoding_dictionary, padding_character)
+
+        identity = (id(encoding_dictionary), padding_character)
+        with self._lock:
+            remembered = self._fingerprints.get(identity)
+        # Comparing against the snapshot is much cheaper than hashing every entry again as the keys and values of an
+        # unchanged dictionary are the same objects. It also guards against the dictionary having been modified, or
+        # freed and its id reused by another dictionary.
+        if remembered is not None and remembered[0] == encoding_dictionary:
+            return remembered[1]
+
+        fingerprint = _fingerprint(encoding_dictionary, padding_character)
+        with self._lock:
+            self._fingerprints[identity] = (dict(encoding_dictionary), fingerprint)
+            self._fingerprints.move_to_end(identity)
+            while len(self._fingerprints) > self._maxsize:
+                self._fingerprints.popitem(last=False)
+        return fingerprint
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._tables))
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+            self._fingerprints.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_CODEC_CACHE = CodecCache()
+
+
+def get_codec(table_type: Type[T], encoding_dictionary: Dict[str, str] | None, padding_character: str | None) -> T:
+    """
+    Gets a compiled table of the requested type, such as an Encoder or Decoder, from the shared codec cache. If no
+    dictionary or padding character have been provided then this will fall back to the default base64 dictionary
+    and padding character.
+
+    Passing the same dictionary object again is cheap, but each call still compares the dictionary against the one
+    it was fingerprinted with, so code encoding or decoding many short values should hold on to the returned table.
+
+    :param table_type: The type of table to get or create. Must accept the encoding dictionary and padding character
+        as its constructor arguments.
+    :param encoding_dictionary: The dictionary containing the binary keys and encoded character representations.
+    :param padding_character: The padding character.
+    :return: A cached, or newly created, table of the requested type.
+    """
+
+    return _CODEC_CACHE.get(table_type, encoding_dictionary, padding_character)
+
+
+def codec_cache_info() -> CacheInfo:
+    """
+    Gets the hit and miss statistics of the shared codec cache.
+
+    :return: The number of hits, misses, the maximum size and the current size of the shared codec cache.
+    """
+
+    return _CODEC_CACHE.info()
+
+
+def clear_codec_cache():
+    """
+    Removes all tables from the shared codec cache and resets its statistics.
+    """
+
+    _CODEC_CACHE.clear()
@@ -0,0 +1,211 @@
+from typing import Iterable, Iterator, Mapping, Sequence, Tuple
+from array import array
+from bisect import bisect_left
+
+
+# Dictionaries with binary keys of at least this many bits are held in a CompactTable rather than a list of strings.
+COMPACT_TABLE_MIN_KEY_LENGTH = 16
+
+_ASCII_ENCODING = 'ascii'
+_WIDE_ENCODING = 'utf-32-le'
+_WIDE_CHARACTER_SIZE = 4
+
+
+class CompactTable(Sequence[str]):
+
+    """
+    Holds the representations of a dictionary in a single buffer of fixed width slots indexed by the integer value of
+    their binary key. ASCII representations take one byte per character and any other representations take four, as
+    UTF-32, so a dictionary with 20 bit keys and four character representations fits into 4 MB rather than the
+    hundreds of MB taken by a dict of strings.
+
+    Representations are found by their binary key with a slice of the buffer and binary keys are found by their
+    representation with a binary search over the keys sorted by representation, which is only built once needed.
+    """
+
+    def __init__(self, buffer: bytes, representation_length: int, ascii: bool):
+        """
+        :param buffer: The encoded representations packed in order of the integer value of their binary key.
+        :param representation_length: The number of characters in each representation.
+        :param ascii: True if the buffer holds ASCII characters, otherwise the buffer holds UTF-32-LE characters.
+        """
+
+        self._buffer = bytes(buffer)
+        self._representation_length = representation_length
+        self._ascii = ascii
+        self._encoding = _ASCII_ENCODING if ascii else _WIDE_ENCODING
+        self._slot_length = representation_length * (1 if ascii else _WIDE_CHARACTER_SIZE)
+        if representation_length <= 0 or len(self._buffer) % self._slot_length != 0:
+            raise ValueError(f'The buffer length [{len(self._buffer)}] is not a multiple of the slot length [{self._slot_length}].')
+        self._length = len(self._buffer) // self._slot_length
+        self._sorted_keys: array | None = None
+
+    @classmethod
+    def from_representations(cls, representations: Iterable[str], representation_length: int) -> 'CompactTable':
+        """
+        Packs representations into a compact table.
+
+        :param representations: The representations in order of the integer value of their binary key. Every
+            representation must have the same length.
+        :param representation_length: The number of characters in each representation.
+        :return: The compact table.
+        """
+
+        characters = ''.join(representations)
+        ascii = characters.isascii()
+        return cls(characters.encode(_ASCII_ENCODING if ascii else _WIDE_ENCODING), representation_length, ascii)
+
+    @property
+    def ascii(self) -> bool:
+        return self._ascii
+
+    @property
+    def buffer(self) -> bytes:
+        return self._buffer
+
+    @property
+    def representation_length(self) -> int:
+        return self._representation_length
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used by the buffer and, once built, the reverse index."""
+
+        sorted_keys_length = 0 if self._sorted_keys is None else len(self._sorted_keys) * self._sorted_keys.itemsize
+        return len(self._buffer) + sorted_keys_length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index = index + self._length
+        if not 0 <= index < self._length:
+            raise IndexError('CompactTable index out of range')
+        start = index * self._slot_length
+        return str(self._buffer[start:start + self._slot_length], self._encoding)
+
+    def __iter__(self) -> Iterator[str]:
+        characters = str(self._buffer, self._encoding)
+        length = self._representation_length
+        return (characters[i:i + length] for i in range(0, len(characters), length))
+
+    def slot(self, index: int) -> bytes:
+        """
+        Gets the encoded bytes of the representation of a binary key. For an ASCII table these are also the UTF-8
+        encoded bytes of the representation.
+
+        :param index: The integer value of the binary key.
+        :return: The encoded bytes of the representation.
+        """
+
+        start = index * self._slot_length
+        return self._buffer[start:start + self._slot_length]
+
+    def byte_representations(self) -> Sequence[bytes]:
+        """
+        Provides the representations of an ASCII table as bytes without copying them out of the buffer.
+
+        :return: A sequence of the bytes of each representation indexed by the integer value of their binary key.
+        """
+
+        if not self._ascii:
+            raise ValueError('Only a table of ASCII representations can provide its representations as bytes.')
+        return _CompactByteRepresentations(self)
+
+    def index_of(self, representation: str | bytes) -> int:
+        """
+        Finds the binary key of a representation.
+
+        :param representation: The representation, or the ASCII bytes of the representation for an ASCII table.
+        :return: The integer value of the binary key of the representation.
+        :raises KeyError: If no binary key maps to the representation.
+        """
+
+        try:
+            target = representation.encode(self._encoding) if isinstance(representation, str) else bytes(representation)
+        except UnicodeEncodeError:
+            raise KeyError(representation) from None
+
+        sorted_keys = self._get_sorted_keys()
+        position = bisect_left(sorted_keys, target, key=self.slot)
+        if position == len(sorted_keys) or self.slot(sorted_keys[position]) != target:
+            raise KeyError(representation)
+        return sorted_keys[position]
+
+    def symbol_index(self) -> 'CompactSymbolIndex':
+        """
+        Provides a mapping from each representation to the integer value of its binary key backed by this table.
+
+        :return: The reverse index of the table.
+        """
+
+        return CompactSymbolIndex(self)
+
+    def _get_sorted_keys(self) -> array:
+        if self._sorted_keys is None:
+            self._sorted_keys = array('I' if self._length > 0xFFFF else 'H', sorted(range(self._length), key=self.slot))
+        return self._sorted_keys
+
+
+class _CompactByteRepresentations(Sequence[bytes]):
+
+    def __init__(self, table: CompactTable):
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._table)))]
+        return self._table.slot(index if index >= 0 else index + len(self._table))
+
+
+class CompactSymbolIndex(Mapping[str, int]):
+
+    """
+    A read only mapping from each representation of a CompactTable, or its ASCII bytes, to the integer value of its
+    binary key. Lookups use the binary search of the table so the index takes no more memory than the table.
+    """
+
+    def __init__(self, table: CompactTable):
+        self._table = table
+
+    @property
+    def table(self) -> CompactTable:
+        return self._table
+
+    def __getitem__(self, representation: str | bytes) -> int:
+        return self._table.index_of(representation)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def values(self) -> range:
+        return range(len(self._table))
+
+    def items(self) -> Iterable[Tuple[str, int]]:
+        return zip(self._table, range(len(self._table)))
+
+
+def build_representation_table(representations: Sequence[str], binary_key_length: int) -> Sequence[str]:
+    """
+    Chooses how the representations of a dictionary are held. Dictionaries with long binary keys are packed into a
+    CompactTable while smaller dictionaries are kept as a list, which is faster to index.
+
+    :param representations: The representations indexed by the integer value of their binary key.
+    :param binary_key_length: The length, in bits, of each binary key.
+    :return: The representations as either a list or a CompactTable.
+    """
+
+    if isinstance(representations, CompactTable):
+        return representations
+    if binary_key_length < COMPACT_TABLE_MIN_KEY_LENGTH:
+        return representations if isinstance(representations, list) else list(representations)
+    return CompactTable.from_representations(representations, len(representations[0]))
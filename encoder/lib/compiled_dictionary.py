@@ -0,0 +1,102 @@
+from typing import Dict, NamedTuple, Sequence
+import mmap
+import struct
+import zlib
+
+from .compact_table import COMPACT_TABLE_MIN_KEY_LENGTH, CompactTable
+from .encoding_definition_table import EncodingDefinitionTable
+
+
+COMPILED_DICTIONARY_EXTENSION = '.encdict'
+
+_MAGIC = b'PYENCDIC'
+_VERSION = 2
+
+# The magic bytes, format version, table encoding, binary key length, representation length, padding code point and
+# the CRC32 checksum of every preceding header field followed by the packed representation table.
+_HEADER = struct.Struct('>8sHBBHII')
+_CHECKSUM_OFFSET = _HEADER.size - 4
+
+_ASCII_TABLE = 0
+_UTF32_TABLE = 1
+_TABLE_ENCODINGS = {_ASCII_TABLE: 'ascii', _UTF32_TABLE: 'utf-32-le'}
+_CHARACTER_WIDTHS = {_ASCII_TABLE: 1, _UTF32_TABLE: 4}
+
+
+class CompiledDictionary(NamedTuple):
+    padding_character: str
+    representations: Sequence[str]
+
+
+def _checksum(header: bytes, packed_table: bytes) -> int:
+    return zlib.crc32(packed_table, zlib.crc32(header))
+
+
+def compile_dictionary(encoding_dictionary: Dict[str, str], padding_character: str, path: str):
+    """
+    Validates an encoding dictionary and writes it to a compact binary file that can be loaded without parsing or
+    validating the dictionary again. The file contains a header, describing the shape of the dictionary and holding
+    a checksum of the header and table, followed by the representations packed in order of the integer value of
+    their binary key.
+
+    :param encoding_dictionary: The dictionary containing the binary keys and encoded character representations. The
+        dictionary must contain every possible binary key.
+    :param padding_character: The padding character.
+    :param path: The path of the compiled dictionary file to write.
+    """
+
+    table = EncodingDefinitionTable(encoding_dictionary, padding_character)
+
+    if isinstance(table._representations, CompactTable):
+        # The buffer of a compact table is already packed in the same layout as the file.
+        table_encoding = _ASCII_TABLE if table._representations.ascii else _UTF32_TABLE
+        packed_table = table._representations.buffer
+    else:
+        table_encoding = _ASCII_TABLE if all(representation.isascii() for representation in table._representations) else _UTF32_TABLE
+        packed_table = ''.join(table._representations).encode(_TABLE_ENCODINGS[table_encoding])
+    fields = (_MAGIC, _VERSION, table_encoding, table._binary_key_length, table._representation_value_length, ord(padding_character))
+    header = _HEADER.pack(*fields, _checksum(_HEADER.pack(*fields, 0)[:_CHECKSUM_OFFSET], packed_table))
+
+    with open(path, 'wb') as file:
+        file.write(header)
+        file.write(packed_table)
+
+
+def load_compiled_dictionary(path: str) -> CompiledDictionary:
+    """
+    Memory maps a compiled dictionary file and unpacks its representation table. The header and table are verified
+    against the checksum stored in the header instead of validating each entry.
+
+    The representations are read out of the mapping before it is closed so the file can be compiled again while the
+    tables loaded from it are still in use. Tables with binary keys of 16 bits or more are copied once, as they are,
+    into the buffer of a CompactTable, and smaller tables are decoded straight from the mapping.
+
+    :param path: The path of the compiled dictionary file.
+    :return: The padding character and the representations indexed by the integer value of their binary key. Tables
+        with binary keys of 16 bits or more are returned as a CompactTable over the packed table without unpacking it.
+    """
+
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            if len(view) < _HEADER.size:
+                raise ValueError(f'The file [{path}] is too short to be a compiled dictionary.')
+
+            magic, version, table_encoding, binary_key_length, representation_length, padding_code_point, checksum = _HEADER.unpack_from(view)
+            if magic != _MAGIC:
+                raise ValueError(f'The file [{path}] is not a compiled dictionary.')
+            if version != _VERSION or table_encoding not in _TABLE_ENCODINGS:
+                raise ValueError(f'The compiled dictionary [{path}] uses an unsupported format version [{version}]. '
+                                 'Compile the dictionary again.')
+
+            table_length = (1 << binary_key_length) * representation_length * _CHARACTER_WIDTHS[table_encoding]
+            with view[:_CHECKSUM_OFFSET] as header, view[_HEADER.size:] as packed_table:
+                if len(packed_table) != table_length or _checksum(header, packed_table) != checksum:
+                    raise ValueError(f'The compiled dictionary [{path}] is corrupt. The header or representation table does '
+                                     'not match the checksum stored in the header.')
+                if binary_key_length >= COMPACT_TABLE_MIN_KEY_LENGTH:
+                    representations = CompactTable(bytes(packed_table), representation_length, table_encoding == _ASCII_TABLE)
+                    return CompiledDictionary(chr(padding_code_point), representations)
+                characters = str(packed_table, _TABLE_ENCODINGS[table_encoding])
+
+    representations = [characters[i:i + representation_length] for i in range(0, len(characters), representation_length)]
+    return CompiledDictionary(chr(padding_code_point), representations)
@@ -1,38 +1,442 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Tuple
+from operator import lshift
+from random import Random
+from time import perf_counter
 
-from .base64_defaults import get_or_default_dictionary, get_or_default_padding
-from .convert import binary_to_bytes
-from .encoding_definition_table import EncodingDefinitionTable
-from .encoded_string_spliterator import EncodedStringSpliterator
+from .bit_packing import MalformedEncodingError, aligned_block_length, aligned_group_length, decode_aligned, decode_tail, encode_aligned
+from .codec_cache import get_codec
+from .compact_table import CompactSymbolIndex, CompactTable
+from .engine_table import EngineTable
+from .line_layout import find_line_layout
+from .stream import DEFAULT_CHUNK_SIZE, AlignedChunkIterator, aligned_chunk_size, iter_chunks
+from .parallel import DEFAULT_SEGMENT_SIZE, DEFAULT_BATCH_SIZE, PROCESS_POOL, map_segments, map_batches, resolve_worker_count
+from .profiling import profiled_stage
+from .engines import NUMPY_ENGINE, SIZE_BUCKETS, STDLIB_ENGINE
+from .wide_table import wide_symbol_count, build_wide_symbol_values
 
+if TYPE_CHECKING:
+    from .numpy_engine import NumpyDecodingTable
 
-class Decoder(EncodingDefinitionTable):
 
-    def __init__(self, encoding_dictionary: Dict[str, str], padding_character: str):
-        super().__init__(encoding_dictionary, padding_character)
+_LINE_BREAK_CHARACTERS = '\r\n'
+_LINE_BREAK_BYTES = b'\r\n'
 
-    def _get_binary_key(self, value: str) -> str:
-        for key in self._encoding_dictionary:
-            if self._encoding_dictionary[key] == value:
-                return key
-        raise Exception(f'Could not find a binary key in encoding dictionary that maps to representation: [{value}]')
+# Records with up to this many characters are decoded by decode_many as a single integer rather than being split into
+# aligned groups. Longer records are decoded the same way as decode.
+_MAX_RECORD_LENGTH = 512
 
-    def _get_binary_from_representation(self, representation: str) -> str:
-        padding_multiplier = 2 if self._even_key_length else 1
-        padding_character_count = (len(representation) - self._representation_value_length) * padding_multiplier
-        binary_key = self._get_binary_key(representation[:self._representation_value_length])
-        return binary_key[:len(binary_key) - padding_character_count]
 
-    def decode(self, encoded_string: str) -> bytes:
-        splitter = EncodedStringSpliterator(encoded_string, self._padding_character, self._representation_value_length)
-        binary_string = ''.join(reversed(list(map(self._get_binary_from_representation, splitter))))
-        return binary_to_bytes(binary_string)
+def _strip_line_breaks(value: str | bytes) -> str | bytes:
+    if not isinstance(value, str):
+        return bytes(value).translate(None, _LINE_BREAK_BYTES)
+    for character in _LINE_BREAK_CHARACTERS:
+        value = value.replace(character, '')
+    return value
+
+
+def _measure_aligned(decoder: 'Decoder', encoded: str | bytes, decoded: bytes) -> Tuple[int, int, int]:
+    return len(encoded), len(decoded), len(encoded) // decoder._representation_value_length
+
+
+def _measure_tail(decoder: 'Decoder', encoded: str, decoded: bytes) -> Tuple[int, int, int]:
+    return len(encoded), len(decoded), -(-len(decoded) * 8 // decoder._binary_key_length)
+
+
+def _measure_batch(decoder: 'Decoder', encoded_values: List[str | bytes], decoded: List[bytes]) -> Tuple[int, int, int]:
+    symbols = sum(-(-len(value) * 8 // decoder._binary_key_length) for value in decoded)
+    return sum(map(len, encoded_values)), sum(map(len, decoded)), symbols
+
+
+class Decoder(EngineTable):
+
+    def _initialize(self):
+        if isinstance(self._representations, CompactTable):
+            # A compact table is searched directly rather than indexed by a dict of every representation.
+            self._symbol_values: Dict[str, int] | CompactSymbolIndex = self._representations.symbol_index()
+        else:
+            self._symbol_values = {representation: value for value, representation in enumerate(self._representations)}
+        self._block_length = aligned_block_length(self._binary_key_length)
+        self._group_length = aligned_group_length(self._binary_key_length, self._representation_value_length)
+
+        # The trailing characters that may contain the final, padded, representations can be no longer than a full
+        # aligned group plus one padding character for each bit in a binary key.
+        self._hold_back_length = self._group_length + self._binary_key_length
+
+        self._wide_symbol_count = wide_symbol_count(self._binary_key_length, self._representation_value_length)
+        if self._representation_value_length == 1 and self._wide_symbol_count == 2 and 8 % self._binary_key_length != 0:
+            # Slicing out pairs of single character representations costs more than looking up each character on its
+            # own unless each wide lookup lines up with a whole byte.
+            self._wide_symbol_count = 1
+        self._wide_key_length = self._binary_key_length * self._wide_symbol_count
+        self._wide_representation_length = self._representation_value_length * self._wide_symbol_count
+        self._wide_group_length = aligned_group_length(self._wide_key_length, self._wide_representation_length)
+        self._wide_symbol_values: Dict[str, int] | None = None
+
+        # Encoded bytes are decoded with indexes keyed by the byte value, or bytes, of each representation that are
+        # only built once bytes are decoded.
+        self._accepts_bytes: bool | None = None
+        self._byte_symbol_values: Dict[int | bytes, int] | None = None
+        self._wide_byte_symbol_values: Dict[bytes, int] | None = None
+
+        # The shifts used to decode a record are reused across every record with the same length and padding.
+        self._record_layouts: Dict[Tuple[int, int], Tuple[range, int, int]] = {}
+
+        self._numpy_supported: bool | None = None
+        self._numpy_table: 'NumpyDecodingTable | None' = None
+        self._initialize_engines()
+
+    @property
+    def accepts_bytes(self) -> bool:
+        """
+        Whether the encoded input can be provided as bytes, or any other bytes like object, instead of a string. This
+        requires every representation, and the padding character, to be made up of ASCII characters.
+        """
+
+        if self._accepts_bytes is None:
+            if isinstance(self._representations, CompactTable):
+                ascii_representations = self._representations.ascii
+            else:
+                ascii_representations = all(representation.isascii() for representation in self._symbol_values)
+            self._accepts_bytes = self._padding_character.isascii() and ascii_representations
+        return self._accepts_bytes
 
-    def decode_string(self, encoded_string: str) -> str:
+    def decode(self, encoded_string: str | bytes) -> bytes:
+        return b''.join(self.iter_decode((encoded_string,)))
+
+    def decode_string(self, encoded_string: str | bytes) -> str:
         return str(self.decode(encoded_string), 'utf-8')
 
+    def decode_many(self, encoded_values: Iterable[str | bytes], workers: int = 1, batch_size: int = DEFAULT_BATCH_SIZE,
+                    pool: str = PROCESS_POOL, lazy: bool = False) -> List[bytes] | Iterator[bytes]:
+        """
+        Decodes many, typically short, encoded values such as identifiers or tokens. The values are decoded in batches
+        that share this compiled table and the shifts worked out for each record length, avoiding most of the per call
+        overhead of decoding each value with decode.
+
+        :param encoded_values: The encoded strings, or bytes like objects when accepts_bytes is True, to decode.
+        :param workers: The number of workers used to decode the batches.
+        :param batch_size: The number of values decoded by a worker at a time.
+        :param pool: The kind of pool used when more than one worker is requested. Either 'process' or 'thread'.
+        :param lazy: If True an iterator over the decoded values is returned instead of a list.
+        :return: The decoded bytes of each encoded value in the same order as the encoded values.
+        """
+
+        decoded = map_batches(self, '_decode_batch', encoded_values, batch_size, workers, pool)
+        return decoded if lazy else list(decoded)
+
+    def decode_parallel(self, encoded_string: str | bytes, workers: int | None = None, segment_size: int = DEFAULT_SEGMENT_SIZE) -> bytes:
+        """
+        Decodes the input encoded string by splitting it into segments aligned to a whole number of aligned groups of
+        representations and decoding the segments in a pool of worker processes. Line breaks are skipped and only the
+        final segment may contain padding.
+
+        :param encoded_string: The encoded string, or a bytes like object containing the ASCII encoded string, to
+            decode.
+        :param workers: The number of worker processes to use or None to use one worker per CPU.
+        :param segment_size: The number of characters decoded by a worker at a time. This will be rounded down to a
+            multiple of the aligned group length.
+        :return: The decoded bytes.
+        """
+
+        if not isinstance(encoded_string, str):
+            encoded_string = memoryview(encoded_string)
+        segment_size = aligned_chunk_size(segment_size, self._group_length)
+        segments = (encoded_string[i:i + segment_size] for i in range(0, len(encoded_string), segment_size))
+        return b''.join(self.iter_decode(segments, segment_size, resolve_worker_count(workers)))
+
+    def iter_decode(self, source: Any | Iterable[str | bytes], chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1) -> Iterator[bytes]:
+        """
+        Lazily decodes the encoded text read from a text file like object, or an iterable of strings, front to back
+        yielding the decoded bytes of each aligned group of representations as it is read. Line breaks are skipped
+        and the trailing padding is only handled once the end of the input has been reached.
+
+        When accepts_bytes is True the source may instead be a binary file like object, or an iterable of bytes like
+        objects such as memoryview slices, containing the ASCII encoded text. The bytes are decoded directly without
+        first being converted to strings.
+
+        :param source: A readable text or binary file like object or an iterable of strings or bytes like objects.
+        :param chunk_size: The maximum number of characters to read from a file like object at a time.
+        :param workers: The number of worker processes used to decode the aligned groups. The decoded bytes are
+            yielded in order so writing them sequentially places every segment at its offset in the output.
+        :return: An iterator over the decoded bytes of the source.
+        :raises MalformedEncodingError: If the source is not a valid encoding. The position of the error is counted
+            from the start of the source, excluding line breaks.
+        """
+
+        chunks = iter_chunks(source, aligned_chunk_size(chunk_size, self._group_length))
+        if self._stats is None:
+            chunks = map(self._prepare_chunk, chunks)
+        else:
+            chunks = map(self._prepare_profiled_chunk, self._stats.iter_stage('read', chunks))
+        groups = AlignedChunkIterator(chunks, self._group_length, self._hold_back_length)
+        decoded_length = 0
+        if workers > 1:
+            self._prepare_engines()
+        try:
+            for decoded in map_segments(self, '_decode_aligned', groups, workers):
+                decoded_length = decoded_length + len(decoded)
+                yield decoded
+
+            if groups.remainder:
+                remainder = groups.remainder if isinstance(groups.remainder, str) else str(groups.remainder, 'ascii', 'replace')
+                yield self._decode_tail(remainder)
+        except MalformedEncodingError as error:
+            # Chunks are decoded without knowing where they start so the position is moved past every aligned group
+            # that has already been decoded.
+            raise error.moved(decoded_length // self._block_length * self._group_length) from None
+
+    def decode_stream(self, reader: Any | Iterable[str | bytes], writer: Any, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1) -> int:
+        """
+        Decodes the encoded text read from a text file like object, or an iterable of strings, and writes the decoded
+        bytes to the writer as each aligned group is decoded so the full input and output never need to be held
+        in memory.
+
+        :param reader: A readable text or binary file like object or an iterable of strings or bytes like objects.
+        :param writer: A binary file like object the decoded bytes will be written to.
+        :param chunk_size: The maximum number of characters to read from a file like object at a time.
+        :param workers: The number of worker processes used to decode the aligned groups.
+        :return: The number of decoded bytes written.
+        """
+
+        stats = self._stats
+        written = 0
+        for decoded in self.iter_decode(reader, chunk_size, workers):
+            if stats is None:
+                writer.write(decoded)
+            else:
+                start = perf_counter()
+                writer.write(decoded)
+                stats.record('write', perf_counter() - start, len(decoded), len(decoded))
+            written = written + len(decoded)
+        return written
+
+    def decode_into(self, reader: Any | Iterable[str | bytes], buffer: Any, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1) -> int:
+        """
+        Decodes the encoded text read from a text file like object, or an iterable of strings, directly into a
+        pre-sized writable buffer, such as a memory mapped file, placing the decoded bytes of each aligned group at
+        its offset in the buffer.
+
+        :param reader: A readable text or binary file like object or an iterable of strings or bytes like objects.
+        :param buffer: A writable bytes like object large enough to hold all the decoded bytes.
+        :param chunk_size: The maximum number of characters to read from a file like object at a time.
+        :param workers: The number of worker processes used to decode the aligned groups.
+        :return: The number of decoded bytes written.
+        """
+
+        stats = self._stats
+        view = memoryview(buffer)
+        offset = 0
+        for decoded in self.iter_decode(reader, chunk_size, workers):
+            if stats is None:
+                view[offset:offset + len(decoded)] = decoded
+            else:
+                start = perf_counter()
+                view[offset:offset + len(decoded)] = decoded
+                stats.record('write', perf_counter() - start, len(decoded), len(decoded))
+            offset = offset + len(decoded)
+        return offset
+
+    def decode_range(self, encoded: str | bytes, start: int, length: int | None = None) -> bytes:
+        """
+        Decodes only part of a large encoded value, such as a record in a memory mapped archive, without decoding
+        anything before it. Every representation has the same length so the encoded characters covering the range
+        can be located directly. Only the aligned groups covering the range, and the trailing characters holding any
+        padding, are read.
+
+        Wrapped values are supported as long as every line, other than the last, has the same length and ends with
+        the same line break.
+
+        :param encoded: The encoded string, or a bytes like object such as a memoryview over a memory mapped file
+            when accepts_bytes is True.
+        :param start: The offset, in decoded bytes, of the first byte to decode.
+        :param length: The number of decoded bytes to decode or None to decode to the end.
+        :return: The decoded bytes in the range. The range is clipped to the end of the decoded value.
+        """
+
+        if start < 0 or (length is not None and length < 0):
+            raise ValueError(f'The start and length of the range cannot be negative. Instead received: [{start}] and [{length}]')
+
+        layout = find_line_layout(encoded)
+        trailing = self._prepare_chunk(encoded[layout.offset(max(0, layout.character_count - self._hold_back_length)):layout.content_length])
+        padding = self._padding_character if isinstance(trailing, str) else self._padding_character.encode('ascii')
+        decoded_length = self.decoded_length(layout.character_count, len(trailing) - len(trailing.rstrip(padding)))
+
+        end = decoded_length if length is None else min(decoded_length, start + length)
+        if start >= end:
+            return b''
+
+        first_block = start // self._block_length
+        first_character = first_block * self._group_length
+        last_block = -(-end // self._block_length)
+        if last_block * self._block_length > decoded_length // self._block_length * self._block_length:
+            # The range reaches into the final partial block so every trailing character, including the padding,
+            # is needed. The padded tail can be longer than a single aligned group.
+            last_character = layout.character_count
+        else:
+            last_character = last_block * self._group_length
+        try:
+            decoded = self.decode(encoded[layout.offset(first_character):layout.offset(last_character)])
+        except MalformedEncodingError as error:
+            raise error.moved(first_character) from None
+
+        first_byte = first_block * self._block_length
+        return decoded[start - first_byte:end - first_byte]
+
+    def decoded_length(self, character_count: int, padding_count: int) -> int:
+        """
+        Calculates the number of bytes an encoded string decodes to without decoding it.
+
+        :param character_count: The number of encoded characters, including padding but excluding line breaks.
+        :param padding_count: The number of trailing padding characters.
+        :return: The number of decoded bytes.
+        """
+
+        representation_characters = character_count - padding_count
+        if representation_characters < 0 or representation_characters % self._representation_value_length != 0:
+            raise ValueError(f'The encoded value is malformed. [{representation_characters}] encoded characters do not '
+                             f'make up a whole number of representations of length [{self._representation_value_length}].')
+        padding_multiplier = 2 if self._even_key_length else 1
+        bit_count = representation_characters // self._representation_value_length * self._binary_key_length - padding_count * padding_multiplier
+        return max(bit_count, 0) // 8
+
+    def _prepare_chunk(self, chunk: str | bytes) -> str | bytes:
+        if not isinstance(chunk, str) and not self.accepts_bytes:
+            raise ValueError('Encoded bytes can only be decoded when every representation and the padding character are '
+                             'ASCII characters. Decode the bytes to a string first.')
+        return _strip_line_breaks(chunk)
+
+    def _prepare_profiled_chunk(self, chunk: str | bytes) -> str | bytes:
+        start = perf_counter()
+        prepared = self._prepare_chunk(chunk)
+        self._stats.record('strip line breaks', perf_counter() - start, len(chunk), len(prepared))
+        return prepared
+
+    @profiled_stage('decode batch', _measure_batch)
+    def _decode_batch(self, encoded_values: List[str | bytes]) -> List[bytes]:
+        symbol_values = self._symbol_values
+        representation_length = self._representation_value_length
+        decoded: List[bytes] = []
+        for encoded in encoded_values:
+            encoded = self._prepare_chunk(encoded)
+            if len(encoded) > _MAX_RECORD_LENGTH:
+                decoded.append(self.decode(encoded))
+                continue
+            if not isinstance(encoded, str):
+                encoded = str(encoded, 'ascii', 'replace')
+
+            unpadded = encoded.rstrip(self._padding_character)
+            layout_key = (len(unpadded), len(encoded) - len(unpadded))
+            layout = self._record_layouts.get(layout_key)
+            if layout is None:
+                # The first record of each shape is decoded, and validated, as a padded tail.
+                decoded.append(self._decode_tail(encoded))
+                self._record_layouts[layout_key] = self._build_record_layout(*layout_key)
+                continue
+
+            shifts, removed_bits, byte_count = layout
+            try:
+                if representation_length == 1:
+                    values = [symbol_values[character] for character in unpadded]
+                else:
+                    values = [symbol_values[unpadded[i:i + representation_length]] for i in range(0, len(unpadded), representation_length)]
+            except KeyError:
+                # Decoding the record as a tail raises the error describing the unknown representation.
+                self._decode_tail(encoded)
+                raise
+            decoded.append((sum(map(lshift, values, shifts)) >> removed_bits).to_bytes(byte_count, 'big'))
+        return decoded
+
+    def _build_record_layout(self, unpadded_length: int, padding_count: int) -> Tuple[range, int, int]:
+        symbol_count = unpadded_length // self._representation_value_length
+        removed_bits = padding_count * (2 if self._even_key_length else 1)
+        shifts = range((symbol_count - 1) * self._binary_key_length, -1, -self._binary_key_length)
+        return shifts, removed_bits, (symbol_count * self._binary_key_length - removed_bits) // 8
+
+    @profiled_stage('decode tail', _measure_tail)
+    def _decode_tail(self, encoded: str) -> bytes:
+        return decode_tail(encoded, self._symbol_values, self._binary_key_length, self._representation_value_length,
+                           self._padding_character)
+
+    @profiled_stage('decode aligned', _measure_aligned)
+    def _decode_aligned(self, encoded: str | bytes) -> bytes:
+        return self._run_engine(self._select_engine(len(encoded)), encoded)
+
+    def _run_engine(self, engine: str, encoded: str | bytes) -> bytes:
+        if engine == STDLIB_ENGINE:
+            try:
+                return self._stdlib_table.decode(encoded)
+            except ValueError:
+                # binascii does not say which character is invalid so the pure Python engine decodes the input
+                # again to report the position of the unknown representation.
+                pass
+        elif engine == NUMPY_ENGINE:
+            return self._get_numpy_table().decode(encoded)
+
+        if isinstance(encoded, str):
+            symbol_values = self._symbol_values
+            wide_symbol_values = self._get_wide_symbol_values(len(encoded))
+        else:
+            symbol_values = self._get_byte_symbol_values()
+            wide_symbol_values = self._get_wide_byte_symbol_values(len(encoded))
+
+        if wide_symbol_values is None:
+            return decode_aligned(encoded, symbol_values, self._binary_key_length, self._representation_value_length)
+
+        wide_length = len(encoded) - len(encoded) % self._wide_group_length
+        try:
+            decoded = decode_aligned(encoded[:wide_length], wide_symbol_values, self._wide_key_length, self._wide_representation_length)
+        except MalformedEncodingError:
+            # The wide index only knows the combined representations so the input is decoded again one representation
+            # at a time to report the unknown representation itself.
+            decoded = decode_aligned(encoded[:wide_length], symbol_values, self._binary_key_length, self._representation_value_length)
+        return decoded + decode_aligned(encoded[wide_length:], symbol_values, self._binary_key_length, self._representation_value_length)
+
+    def _is_numpy_supported(self) -> bool:
+        if self._numpy_supported is None:
+            # NumPy is only imported once an input is large enough to use it.
+            from .numpy_engine import is_numpy_supported
+            self._numpy_supported = is_numpy_supported(self._binary_key_length, self._representations)
+        return self._numpy_supported
+
+    def _engine_samples(self) -> List[str]:
+        random = Random(0)
+        group_counts = (-(-length // self._group_length) for length in SIZE_BUCKETS)
+        return [encode_aligned(random.randbytes(group_count * self._block_length), self._representations, self._binary_key_length)
+                for group_count in group_counts]
+
+    def _get_numpy_table(self) -> 'NumpyDecodingTable':
+        if self._numpy_table is None:
+            from .numpy_engine import NumpyDecodingTable
+            self._numpy_table = NumpyDecodingTable(self._symbol_values, self._binary_key_length, self._representation_value_length)
+        return self._numpy_table
+
+    def _get_wide_symbol_values(self, encoded_length: int) -> Dict[str, int] | None:
+        if self._wide_symbol_values is None and self._wide_symbol_count > 1 and encoded_length >= 1 << self._wide_key_length:
+            # Only build the wide index once an input is large enough that the cost of building it is comparable
+            # to the cost of decoding the input one representation at a time.
+            self._wide_symbol_values = build_wide_symbol_values(self._symbol_values, self._binary_key_length, self._wide_symbol_count)
+        return self._wide_symbol_values
+
+    def _get_byte_symbol_values(self) -> Dict[int | bytes, int] | CompactSymbolIndex:
+        if isinstance(self._symbol_values, CompactSymbolIndex):
+            # The slots of an ASCII compact table are already the bytes of each representation.
+            return self._symbol_values
+        if self._byte_symbol_values is None:
+            # Iterating over bytes yields the integer value of each byte while slicing bytes yields bytes.
+            if self._representation_value_length == 1:
+                self._byte_symbol_values = {ord(representation): value for representation, value in self._symbol_values.items()}
+            else:
+                self._byte_symbol_values = {representation.encode('ascii'): value for representation, value in self._symbol_values.items()}
+        return self._byte_symbol_values
+
+    def _get_wide_byte_symbol_values(self, encoded_length: int) -> Dict[bytes, int] | None:
+        if self._wide_byte_symbol_values is None and self._wide_symbol_count > 1 and encoded_length >= 1 << self._wide_key_length:
+            byte_symbol_values = {representation.encode('ascii'): value for representation, value in self._symbol_values.items()}
+            self._wide_byte_symbol_values = build_wide_symbol_values(byte_symbol_values, self._binary_key_length, self._wide_symbol_count)
+        return self._wide_byte_symbol_values
+
 
-def decode_to_string(encoded: str,
+def decode_to_string(encoded: str | bytes,
                      encoding_dictionary: Dict[str, str] | None = None,
                      padding_character: str | None = None) -> str:
     """
@@ -40,19 +444,17 @@ def decode_to_string(encoded: str,
     If no dictionary or padding character have been provided then this will fall back to the default base64 dictionary
     and padding character.
 
-    :param encoded: The already encoded string to be decoded.
+    :param encoded: The already encoded string, or a bytes like object containing the ASCII encoded string, to be
+        decoded.
     :param encoding_dictionary: The dictionary containing the binary keys and encoded character representations.
     :param padding_character: The padding character.
     :return: The decoded, original, representation of the input encoded string.
     """
 
-    return Decoder(
-        get_or_default_dictionary(encoding_dictionary),
-        get_or_default_padding(padding_character)
-    ).decode_string(encoded)
+    return get_codec(Decoder, encoding_dictionary, padding_character).decode_string(encoded)
 
 
-def decode_to_bytes(encoded: str,
+def decode_to_bytes(encoded: str | bytes,
                     encoding_dictionary: Dict[str, str] | None = None,
                     padding_character: str | None = None) -> bytes:
     """
@@ -60,13 +462,11 @@ def decode_to_bytes(encoded: str,
     If no dictionary or padding character have been provided then this will fall back to the default base64 dictionary
     and padding character.
 
-    :param encoded: The already encoded string to be decoded.
+    :param encoded: The already encoded string, or a bytes like object containing the ASCII encoded string, to be
+        decoded.
     :param encoding_dictionary: The dictionary containing the binary keys and encoded character representations.
     :param padding_character: The padding character.
     :return: The decoded, original, byte representation of the input encoded string.
     """
 
-    return Decoder(
-        get_or_default_dictionary(encoding_dictionary),
-        get_or_default_padding(padding_character)
-    ).decode(encoded)
+    return get_codec(Decoder, encoding_dictionary, padding_character).decode(encoded)
@@ -1,45 +1,316 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+from random import Random
+from time import perf_counter
+import math
 
-from .convert import string_to_binary, bytes_to_binary
-from .pad_string import rpad_string
-from .base64_defaults import get_or_default_padding, get_or_default_dictionary
-from .binary_chunk_iterator import BinaryChunkIterator
-from .encoding_definition_table import EncodingDefinitionTable
+from .codec_cache import get_codec
+from .compact_table import CompactTable
+from .bit_packing import aligned_block_length, encode_aligned, encode_bits, encode_tail
+from .engine_table import EngineTable
+from .stream import DEFAULT_CHUNK_SIZE, AlignedChunkIterator, aligned_chunk_size, iter_chunks
+from .parallel import DEFAULT_SEGMENT_SIZE, DEFAULT_BATCH_SIZE, PROCESS_POOL, map_segments, map_batches, resolve_worker_count
+from .profiling import profiled_stage
+from .engines import NUMPY_ENGINE, SIZE_BUCKETS, STDLIB_ENGINE
+from .wide_table import wide_symbol_count, build_wide_representations
 
+if TYPE_CHECKING:
+    from .numpy_engine import NumpyEncodingTable
 
-class Encoder(EncodingDefinitionTable):
 
-    def __init__(self, encoding_dictionary: Dict[str, str], padding_character: str):
-        super().__init__(encoding_dictionary, padding_character)
+# Records up to this many bytes are encoded by encode_many as a single integer rather than being split into aligned
+# blocks. Longer records are encoded the same way as encode_bytes.
+_MAX_RECORD_LENGTH = 256
 
-    def _get_representation(self, binary_key: str) -> str:
-        if binary_key not in self._encoding_dictionary:
-            raise Exception(f'Provided encoding dictionary has no binary key matching: [{binary_key}]')
-        return self._encoding_dictionary[binary_key]
+_LINE_BREAK = '\n'
 
-    def _get_encoded_representation(self, binary_chunk: str) -> str:
-        binary_chunk_length = len(binary_chunk)
 
-        if binary_chunk_length == self._binary_key_length:
-            return self._get_representation(binary_chunk)
+def _wrap_lines(encoded: str, wrap: int, leading_line_break: bool = False) -> str:
+    lines = [encoded[i:i + wrap] for i in range(0, len(encoded), wrap)]
+    if leading_line_break:
+        # The line break ending the previous block is joined in rather than concatenated to avoid another copy.
+        lines.insert(0, '')
+    return _LINE_BREAK.join(lines)
 
-        padded_binary_string = rpad_string(binary_chunk, self._binary_key_length, '0')
-        unpadded_representation = self._get_representation(padded_binary_string)
 
-        padding_length_div = 2 if self._even_key_length else 1
-        padding_length = int((self._binary_key_length - binary_chunk_length) / padding_length_div)
-        padding = self._padding_character * padding_length
-        return f'{unpadded_representation}{padding}'
+def _measure_aligned(encoder: 'Encoder', value: bytes, encoded: Any) -> Tuple[int, int, int]:
+    return len(value), len(encoded), len(value) * 8 // encoder._binary_key_length
+
+
+def _measure_tail(encoder: 'Encoder', value: bytes, encoded: Any) -> Tuple[int, int, int]:
+    return len(value), len(encoded), -(-len(value) * 8 // encoder._binary_key_length)
+
+
+def _measure_batch(encoder: 'Encoder', values: List[bytes | str], encoded: List[str]) -> Tuple[int, int, int]:
+    symbol_characters = sum(len(value.rstrip(encoder._padding_character)) for value in encoded)
+    return sum(map(len, values)), sum(map(len, encoded)), symbol_characters // encoder._representation_value_length
+
+
+class Encoder(EngineTable):
+
+    def _initialize(self):
+        self._block_length = aligned_block_length(self._binary_key_length)
+        self._wide_symbol_count = wide_symbol_count(self._binary_key_length, self._representation_value_length)
+        self._wide_key_length = self._binary_key_length * self._wide_symbol_count
+        self._wide_block_length = aligned_block_length(self._wide_key_length)
+        self._wide_representations: List[str] | None = None
+        self._byte_representations: Sequence[bytes] | None = None
+        self._wide_byte_representations: List[bytes] | None = None
+
+        # The shifts and padding used to encode a record of each length are reused across every record of that length.
+        self._record_layouts: Dict[int, Tuple[range, int, str]] = {}
+        self._numpy_supported: bool | None = None
+        self._numpy_table: 'NumpyEncodingTable | None' = None
+        self._initialize_engines()
 
     def encode(self, binary_string: str) -> str:
-        iterator = BinaryChunkIterator(binary_string, self._binary_key_length)
-        return ''.join(map(self._get_encoded_representation, iterator))
+        block = int(binary_string, 2) if binary_string else 0
+        return encode_bits(block, len(binary_string), self._representations, self._binary_key_length, self._padding_character)
+
+    def encode_string(self, string_to_encode: str, wrap: int | None = None) -> str:
+        return self.encode_bytes(bytes(string_to_encode, 'utf-8'), wrap)
+
+    def encode_bytes(self, bytes_to_encode: bytes, wrap: int | None = None) -> str:
+        view = memoryview(bytes_to_encode)
+        aligned_length = len(view) - len(view) % self._block_length
+        encoded = f'{self._encode_aligned(view[:aligned_length])}{self._encode_tail(view[aligned_length:])}'
+        return encoded if wrap is None else _wrap_lines(encoded, self._validate_wrap(wrap))
+
+    def encode_to_bytes(self, bytes_to_encode: bytes) -> bytes:
+        """
+        Encodes the input bytes directly into the UTF-8 encoded bytes of their encoded representation without first
+        building the encoded string.
+
+        :param bytes_to_encode: The bytes, or any bytes like object, to encode.
+        :return: The UTF-8 encoded bytes of the encoded representation of the input bytes.
+        """
+
+        view = memoryview(bytes_to_encode)
+        aligned_length = len(view) - len(view) % self._block_length
+        return self._encode_aligned_to_bytes(view[:aligned_length]) + self._encode_tail_to_bytes(view[aligned_length:])
+
+    def encode_many(self, values: Iterable[bytes | str], workers: int = 1, batch_size: int = DEFAULT_BATCH_SIZE,
+                    pool: str = PROCESS_POOL, lazy: bool = False) -> List[str] | Iterator[str]:
+        """
+        Encodes many, typically short, values such as identifiers or tokens. The values are encoded in batches that
+        share this compiled table and the shifts and padding worked out for each record length, avoiding most of the
+        per call overhead of encoding each value with encode_bytes.
+
+        :param values: The values to encode. Strings are encoded as their UTF-8 bytes.
+        :param workers: The number of workers used to encode the batches.
+        :param batch_size: The number of values encoded by a worker at a time.
+        :param pool: The kind of pool used when more than one worker is requested. Either 'process' or 'thread'.
+        :param lazy: If True an iterator over the encoded values is returned instead of a list.
+        :return: The encoded representation of each value in the same order as the values.
+        """
+
+        encoded = map_batches(self, '_encode_batch', values, batch_size, workers, pool)
+        return encoded if lazy else list(encoded)
+
+    def encode_parallel(self, bytes_to_encode: bytes, workers: int | None = None, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                        wrap: int | None = None) -> str:
+        """
+        Encodes the input bytes by splitting them into segments aligned to a whole number of binary keys and encoding
+        the segments in a pool of worker processes. Only the final segment is padded.
+
+        :param bytes_to_encode: The bytes to encode.
+        :param workers: The number of worker processes to use or None to use one worker per CPU.
+        :param segment_size: The number of bytes encoded by a worker at a time. This will be rounded down to a
+            multiple of the aligned block length.
+        :param wrap: The number of encoded characters per line or None to encode the bytes as a single line.
+        :return: The encoded representation of the input bytes.
+        """
+
+        view = memoryview(bytes_to_encode)
+        segment_size = aligned_chunk_size(segment_size, self._block_length)
+        segments = (view[i:i + segment_size] for i in range(0, len(view), segment_size))
+        return ''.join(self.iter_encode(segments, segment_size, resolve_worker_count(workers), wrap))
+
+    def iter_encode(self, source: Any | Iterable[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1,
+                    wrap: int | None = None) -> Iterator[str]:
+        """
+        Lazily encodes the bytes read from a binary file like object, or an iterable of bytes, yielding the encoded
+        text of each block as it is read. Blocks are aligned so they always contain a whole number of binary keys
+        meaning only the final yielded value will contain padding.
+
+        When wrapping, blocks are instead aligned to a whole number of lines so the line breaks are inserted into the
+        text of each block as it is encoded. Lines are separated by a line feed and the final line is not followed
+        by one.
+
+        :param source: A readable binary file like object or an iterable of bytes like objects.
+        :param chunk_size: The maximum number of bytes to read from a file like object at a time. This will be rounded
+            down to a multiple of the aligned block length, or of the number of bytes that encode to whole lines.
+        :param workers: The number of worker processes used to encode the blocks.
+        :param wrap: The number of encoded characters per line or None to encode the source as a single line. Must be
+            a multiple of the representation length so no representation is split across two lines.
+        :return: An iterator over the encoded representation of the source.
+        """
+
+        alignment = self._block_length if wrap is None else self._wrapped_block_length(self._validate_wrap(wrap))
+        chunks = iter_chunks(source, aligned_chunk_size(chunk_size, alignment))
+        if self._stats is not None:
+            chunks = self._stats.iter_stage('read', chunks)
+        chunks = (memoryview(chunk) for chunk in chunks)
+        blocks = AlignedChunkIterator(chunks, alignment)
+        if workers > 1:
+            self._prepare_engines()
+        encoded_blocks = map_segments(self, '_encode_aligned', blocks, workers)
+
+        if wrap is None:
+            yield from encoded_blocks
+            tail = self._encode_tail(blocks.remainder or b'')
+            if tail:
+                yield tail
+            return
+
+        leading_line_break = False
+        for encoded in encoded_blocks:
+            yield _wrap_lines(encoded, wrap, leading_line_break)
+            leading_line_break = True
+
+        # The remainder is shorter than a wrapped block but may still contain whole aligned blocks.
+        tail = self.encode_bytes(blocks.remainder or b'')
+        if tail:
+            yield _wrap_lines(tail, wrap, leading_line_break)
+
+    def encode_stream(self, reader: Any | Iterable[bytes], writer: Any, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1,
+                      wrap: int | None = None) -> int:
+        """
+        Encodes the bytes read from a binary file like object, or an iterable of bytes, and writes the encoded text
+        to the writer as each block is encoded so the full input and output never need to be held in memory.
+
+        :param reader: A readable binary file like object or an iterable of bytes like objects.
+        :param writer: A text file like object the encoded representation will be written to.
+        :param chunk_size: The maximum number of bytes to read from a file like object at a time.
+        :param workers: The number of worker processes used to encode the blocks.
+        :param wrap: The number of encoded characters per line or None to write the encoded text as a single line.
+        :return: The number of encoded characters, including line breaks, written.
+        """
+
+        stats = self._stats
+        written = 0
+        for encoded in self.iter_encode(reader, chunk_size, workers, wrap):
+            if stats is None:
+                writer.write(encoded)
+            else:
+                start = perf_counter()
+                writer.write(encoded)
+                stats.record('write', perf_counter() - start, len(encoded), len(encoded))
+            written = written + len(encoded)
+        return written
+
+    def _validate_wrap(self, wrap: int) -> int:
+        if wrap <= 0 or wrap % self._representation_value_length != 0:
+            raise ValueError(f'The line length must be a positive multiple of the representation length '
+                             f'[{self._representation_value_length}]. Instead received: [{wrap}]')
+        return wrap
+
+    def _wrapped_block_length(self, wrap: int) -> int:
+        # The smallest number of bytes that encode to a whole number of lines.
+        line_bits = wrap // self._representation_value_length * self._binary_key_length
+        return math.lcm(line_bits, 8) // 8
+
+    @profiled_stage('encode aligned', _measure_aligned)
+    def _encode_aligned(self, value: bytes) -> str:
+        return self._run_engine(self._select_engine(len(value)), value)
+
+    @profiled_stage('encode aligned', _measure_aligned)
+    def _encode_aligned_to_bytes(self, value: bytes) -> bytes:
+        engine = self._select_engine(len(value))
+        if engine == STDLIB_ENGINE:
+            return self._stdlib_table.encode_to_bytes(value)
+        if engine == NUMPY_ENGINE:
+            return self._get_numpy_table().encode_to_bytes(value)
+        return self._encode_aligned_with(value, self._get_byte_representations(), self._get_wide_byte_representations(len(value)))
+
+    def _run_engine(self, engine: str, value: bytes) -> str:
+        if engine == STDLIB_ENGINE:
+            return self._stdlib_table.encode(value)
+        if engine == NUMPY_ENGINE:
+            return self._get_numpy_table().encode(value)
+        return self._encode_aligned_with(value, self._representations, self._get_wide_representations(len(value)))
+
+    def _engine_samples(self) -> List[bytes]:
+        random = Random(0)
+        return [random.randbytes(-(-length // self._block_length) * self._block_length) for length in SIZE_BUCKETS]
+
+    def _encode_aligned_with(self, value: bytes, representations: List[Any], wide_representations: List[Any] | None) -> Any:
+        if wide_representations is None:
+            return encode_aligned(value, representations, self._binary_key_length)
+
+        wide_length = len(value) - len(value) % self._wide_block_length
+        encoded = encode_aligned(value[:wide_length], wide_representations, self._wide_key_length)
+        return encoded + encode_aligned(value[wide_length:], representations, self._binary_key_length)
+
+    def _is_numpy_supported(self) -> bool:
+        if self._numpy_supported is None:
+            # NumPy is only imported once an input is large enough to use it as importing it takes longer than
+            # encoding a short input.
+            from .numpy_engine import is_numpy_supported
+            self._numpy_supported = is_numpy_supported(self._binary_key_length, self._representations)
+        return self._numpy_supported
+
+    def _get_numpy_table(self) -> 'NumpyEncodingTable':
+        if self._numpy_table is None:
+            from .numpy_engine import NumpyEncodingTable
+            self._numpy_table = NumpyEncodingTable(self._representations, self._binary_key_length)
+        return self._numpy_table
+
+    def _get_wide_representations(self, value_length: int) -> List[str] | None:
+        if self._wide_representations is None and self._wide_symbol_count > 1 and value_length >= 1 << self._wide_key_length:
+            # Only build the wide table once an input is large enough that the cost of building it is comparable
+            # to the cost of encoding the input one binary key at a time.
+            self._wide_representations = build_wide_representations(self._representations, self._wide_symbol_count)
+        return self._wide_representations
+
+    def _get_byte_representations(self) -> Sequence[bytes]:
+        if self._byte_representations is None:
+            if isinstance(self._representations, CompactTable) and self._representations.ascii:
+                # The slots of an ASCII compact table are already the UTF-8 bytes of each representation.
+                self._byte_representations = self._representations.byte_representations()
+            else:
+                self._byte_representations = [representation.encode('utf-8') for representation in self._representations]
+        return self._byte_representations
+
+    def _get_wide_byte_representations(self, value_length: int) -> List[bytes] | None:
+        if self._wide_byte_representations is None and self._wide_symbol_count > 1 and value_length >= 1 << self._wide_key_length:
+            self._wide_byte_representations = build_wide_representations(self._get_byte_representations(), self._wide_symbol_count)
+        return self._wide_byte_representations
+
+    @profiled_stage('encode batch', _measure_batch)
+    def _encode_batch(self, values: List[bytes | str]) -> List[str]:
+        representations = self._representations
+        mask = (1 << self._binary_key_length) - 1
+        from_bytes = int.from_bytes
+        encoded: List[str] = []
+        for value in values:
+            if isinstance(value, str):
+                value = value.encode('utf-8')
+            layout = self._record_layouts.get(len(value))
+            if layout is None:
+                if len(value) > _MAX_RECORD_LENGTH:
+                    encoded.append(self.encode_bytes(value))
+                    continue
+                layout = self._record_layouts[len(value)] = self._build_record_layout(len(value))
+            shifts, missing_bits, padding = layout
+            block = from_bytes(value, 'big') << missing_bits
+            encoded.append(''.join([representations[(block >> shift) & mask] for shift in shifts]) + padding)
+        return encoded
+
+    def _build_record_layout(self, value_length: int) -> Tuple[range, int, str]:
+        bit_count = value_length * 8
+        symbol_count = -(-bit_count // self._binary_key_length)
+        missing_bits = symbol_count * self._binary_key_length - bit_count
+        shifts = range((symbol_count - 1) * self._binary_key_length, -1, -self._binary_key_length)
+        padding_length = missing_bits // 2 if self._even_key_length else missing_bits
+        return shifts, missing_bits, self._padding_character * padding_length
 
-    def encode_string(self, string_to_encode: str) -> str:
-        return self.encode(string_to_binary(string_to_encode))
+    @profiled_stage('encode tail', _measure_tail)
+    def _encode_tail(self, value: bytes) -> str:
+        return encode_tail(value, self._representations, self._binary_key_length, self._padding_character)
 
-    def encode_bytes(self, bytes_to_encode: bytes) -> str:
-        return self.encode(bytes_to_binary(bytes_to_encode))
+    @profiled_stage('encode tail', _measure_tail)
+    def _encode_tail_to_bytes(self, value: bytes) -> bytes:
+        return encode_tail(value, self._get_byte_representations(), self._binary_key_length, self._padding_character.encode('utf-8'))
 
 
 def encode_string(value: str,
@@ -55,10 +326,7 @@ def encode_string(value: str,
     :return: An encoded string representation of the original value string.
     """
 
-    return Encoder(
-        get_or_default_dictionary(encoding_dictionary),
-        get_or_default_padding(padding_character)
-    ).encode_string(value)
+    return get_codec(Encoder, encoding_dictionary, padding_character).encode_string(value)
 
 
 def encode_bytes(value: bytes,
@@ -75,7 +343,4 @@ def encode_bytes(value: bytes,
     :return: An encoded string representation of the original bytes.
     """
 
-    return Encoder(
-        get_or_default_dictionary(encoding_dictionary),
-        get_or_default_padding(padding_character)
-    ).encode_bytes(value)
+    return get_codec(Encoder, encoding_dictionary, padding_character).encode_bytes(value)
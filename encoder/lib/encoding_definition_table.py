@@ -1,4 +1,11 @@
-from typing import Dict
+from typing import Any, Dict, Sequence
+
+from .compact_table import build_representation_table
+from .engines import resolve_engine
+from .profiling import CodecStats
+
+
+_LINE_BREAK_CHARACTERS = '\r\n'
 
 
 class EncodingDefinitionTable:
@@ -6,63 +13,183 @@ class EncodingDefinitionTable:
     """
     Contains basic logic to validate the encoding dictionary and padding characters.
 
-    This class will validate the encoding dictionary to ensure the following rules are met will ensure the following:
+    This class will validate the encoding dictionary to ensure the following rules are met:
     - All binary keys are of the same length
     - Each binary key is made up of the characters: 0 and 1
+    - There is a representation for every possible binary key
     - All character representations are of the same length
+    - Every character representation is unique
     - The padding character doesn't improperly overlap with a trailing character one of the character representations
+    - Neither the representations nor the padding character contain line breaks, which are skipped when decoding
+
+    Every rule is checked once, using set based checks, and the table is then compiled into a list of representations
+    indexed by the integer value of their binary key so encoding and decoding never need to check individual entries.
+    Dictionaries with binary keys of 16 bits or more are compiled into a CompactTable instead, which packs every
+    representation into a single buffer.
     """
 
-    def __init__(self, encoding_dictionary: Dict[str, str], padding_character: str):
+    # The stats every profiled stage is recorded to or None when profiling is disabled.
+    _stats: CodecStats | None = None
+
+    def __init__(self, encoding_dictionary: Dict[str, str], padding_character: str, engine: str | None = None):
+        """
+        :param encoding_dictionary: The dictionary containing the binary keys and encoded character representations.
+        :param padding_character: The padding character.
+        :param engine: The engine used for the aligned part of every input. One of python, numpy or stdlib, or auto
+            to benchmark the engines and pick the fastest for each size of input. Defaults to the PY_ENCODER_ENGINE
+            environment variable, or auto when it is not set or names an engine that does not support the dictionary.
+        """
+
         if len(encoding_dictionary) == 0:
             raise ValueError('The provided encoding dictionary must contain at least one entry.')
 
-        self._encoding_dictionary = encoding_dictionary.copy()
+        self._engine = resolve_engine(engine)
+        self._engine_requested = engine is not None
         self._padding_character = padding_character
         self._binary_key_length = len(next(_ for _ in encoding_dictionary.keys()))
         self._representation_value_length = len(next(_ for _ in encoding_dictionary.values()))
         self._even_key_length = self._binary_key_length % 2 == 0
-        self._validate_dictionary_keys()
-        self._validate_dictionary_values()
-        self._validate_padding_character()
+        self._validate_dictionary_keys(encoding_dictionary)
+        self._validate_dictionary_values(encoding_dictionary)
+        self._validate_padding_character(encoding_dictionary)
+        self._validate_key_coverage(encoding_dictionary)
+        self._representations = self._build_representation_table(encoding_dictionary)
+        self._initialize()
+
+    @classmethod
+    def from_representations(cls, representations: Sequence[str], padding_character: str, engine: str | None = None):
+        """
+        Creates a table directly from a list of representations indexed by the integer value of their binary key,
+        such as one loaded from a compiled dictionary, without validating each entry again. The representations
+        must already have been validated, for example when the dictionary was compiled.
+
+        :param representations: The encoded representations indexed by the integer value of their binary key, either
+            as a list or as a CompactTable. The number of representations must be a power of two.
+        :param padding_character: The padding character.
+        :param engine: The engine used for the aligned part of every input, as for the constructor.
+        :return: A new table of the type this was called on.
+        """
+
+        table = cls.__new__(cls)
+        table._engine = resolve_engine(engine)
+        table._engine_requested = engine is not None
+        table._padding_character = padding_character
+        table._binary_key_length = len(representations).bit_length() - 1
+        table._representation_value_length = len(representations[0])
+        table._even_key_length = table._binary_key_length % 2 == 0
+        table._representations = build_representation_table(representations, table._binary_key_length)
+        table._initialize()
+        return table
+
+    @property
+    def padding_character(self) -> str:
+        return self._padding_character
+
+    def enable_profiling(self, stats: CodecStats | None = None) -> CodecStats:
+        """
+        Starts recording the time spent, and the amount of data processed, by each stage of encoding or decoding.
+        Tables returned by get_codec are shared so profiling one records the stages of every caller using it. Stages
+        run in worker processes are not recorded.
+
+        :param stats: The stats to record to. A new CodecStats is created if none is provided.
+        :return: The stats the stages will be recorded to.
+        """
 
-    def _validate_dictionary_keys(self):
+        self._stats = stats if stats is not None else CodecStats()
+        return self._stats
+
+    def disable_profiling(self):
+        """
+        Stops recording the stages of encoding or decoding.
+        """
+
+        self._stats = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Tables are copied into worker processes which cannot record to the stats of this process.
+        state = self.__dict__.copy()
+        state.pop('_stats', None)
+        return state
+
+    def _initialize(self):
+        """
+        Hook for subclasses to build any additional lookup tables once the encoding dictionary has been validated
+        and compiled.
+        """
+
+    def _validate_dictionary_keys(self, encoding_dictionary: Dict[str, str]):
         if self._binary_key_length <= 0:
             raise ValueError('The length of the binary key needs to be greater than 0.')
 
-        for binary_key, representation in self._encoding_dictionary.items():
-
-            if len(binary_key) != self._binary_key_length:
-                raise ValueError(
-                    f'Binary key [{binary_key}] for representation [{representation}] does not match length of first '
-                    f'binary key of [{self._binary_key_length}]')
+        if {len(binary_key) for binary_key in encoding_dictionary} != {self._binary_key_length}:
+            binary_key = next(key for key in encoding_dictionary if len(key) != self._binary_key_length)
+            raise ValueError(
+                f'Binary key [{binary_key}] for representation [{encoding_dictionary[binary_key]}] does not match length '
+                f'of first binary key of [{self._binary_key_length}]')
 
-            if self._does_binary_contain_illegal_character(binary_key):
-                raise ValueError(
-                    f'Binary key [{binary_key} for representation[{representation}] is invalid. The binary key can '
-                    'only contain the characters 0 and 1.')
+        if not set(''.join(encoding_dictionary)) <= {'0', '1'}:
+            binary_key = next(key for key in encoding_dictionary if self._does_binary_contain_illegal_character(key))
+            raise ValueError(
+                f'Binary key [{binary_key} for representation[{encoding_dictionary[binary_key]}] is invalid. The binary '
+                'key can only contain the characters 0 and 1.')
 
     def _does_binary_contain_illegal_character(self, binary: str) -> bool:
         illegal_characters = binary.replace('0', '').replace('1', '')
         return len(illegal_characters) > 0
 
-    def _validate_dictionary_values(self):
+    def _validate_dictionary_values(self, encoding_dictionary: Dict[str, str]):
         if self._representation_value_length <= 0:
             raise ValueError('The length of the encoded character representation needs to be greater than 0.')
 
-        for binary_key, representation in self._encoding_dictionary.items():
-            if len(representation) != self._representation_value_length:
-                raise ValueError(
-                    f'Representation [{representation}] for binary key [{binary_key}] does not match length of first '
-                    f'representation of [{self._representation_value_length}]')
+        if {len(representation) for representation in encoding_dictionary.values()} != {self._representation_value_length}:
+            binary_key = next(key for key, value in encoding_dictionary.items() if len(value) != self._representation_value_length)
+            raise ValueError(
+                f'Representation [{encoding_dictionary[binary_key]}] for binary key [{binary_key}] does not match length '
+                f'of first representation of [{self._representation_value_length}]')
 
-    def _validate_padding_character(self):
+        if len(set(encoding_dictionary.values())) != len(encoding_dictionary):
+            binary_keys_by_representation: Dict[str, str] = {}
+            for binary_key, representation in encoding_dictionary.items():
+                if representation in binary_keys_by_representation:
+                    raise ValueError(
+                        f'Representation [{representation}] is used by both binary key '
+                        f'[{binary_keys_by_representation[representation]}] and binary key [{binary_key}]. Every '
+                        'representation must be unique.')
+                binary_keys_by_representation[representation] = binary_key
+
+        if not set(_LINE_BREAK_CHARACTERS).isdisjoint(''.join(encoding_dictionary.values())):
+            binary_key = next(key for key, value in encoding_dictionary.items() if not set(_LINE_BREAK_CHARACTERS).isdisjoint(value))
+            raise ValueError(
+                f'Representation [{encoding_dictionary[binary_key]!r}] for binary key [{binary_key}] contains a line '
+                'break. Line breaks are skipped when decoding.')
+
+    def _validate_padding_character(self, encoding_dictionary: Dict[str, str]):
         if len(self._padding_character) != 1:
             raise ValueError(f'The padding character must be a single character. '
                              f'Instead received: [{self._padding_character}]')
 
-        for key, value in self._encoding_dictionary.items():
-            if value.endswith(self._padding_character):
-                raise ValueError(f'The character [{self._padding_character}] cannot be used for padding as it matches '
-                                 f'the trailing characters for the character representation [{value}] associated with '
-                                 f'binary key [{key}].')
+        if self._padding_character in _LINE_BREAK_CHARACTERS:
+            raise ValueError(f'The padding character cannot be a line break. Instead received: [{self._padding_character!r}]')
+
+        if self._padding_character in {representation[-1] for representation in encoding_dictionary.values()}:
+            key, value = next((key, value) for key, value in encoding_dictionary.items() if value.endswith(self._padding_character))
+            raise ValueError(f'The character [{self._padding_character}] cannot be used for padding as it matches '
+                             f'the trailing characters for the character representation [{value}] associated with '
+                             f'binary key [{key}].')
+
+    def _validate_key_coverage(self, encoding_dictionary: Dict[str, str]):
+        # Every binary key has the same length and is made up of 0 and 1 so the keys cover every possible value
+        # exactly when there are 2^k of them.
+        if len(encoding_dictionary) != 1 << self._binary_key_length:
+            missing_value = next(value for value in range(1 << self._binary_key_length)
+                                 if format(value, f'0{self._binary_key_length}b') not in encoding_dictionary)
+            raise ValueError(
+                f'The encoding dictionary must contain a representation for every possible binary key of length '
+                f'[{self._binary_key_length}]. Expected [{1 << self._binary_key_length}] binary keys but found '
+                f'[{len(encoding_dictionary)}]. Missing binary key: [{format(missing_value, f"0{self._binary_key_length}b")}]')
+
+    def _build_representation_table(self, encoding_dictionary: Dict[str, str]) -> Sequence[str]:
+        representations = [''] * len(encoding_dictionary)
+        for binary_key, representation in encoding_dictionary.items():
+            representations[int(binary_key, 2)] = representation
+        return build_representation_table(representations, self._binary_key_length)
@@ -0,0 +1,85 @@
+from typing import Any, List
+from abc import ABCMeta, abstractmethod
+
+from .encoding_definition_table import EncodingDefinitionTable
+from .engines import AUTO_ENGINE, NUMPY_ENGINE, PYTHON_ENGINE, STDLIB_ENGINE, dictionary_fingerprint, get_engine_cache, size_bucket, tune_engines
+from .stdlib_engine import build_stdlib_table
+
+
+class EngineTable(EncodingDefinitionTable, metaclass=ABCMeta):
+
+    """
+    An encoding definition table that encodes or decodes the aligned part of every input with one of the python,
+    numpy or stdlib engines, either the engine it was given or the one tuned as the fastest for each size of input.
+    Subclasses provide the operation each engine runs and the samples the engines are tuned with.
+    """
+
+    @property
+    def engine(self) -> str:
+        """The requested engine, which is auto unless an engine was chosen explicitly."""
+
+        return self._engine
+
+    def _initialize_engines(self):
+        # Called by subclasses from _initialize once the tables every engine relies on have been set up.
+        self._stdlib_table = build_stdlib_table(self._binary_key_length, self._representations)
+        self._default_engine = STDLIB_ENGINE if self._stdlib_table is not None else PYTHON_ENGINE
+        self._bucket_engines: List[str] | None = None
+        if self._engine != AUTO_ENGINE and self._engine not in self._supported_engines():
+            if self._engine_requested:
+                raise ValueError(f'The [{self._engine}] engine does not support this dictionary. Supported engines: '
+                                 f'[{", ".join(self._supported_engines())}].')
+            # PY_ENCODER_ENGINE applies to every dictionary so the dictionaries its engine cannot handle are tuned.
+            self._engine = AUTO_ENGINE
+
+    def _supported_engines(self) -> List[str]:
+        engines = [PYTHON_ENGINE]
+        if self._stdlib_table is not None:
+            engines.append(STDLIB_ENGINE)
+        if self._is_numpy_supported():
+            engines.append(NUMPY_ENGINE)
+        return engines
+
+    def _select_engine(self, length: int) -> str:
+        """
+        Chooses the engine for an aligned input. The first time an input reaches the tuned size buckets the engines
+        tuned for the dictionary are loaded from the engine cache, or measured and saved when it has not been seen.
+
+        :param length: The length of the aligned input.
+        :return: The engine to use.
+        """
+
+        if self._engine != AUTO_ENGINE:
+            return self._engine
+        bucket = size_bucket(length)
+        if bucket == 0:
+            return self._default_engine
+        if self._bucket_engines is None:
+            self._bucket_engines = self._load_bucket_engines()
+        return self._bucket_engines[bucket]
+
+    def _prepare_engines(self):
+        # Tables are copied into worker processes, which would otherwise each load or tune the engines again.
+        if self._engine == AUTO_ENGINE and self._bucket_engines is None:
+            self._bucket_engines = self._load_bucket_engines()
+
+    def _load_bucket_engines(self) -> List[str]:
+        cache = get_engine_cache()
+        fingerprint = dictionary_fingerprint(type(self).__name__, self._binary_key_length, self._representations, self._padding_character)
+        engines = cache.get(fingerprint)
+        if engines is None:
+            engines = tune_engines(self._run_engine, self._supported_engines(), self._engine_samples(), self._default_engine)
+            cache.put(fingerprint, engines)
+        return engines
+
+    @abstractmethod
+    def _is_numpy_supported(self) -> bool:
+        """Checks whether the numpy engine is installed and supports the dictionary."""
+
+    @abstractmethod
+    def _run_engine(self, engine: str, value: Any) -> Any:
+        """Encodes or decodes an aligned input with the given engine."""
+
+    @abstractmethod
+    def _engine_samples(self) -> List[Any]:
+        """Builds one aligned input for each tuned size bucket to benchmark the engines with."""
@@ -0,0 +1,212 @@
+from typing import Any, Callable, Dict, List, Sequence
+from bisect import bisect_right
+from importlib.util import find_spec
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+import hashlib
+import json
+import os
+import platform
+import tempfile
+
+
+# The engines an Encoder or Decoder can use for the aligned part of an input. Every engine produces identical output.
+PYTHON_ENGINE = 'python'
+NUMPY_ENGINE = 'numpy'
+STDLIB_ENGINE = 'stdlib'
+ENGINES = (PYTHON_ENGINE, NUMPY_ENGINE, STDLIB_ENGINE)
+
+# Picks the fastest engine for each size of input by benchmarking the engines the first time a dictionary is used.
+AUTO_ENGINE = 'auto'
+
+# Overrides the engine of every Encoder and Decoder that is not given an engine when it is built.
+ENGINE_VARIABLE = 'PY_ENCODER_ENGINE'
+# The path of the file the tuned engines are saved to. An empty value keeps the tuned engines in memory only.
+ENGINE_CACHE_VARIABLE = 'PY_ENCODER_ENGINE_CACHE'
+
+# The lower bound of each size bucket after the first, in input bytes when encoding and in encoded characters when
+# decoding. Inputs shorter than the first bound always use the default engine, so encoding a short value never
+# imports NumPy or runs the benchmarks. The last bound is the default chunk size used when streaming.
+SIZE_BUCKETS = (1024, 8192, 64 * 1024)
+
+# Bumped whenever the size buckets or the layout of the cache file change so older decisions are tuned again.
+_CACHE_FORMAT_VERSION = 1
+_BENCHMARK_REPEATS = 3
+
+
+def resolve_engine(engine: str | None) -> str:
+    """
+    Works out the engine to use from an explicitly requested engine, falling back to the PY_ENCODER_ENGINE
+    environment variable and then to auto tuning.
+
+    :param engine: The requested engine, or None to use the environment variable.
+    :return: One of ENGINES or AUTO_ENGINE.
+    """
+
+    if engine is None:
+        engine = os.environ.get(ENGINE_VARIABLE) or AUTO_ENGINE
+    if engine != AUTO_ENGINE and engine not in ENGINES:
+        raise ValueError(f'Unknown engine [{engine}]. Expected one of [{", ".join((AUTO_ENGINE, *ENGINES))}].')
+    return engine
+
+
+def size_bucket(length: int) -> int:
+    """
+    :param length: The length of an aligned input.
+    :return: The index of the size bucket the input falls into. Bucket 0 holds the inputs that are never tuned.
+    """
+
+    return bisect_right(SIZE_BUCKETS, length)
+
+
+def dictionary_fingerprint(table_type: str, binary_key_length: int, representations: Sequence[str], padding_character: str) -> str:
+    """
+    Fingerprints a dictionary so the engines tuned for it can be found again by any process on the same host.
+
+    :param table_type: The name of the table the engines were tuned for, such as Encoder or Decoder.
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param representations: The encoded representations indexed by the integer value of their binary key.
+    :param padding_character: The padding character.
+    :return: A hex digest identifying the dictionary.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{table_type}\0{binary_key_length}\0{padding_character}\0'.encode('utf-8', 'surrogatepass'))
+    buffer = getattr(representations, 'buffer', None)
+    digest.update(buffer if isinstance(buffer, bytes) else ''.join(representations).encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+def _environment_key() -> str:
+    # The numpy engine is only measured when NumPy is installed so decisions made without it are kept apart.
+    numpy_installed = find_spec('numpy') is not None
+    return f'{_CACHE_FORMAT_VERSION}/{platform.python_implementation()}-{platform.python_version()}/numpy={numpy_installed}'
+
+
+def tune_engines(run_engine: Callable[[str, Any], Any], engines: Sequence[str], samples: Sequence[Any], default_engine: str) -> List[str]:
+    """
+    Runs a short benchmark of every engine on one sample input per tuned size bucket and picks the fastest engine
+    for each bucket.
+
+    :param run_engine: Called with an engine and a sample input to encode or decode the input with that engine.
+    :param engines: The engines that support the dictionary.
+    :param samples: One aligned input for each size bucket after the first.
+    :param default_engine: The engine used for the first bucket, whose inputs are too short to tune.
+    :return: The engine to use for each size bucket.
+    """
+
+    chosen = [default_engine]
+    for sample in samples:
+        timings = {}
+        for engine in engines:
+            # The first run builds any lookup tables the engine needs and is not counted.
+            run_engine(engine, sample)
+            fastest = min(timings.values(), default=float('inf'))
+            best = float('inf')
+            for _ in range(_BENCHMARK_REPEATS):
+                start = perf_counter()
+                run_engine(engine, sample)
+                best = min(best, perf_counter() - start)
+                # An engine far slower than the fastest so far cannot win so it is not run again.
+                if best > 2 * fastest:
+                    break
+            timings[engine] = best
+        chosen.append(min(engines, key=timings.__getitem__))
+    return chosen
+
+
+def default_engine_cache_path() -> Path | None:
+    """
+    :return: The path of the file tuned engines are saved to, or None if they should only be kept in memory.
+    """
+
+    path = os.environ.get(ENGINE_CACHE_VARIABLE)
+    if path is not None:
+        return Path(path) if path else None
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home().joinpath('.cache')
+    return Path(cache_home).joinpath('py-encoder', 'engines.json')
+
+
+class EngineCache:
+
+    """
+    Keeps the engines tuned for each dictionary in memory and in a JSON file shared by every process on the host. The
+    decisions are keyed by the fingerprint of the dictionary and the Python version, as the fastest engine depends on
+    both. A cache file that cannot be read or written is ignored rather than failing the encoding.
+    """
+
+    def __init__(self, path: Path | None):
+        self._path = path
+        self._entries: Dict[str, List[str]] | None = None
+        self._lock = Lock()
+
+    @property
+    def path(self) -> Path | None:
+        return self._path
+
+    def get(self, fingerprint: str) -> List[str] | None:
+        """
+        :param fingerprint: The fingerprint of the dictionary.
+        :return: The engine of each size bucket, or None if the dictionary has not been tuned yet.
+        """
+
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            engines = self._entries.get(f'{_environment_key()}/{fingerprint}')
+        if isinstance(engines, list) and len(engines) == len(SIZE_BUCKETS) + 1 and all(engine in ENGINES for engine in engines):
+            return engines
+        return None
+
+    def put(self, fingerprint: str, engines: List[str]):
+        """
+        :param fingerprint: The fingerprint of the dictionary.
+        :param engines: The engine of each size bucket.
+        """
+
+        key = f'{_environment_key()}/{fingerprint}'
+        with self._lock:
+            # The file is read again so decisions saved by other processes since it was first read are kept.
+            self._entries = self._read()
+            self._entries[key] = engines
+            self._write()
+
+    def _read(self) -> Dict[str, List[str]]:
+        if self._path is None:
+            return self._entries if self._entries is not None else {}
+        try:
+            with open(self._path, 'r', encoding='utf-8') as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return self._entries if self._entries is not None else {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self):
+        if self._path is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Writing to a temporary file and renaming it means other processes never read a partially written file.
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self._path.parent, delete=False, suffix='.tmp') as file:
+                json.dump(self._entries, file, indent=1, sort_keys=True)
+            os.replace(file.name, self._path)
+        except OSError:
+            pass
+
+
+_ENGINE_CACHES: Dict[Path | None, EngineCache] = {}
+_ENGINE_CACHES_LOCK = Lock()
+
+
+def get_engine_cache() -> EngineCache:
+    """
+    :return: The shared cache of the file given by PY_ENCODER_ENGINE_CACHE, or the default cache file.
+    """
+
+    path = default_engine_cache_path()
+    with _ENGINE_CACHES_LOCK:
+        cache = _ENGINE_CACHES.get(path)
+        if cache is None:
+            cache = _ENGINE_CACHES[path] = EngineCache(path)
+        return cache
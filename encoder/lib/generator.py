@@ -1,13 +1,11 @@
-from typing import Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 import string
-from random import randrange
-import math
-
-from .convert import strip_binary_prefix
-from .pad_string import lpad_string
+from random import Random
 
+from .compact_table import CompactTable
 
 _EXCLUDE_CHARACTERS = '\\"`\''
+_DIGITS_PER_LOOKUP = 2
 
 
 class EncodingDictionary:
@@ -21,7 +19,10 @@ class EncodingDictionary:
         yield 'mappings', self.mappings
 
 
-def generate_encoding_dictionary(binary_key_length: int, representation_length: int, padding_character: str = '=') -> EncodingDictionary:
+def generate_encoding_dictionary(binary_key_length: int,
+                                 representation_length: int,
+                                 padding_character: str = '=',
+                                 seed: int | None = None) -> EncodingDictionary:
     """
     Generates a pseudo-random character encoding dictionary that can be used to with the encoder and decoder provided
     in this package.
@@ -29,17 +30,80 @@ def generate_encoding_dictionary(binary_key_length: int, representation_length:
     :param binary_key_length: The length of the binary string to be mapped to an encoded character representation.
     :param representation_length: The number of characters to be used as an encoded representation of the binary value.
     :param padding_character: The character to be used as padding.
+    :param seed: An optional seed for the random number generator so the same dictionary can be generated again.
     :return: An encoding dictionary containing the padding character and a nested dictionary of binary keys
         and the encoded characters they map to.
     """
 
-    _validate_values(binary_key_length, representation_length, padding_character)
-    keys = _generate_keys(binary_key_length)
-    representations = _generate_representations(len(keys), representation_length, padding_character)
-    mappings = {keys[i]: representations[i] for i in range(len(keys))}
+    mappings = dict(generate_mappings(binary_key_length, representation_length, padding_character, seed))
     return EncodingDictionary(padding_character, mappings)
 
 
+def generate_mappings(binary_key_length: int,
+                      representation_length: int,
+                      padding_character: str = '=',
+                      seed: int | None = None) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily generates the binary key and pseudo-random representation pairs of an encoding dictionary in binary key
+    order. Unique representations are drawn by sampling, without replacement, from the index space of every possible
+    representation so generation does not slow down as the available representations are used up.
+
+    :param binary_key_length: The length of the binary string to be mapped to an encoded character representation.
+    :param representation_length: The number of characters to be used as an encoded representation of the binary value.
+    :param padding_character: The character to be used as padding.
+    :param seed: An optional seed for the random number generator so the same mappings can be generated again.
+    :return: An iterator over the binary key and representation of each mapping.
+    """
+
+    _validate_values(binary_key_length, representation_length, padding_character)
+    key_count = _max_decimal_value_for_bit_count(binary_key_length) + 1
+    representations = _generate_representations(key_count, representation_length, padding_character, Random(seed))
+    key_format = f'0{binary_key_length}b'
+    for value, representation in enumerate(representations):
+        yield format(value, key_format), representation
+
+
+def generate_compact_table(binary_key_length: int,
+                           representation_length: int,
+                           padding_character: str = '=',
+                           seed: int | None = None) -> CompactTable:
+    """
+    Generates the same pseudo-random representations as generate_mappings straight into a CompactTable, without
+    building a dictionary of binary keys, so dictionaries with long binary keys can be generated and used in memory.
+    The table can be used with Encoder.from_representations and Decoder.from_representations.
+
+    :param binary_key_length: The length of the binary string to be mapped to an encoded character representation.
+    :param representation_length: The number of characters to be used as an encoded representation of the binary value.
+    :param padding_character: The character to be used as padding.
+    :param seed: An optional seed for the random number generator so the same table can be generated again.
+    :return: The representations indexed by the integer value of their binary key.
+    """
+
+    _validate_values(binary_key_length, representation_length, padding_character)
+    key_count = _max_decimal_value_for_bit_count(binary_key_length) + 1
+    representations = _generate_representations(key_count, representation_length, padding_character, Random(seed))
+    return CompactTable.from_representations(representations, representation_length)
+
+
+def dump_encoding_dictionary(padding_character: str, mappings: Iterable[Tuple[str, str]], writer: Any):
+    """
+    Writes an encoding dictionary to the writer in the same YAML format as the dictionaries in the dictionaries
+    folder. The mappings are written one at a time so they never need to be held in memory all at once.
+
+    :param padding_character: The padding character.
+    :param mappings: The binary key and representation of each mapping.
+    :param writer: A text file like object the YAML will be written to.
+    """
+
+    writer.write(f"'padding': {_quote(padding_character)}\n'mappings':\n")
+    writer.writelines(f'  {_quote(binary_key)}: {_quote(representation)}\n' for binary_key, representation in mappings)
+
+
+def _quote(value: str) -> str:
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
 def _validate_values(binary_key_length: int, representation_length: int, padding_character: str):
     if binary_key_length <= 0:
         raise ValueError('The length of the binary key must be a whole number with a value greater than 0.')
@@ -50,7 +114,7 @@ def _validate_values(binary_key_length: int, representation_length: int, padding
         raise ValueError('The padding character must be a single character.')
 
     unique_character_count = len(_get_available_characters(padding_character))
-    unique_combinations = math.pow(unique_character_count, representation_length)
+    unique_combinations = unique_character_count ** representation_length
     max_decimal_value = _max_decimal_value_for_bit_count(binary_key_length)
     if max_decimal_value >= unique_combinations:
         raise ValueError(f'A representation length of [{representation_length}] allows for [{unique_combinations}] '
@@ -59,32 +123,37 @@ def _validate_values(binary_key_length: int, representation_length: int, padding
                          f'[{max_decimal_value}] unique combinations to be available.')
 
 
-def _generate_representations(number_of_characters: int, representation_length: int, padding_character: str) -> List[str]:
+def _generate_representations(number_of_representations: int,
+                              representation_length: int,
+                              padding_character: str,
+                              random: Random) -> Iterator[str]:
     character_options = _get_available_characters(padding_character)
-    representations = []
-    for _ in range(number_of_characters):
-        encoding = _generate_representation(character_options, representation_length)
-        while encoding in representations:
-            encoding = _generate_representation(character_options, representation_length)
-        representations.append(encoding)
-    return representations
-
-
-def _generate_representation(character_options: str, representation_length: int) -> str:
-    return ''.join(character_options[randrange(len(character_options))] for _ in range(representation_length))
-
-
-def _generate_keys(binary_key_size: int) -> List[str]:
-    return [_generate_key(i, binary_key_size) for i in range(_max_decimal_value_for_bit_count(binary_key_size) + 1)]
+    combinations = len(character_options) ** representation_length
+    indexes = random.sample(range(combinations), number_of_representations)
+
+    # Each index is converted to a representation by treating it as a number whose digits are characters. Looking up
+    # pairs of digits at a time halves the number of divisions needed per representation.
+    digits_per_lookup = min(_DIGITS_PER_LOOKUP, representation_length)
+    lookup = _build_digit_lookup(character_options, digits_per_lookup)
+    lookup_base = len(lookup)
+    lookups_per_representation = -(-representation_length // digits_per_lookup)
+    for index in indexes:
+        digits: List[str] = []
+        for _ in range(lookups_per_representation):
+            index, digit = divmod(index, lookup_base)
+            digits.append(lookup[digit])
+        yield ''.join(reversed(digits))[-representation_length:]
+
+
+def _build_digit_lookup(character_options: str, digits: int) -> List[str]:
+    lookup = ['']
+    for _ in range(digits):
+        lookup = [f'{prefix}{character}' for prefix in lookup for character in character_options]
+    return lookup
 
 
 def _max_decimal_value_for_bit_count(bit_count: int) -> int:
-    return int('1' * bit_count, 2)
-
-
-def _generate_key(value: int, binary_key_size: int) -> str:
-    key = strip_binary_prefix(bin(value))
-    return lpad_string(key, binary_key_size, '0')
+    return (1 << bit_count) - 1
 
 
 def _get_available_characters(padding_character: str) -> str:
@@ -0,0 +1,90 @@
+from typing import Any, NamedTuple
+
+
+_LINE_FEED = '\n'
+_CARRIAGE_RETURN = '\r'
+_LINE_BREAK_CHARACTERS = '\r\n'
+_LINE_BREAK_BYTES = b'\r\n'
+
+# The number of bytes first searched for the end of the first line. The window grows until a line break is found.
+_INITIAL_SEARCH_WINDOW = 4096
+
+
+class LineLayout(NamedTuple):
+
+    """
+    Describes how the characters of an encoded value are laid out into lines. Every line but the last must have
+    the same length.
+    """
+
+    # The number of encoded characters in each full line, or 0 when the encoded value is a single line.
+    line_length: int
+    # The length of the line break ending each line. Either 1 for a line feed or 2 for a carriage return line feed.
+    line_break_length: int
+    # The number of encoded characters, excluding every line break.
+    character_count: int
+    # The length of the encoded value excluding any trailing line breaks.
+    content_length: int
+
+    def offset(self, position: int) -> int:
+        """
+        Locates an encoded character within the encoded value.
+
+        :param position: The position of the encoded character counted excluding line breaks.
+        :return: The index of the character within the encoded value including line breaks.
+        """
+
+        if self.line_length == 0:
+            return position
+        line, column = divmod(position, self.line_length)
+        return line * (self.line_length + self.line_break_length) + column
+
+
+def _is_line_break(value: Any) -> bool:
+    return value in (_LINE_BREAK_CHARACTERS if isinstance(value, str) else _LINE_BREAK_BYTES)
+
+
+def _find_line_feed(encoded: Any, end: int) -> int:
+    if isinstance(encoded, str):
+        return encoded.find(_LINE_FEED, 0, end)
+
+    # Only the start of a memory mapped file is copied while searching for the end of the first line.
+    window = _INITIAL_SEARCH_WINDOW
+    while True:
+        index = bytes(encoded[:min(window, end)]).find(_LINE_FEED.encode('ascii'))
+        if index >= 0 or window >= end:
+            return index
+        window = window * 4
+
+
+def find_line_layout(encoded: Any) -> LineLayout:
+    """
+    Works out the line layout of an encoded value by reading its first line and checking its final line break. Only
+    the start and the end of the encoded value are read.
+
+    :param encoded: The encoded string or a bytes like object, such as a memoryview over a memory mapped file,
+        containing the ASCII encoded string.
+    :return: The layout of the lines of the encoded value.
+    """
+
+    content_length = len(encoded)
+    while content_length > 0 and _is_line_break(encoded[content_length - 1]):
+        content_length = content_length - 1
+
+    line_feed = _find_line_feed(encoded, content_length)
+    if line_feed < 0:
+        return LineLayout(0, 0, content_length, content_length)
+
+    line_break_length = 2 if line_feed > 0 and _is_line_break(encoded[line_feed - 1]) else 1
+    line_length = line_feed - (line_break_length - 1)
+    if line_length == 0:
+        raise ValueError('The encoded value starts with an empty line so the length of its lines cannot be determined.')
+
+    stride = line_length + line_break_length
+    line_count = -(-(content_length + line_break_length) // stride)
+    last_line_length = content_length - (line_count - 1) * stride
+    if not 0 < last_line_length <= line_length or not _is_line_break(encoded[(line_count - 1) * stride - 1]):
+        raise ValueError(f'The lines of the encoded value are not all [{line_length}] characters long so the position of '
+                         'an encoded character cannot be calculated.')
+
+    return LineLayout(line_length, line_break_length, content_length - (line_count - 1) * line_break_length, content_length)
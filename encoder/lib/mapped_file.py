@@ -0,0 +1,116 @@
+from typing import Iterator, Tuple
+from contextlib import contextmanager
+import codecs
+import mmap
+
+
+_LINE_BREAK_BYTES = b'\r\n'
+
+# UTF-8 continuation bytes never start a character so removing them, along with line breaks, leaves exactly one byte
+# per encoded character.
+_UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[memoryview]:
+    """
+    Memory maps a file for reading and provides a memoryview over its contents so slices of the file can be passed
+    around without being copied. An empty file, which cannot be memory mapped, provides an empty memoryview.
+
+    :param path: The path of the file to map.
+    :return: A context manager providing a read only memoryview over the contents of the file.
+    """
+
+    with open(path, 'rb') as file:
+        if file.seek(0, 2) == 0:
+            yield memoryview(b'')
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+@contextmanager
+def map_output_file(path: str, size: int) -> Iterator[memoryview]:
+    """
+    Creates, or truncates, a file of exactly the given size and memory maps it for writing.
+
+    :param path: The path of the file to create.
+    :param size: The size, in bytes, of the file.
+    :return: A context manager providing a writable memoryview over the contents of the file.
+    """
+
+    with open(path, 'w+b') as file:
+        file.truncate(size)
+        if size == 0:
+            yield memoryview(bytearray())
+            return
+        with mmap.mmap(file.fileno(), size) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+                mapped.flush()
+
+
+def iter_slices(view: memoryview, chunk_size: int) -> Iterator[memoryview]:
+    """
+    Iterates over consecutive slices of the view without copying the underlying bytes.
+
+    :param view: The view to slice.
+    :param chunk_size: The maximum length of each slice.
+    :return: An iterator over the slices of the view.
+    """
+
+    for i in range(0, len(view), chunk_size):
+        yield view[i:i + chunk_size]
+
+
+def iter_text(view: memoryview, chunk_size: int) -> Iterator[str]:
+    """
+    Iterates over the UTF-8 text in the view a chunk at a time. Characters split across two chunks are carried over
+    to the next chunk.
+
+    :param view: The view over the UTF-8 encoded text.
+    :param chunk_size: The maximum number of bytes to decode at a time.
+    :return: An iterator over the text in the view.
+    """
+
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in iter_slices(view, chunk_size):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+def count_encoded_characters(view: memoryview, padding_character: str, chunk_size: int) -> Tuple[int, int]:
+    """
+    Counts the encoded characters, excluding line breaks, and the trailing padding characters in the UTF-8 encoded
+    text in the view.
+
+    :param view: The view over the UTF-8 encoded text.
+    :param padding_character: The padding character.
+    :param chunk_size: The maximum number of bytes to count at a time.
+    :return: A tuple containing the number of encoded characters, including padding, and the number of trailing
+        padding characters.
+    """
+
+    character_count = 0
+    for chunk in iter_slices(view, chunk_size):
+        character_count = character_count + len(chunk.tobytes().translate(None, _LINE_BREAK_BYTES + _UTF8_CONTINUATION_BYTES))
+
+    padding = padding_character.encode('utf-8')
+    padding_count = 0
+    end = len(view)
+    while end > 0:
+        if view[end - 1] in _LINE_BREAK_BYTES:
+            end = end - 1
+        elif end >= len(padding) and view[end - len(padding):end] == padding:
+            end = end - len(padding)
+            padding_count = padding_count + 1
+        else:
+            break
+    return character_count, padding_count
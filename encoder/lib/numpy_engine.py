@@ -0,0 +1,242 @@
+from typing import Collection, Iterator, Mapping, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .bit_packing import aligned_block_length, unknown_representation_error
+from .compact_table import CompactSymbolIndex, CompactTable
+
+
+_BITS_IN_BYTE = 8
+_MAX_KEY_LENGTH = 32
+_MAX_SHIFT_BLOCK_LENGTH = 8
+_ASCII_LIMIT = 0x80
+_CODE_POINT_LIMIT = 0x110000
+_MAX_DENSE_INDEX_LENGTH = 1 << 16
+_UNKNOWN_VALUE = -1
+
+# The number of aligned input bytes, or encoded characters, processed per vectorized pass. This bounds the size of
+# the temporary arrays regardless of the size of the input.
+_MAX_PASS_LENGTH = 1 << 20
+
+
+def is_numpy_available() -> bool:
+    """
+    Checks whether the optional NumPy dependency is installed and the vectorized engine can be used.
+
+    :return: True if NumPy could be imported, otherwise False.
+    """
+
+    return numpy is not None
+
+
+def _uses_ascii(representations: Collection[str]) -> bool:
+    if isinstance(representations, CompactSymbolIndex):
+        return representations.table.ascii
+    if isinstance(representations, CompactTable):
+        return representations.ascii
+    return all(representation.isascii() for representation in representations)
+
+
+def _character_rows(representations: Sequence[str], ascii: bool):
+    dtype = numpy.uint8 if ascii else numpy.dtype('<u4')
+    if isinstance(representations, CompactTable):
+        # The buffer of a compact table already holds one row of characters per representation.
+        return numpy.frombuffer(representations.buffer, dtype=dtype).reshape(-1, representations.representation_length)
+    return numpy.array([[ord(character) for character in representation] for representation in representations], dtype=dtype)
+
+
+def _representation_base(representations: Collection[str]) -> int:
+    return _ASCII_LIMIT if _uses_ascii(representations) else _CODE_POINT_LIMIT
+
+
+def is_numpy_supported(binary_key_length: int, representations: Collection[str]) -> bool:
+    """
+    Checks whether NumPy is installed and the vectorized engine can handle the shape of a dictionary. Binary keys can
+    be at most 32 bits long and each representation must fit into a 64 bit integer when its characters are treated
+    as the digits of a number.
+
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param representations: The encoded representations of the dictionary.
+    :return: True if the vectorized engine can be used for the dictionary, otherwise False.
+    """
+
+    if not is_numpy_available() or binary_key_length > _MAX_KEY_LENGTH or len(representations) == 0:
+        return False
+    representation_length = len(next(iter(representations)))
+    return _representation_base(representations) ** representation_length <= 1 << 64
+
+
+def _index_width(binary_key_length: int) -> int:
+    return next(width for width in (1, 2, 4) if binary_key_length <= width * _BITS_IN_BYTE)
+
+
+class _Layout:
+
+    def __init__(self, binary_key_length: int):
+        self.binary_key_length = binary_key_length
+        self.block_length = aligned_block_length(binary_key_length)
+        self.symbols_per_block = self.block_length * _BITS_IN_BYTE // binary_key_length
+        self.index_width = _index_width(binary_key_length)
+        self.shifts = numpy.arange(self.symbols_per_block - 1, -1, -1, dtype=numpy.uint64) * numpy.uint64(binary_key_length)
+        self.mask = numpy.uint64((1 << binary_key_length) - 1)
+
+    def split(self, value: bytes):
+        """Splits aligned bytes into the integer value of each binary key."""
+
+        data = numpy.frombuffer(value, dtype=numpy.uint8)
+        if self.block_length <= _MAX_SHIFT_BLOCK_LENGTH:
+            blocks = numpy.zeros((len(data) // self.block_length, _MAX_SHIFT_BLOCK_LENGTH), dtype=numpy.uint8)
+            blocks[:, _MAX_SHIFT_BLOCK_LENGTH - self.block_length:] = data.reshape(-1, self.block_length)
+            block_values = blocks.view('>u8').astype(numpy.uint64)
+            return ((block_values >> self.shifts) & self.mask).ravel()
+
+        bits = numpy.unpackbits(data).reshape(-1, self.binary_key_length)
+        padded = numpy.zeros((len(bits), self.index_width * _BITS_IN_BYTE), dtype=numpy.uint8)
+        padded[:, self.index_width * _BITS_IN_BYTE - self.binary_key_length:] = bits
+        return numpy.packbits(padded, axis=1).view(f'>u{self.index_width}').ravel()
+
+    def join(self, values) -> bytes:
+        """Packs the integer value of each binary key back into aligned bytes."""
+
+        if self.block_length <= _MAX_SHIFT_BLOCK_LENGTH:
+            groups = values.astype(numpy.uint64).reshape(-1, self.symbols_per_block)
+            block_values = numpy.bitwise_or.reduce(groups << self.shifts, axis=1).astype('>u8')
+            block_bytes = block_values.view(numpy.uint8).reshape(-1, _MAX_SHIFT_BLOCK_LENGTH)
+            return block_bytes[:, _MAX_SHIFT_BLOCK_LENGTH - self.block_length:].tobytes()
+
+        padded = values.astype(f'>u{self.index_width}').view(numpy.uint8).reshape(-1, self.index_width)
+        bits = numpy.unpackbits(padded, axis=1)[:, self.index_width * _BITS_IN_BYTE - self.binary_key_length:]
+        return numpy.packbits(bits.ravel()).tobytes()
+
+
+class NumpyEncodingTable:
+
+    """
+    Vectorized encoder that splits whole buffers of aligned bytes into binary keys using array shifts, or
+    numpy.unpackbits for blocks wider than 64 bits, and looks up the representations with fancy indexing into an
+    array of characters.
+    """
+
+    def __init__(self, representations: Sequence[str], binary_key_length: int):
+        self._layout = _Layout(binary_key_length)
+        self._ascii = _uses_ascii(representations)
+        self._characters = _character_rows(representations, self._ascii)
+
+    def encode(self, value: bytes) -> str:
+        """
+        Encodes the input bytes. The length of the input must be a multiple of the aligned block length.
+
+        :param value: The aligned bytes to encode.
+        :return: The encoded representation of the input bytes.
+        """
+
+        return ''.join(str(encoded, 'ascii') if self._ascii else str(encoded, 'utf-32-le') for encoded in self._encode_passes(value))
+
+    def encode_to_bytes(self, value: bytes) -> bytes:
+        """
+        Encodes the input bytes into the UTF-8 bytes of their encoded representation. The length of the input must be
+        a multiple of the aligned block length.
+
+        :param value: The aligned bytes to encode.
+        :return: The UTF-8 encoded bytes of the encoded representation of the input bytes.
+        """
+
+        if self._ascii:
+            return b''.join(self._encode_passes(value))
+        return b''.join(str(encoded, 'utf-32-le').encode('utf-8') for encoded in self._encode_passes(value))
+
+    def _encode_passes(self, value: bytes) -> Iterator[bytes]:
+        pass_length = max(self._layout.block_length, _MAX_PASS_LENGTH - _MAX_PASS_LENGTH % self._layout.block_length)
+        for i in range(0, len(value), pass_length):
+            yield self._characters[self._layout.split(value[i:i + pass_length])].tobytes()
+
+
+class NumpyDecodingTable:
+
+    """
+    Vectorized decoder that converts whole buffers of encoded characters into code points, resolves the binary key of
+    every representation with a binary search over the sorted representations and packs the keys back into bytes.
+    """
+
+    def __init__(self, symbol_values: Mapping[str, int], binary_key_length: int, representation_length: int):
+        self._layout = _Layout(binary_key_length)
+        self._representation_length = representation_length
+        self._ascii = _uses_ascii(symbol_values)
+        self._base = _representation_base(symbol_values)
+
+        if isinstance(symbol_values, CompactSymbolIndex):
+            keys = self._row_keys(_character_rows(symbol_values.table, self._ascii).astype(numpy.uint64))
+            values = numpy.arange(len(symbol_values), dtype=numpy.int64)
+        else:
+            keys = numpy.array([self._representation_key(representation) for representation in symbol_values], dtype=numpy.uint64)
+            values = numpy.array(list(symbol_values.values()), dtype=numpy.int64)
+
+        # Small key spaces, such as single ASCII character representations, are indexed directly. Larger key spaces
+        # fall back to a binary search over the sorted keys.
+        self._dense_values = None
+        if self._base ** representation_length <= _MAX_DENSE_INDEX_LENGTH:
+            self._dense_values = numpy.full(self._base ** representation_length, _UNKNOWN_VALUE, dtype=numpy.int64)
+            self._dense_values[keys] = values
+        order = numpy.argsort(keys)
+        self._sorted_keys = keys[order]
+        self._sorted_values = values[order]
+
+    def _representation_key(self, representation: str) -> int:
+        key = 0
+        for character in representation:
+            key = key * self._base + ord(character)
+        return key
+
+    def _row_keys(self, rows):
+        keys = rows[:, 0]
+        for column in range(1, self._representation_length):
+            keys = keys * numpy.uint64(self._base) + rows[:, column]
+        return keys
+
+    def decode(self, encoded: str | bytes) -> bytes:
+        """
+        Decodes the input encoded string. The length of the input must be a multiple of the aligned group length and
+        the input must not contain any padding.
+
+        :param encoded: The aligned encoded string to decode, or the ASCII bytes of the encoded string when every
+            representation is made up of ASCII characters.
+        :return: The decoded bytes.
+        """
+
+        group_length = self._layout.symbols_per_block * self._representation_length
+        pass_length = max(group_length, _MAX_PASS_LENGTH - _MAX_PASS_LENGTH % group_length)
+        return b''.join(self._decode_pass(encoded[i:i + pass_length], i) for i in range(0, len(encoded), pass_length))
+
+    def _decode_pass(self, encoded: str | bytes, offset: int) -> bytes:
+        if not isinstance(encoded, str):
+            characters = numpy.frombuffer(encoded, dtype=numpy.uint8)
+            non_ascii = numpy.flatnonzero(characters >= _ASCII_LIMIT)
+            if len(non_ascii) > 0:
+                self._raise_unknown_representation(encoded, offset, int(non_ascii[0]) // self._representation_length)
+        elif not self._ascii:
+            characters = numpy.frombuffer(encoded.encode('utf-32-le'), dtype='<u4')
+        elif encoded.isascii():
+            characters = numpy.frombuffer(encoded.encode('ascii'), dtype=numpy.uint8)
+        else:
+            position = next(i for i, character in enumerate(encoded) if not character.isascii())
+            self._raise_unknown_representation(encoded, offset, position // self._representation_length)
+        keys = self._row_keys(characters.reshape(-1, self._representation_length).astype(numpy.uint64))
+
+        if self._dense_values is not None:
+            values = self._dense_values[keys]
+            unknown = numpy.flatnonzero(values == _UNKNOWN_VALUE)
+        else:
+            positions = numpy.searchsorted(self._sorted_keys, keys).clip(0, len(self._sorted_keys) - 1)
+            values = self._sorted_values[positions]
+            unknown = numpy.flatnonzero(self._sorted_keys[positions] != keys)
+
+        if len(unknown) > 0:
+            self._raise_unknown_representation(encoded, offset, int(unknown[0]))
+        return self._layout.join(values)
+
+    def _raise_unknown_representation(self, encoded: str | bytes, offset: int, index: int):
+        start = index * self._representation_length
+        raise unknown_representation_error(encoded[start:start + self._representation_length], offset + start)
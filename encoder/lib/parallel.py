@@ -0,0 +1,110 @@
+from typing import Any, Iterable, Iterator
+from collections import deque
+from functools import partial
+from itertools import islice
+import os
+
+
+DEFAULT_SEGMENT_SIZE = 1024 * 1024
+DEFAULT_BATCH_SIZE = 4096
+
+PROCESS_POOL = 'process'
+THREAD_POOL = 'thread'
+
+# The number of segments submitted to the pool, per worker, ahead of the segment currently being collected. This
+# keeps every worker busy while bounding how much of the input and output is held in memory at once.
+_SEGMENTS_IN_FLIGHT_PER_WORKER = 2
+
+_WORKER_TABLE: Any = None
+
+
+def resolve_worker_count(workers: int | None) -> int:
+    """
+    Resolves the number of worker processes to use.
+
+    :param workers: The requested number of workers or None to use one worker per CPU.
+    :return: The number of workers to use.
+    """
+
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError(f'The number of workers must be greater than 0. Instead received: [{workers}]')
+    return workers
+
+
+def _initialize_worker(table: Any):
+    global _WORKER_TABLE
+    _WORKER_TABLE = table
+
+
+def _call_worker_table(method_name: str, segment: Any) -> Any:
+    return getattr(_WORKER_TABLE, method_name)(segment)
+
+
+def _to_picklable(segment: Any) -> Any:
+    return bytes(segment) if isinstance(segment, memoryview) else segment
+
+
+def map_segments(table: Any, method_name: str, segments: Iterable, workers: int, pool: str = PROCESS_POOL) -> Iterator:
+    """
+    Calls the named method of the table for every segment and yields the results in the same order as the segments.
+    When more than one worker is requested the segments are processed in a pool of worker processes, or threads. The
+    table is shipped to each worker process once, when the worker starts, rather than with every segment.
+
+    :param table: The compiled table, such as an Encoder or Decoder, whose method will be called.
+    :param method_name: The name of the method to call with each segment.
+    :param segments: The segments to process.
+    :param workers: The number of workers to use.
+    :param pool: The kind of pool used when more than one worker is requested. Either PROCESS_POOL or THREAD_POOL.
+    :return: An iterator over the result of each call in the order of the segments.
+    """
+
+    if pool not in (PROCESS_POOL, THREAD_POOL):
+        raise ValueError(f'The pool must be one of [{PROCESS_POOL}, {THREAD_POOL}]. Instead received: [{pool}]')
+
+    if workers <= 1:
+        yield from map(getattr(table, method_name), segments)
+        return
+
+    # The pools are imported on first use as importing them noticeably slows down starting a single process run.
+    if pool == THREAD_POOL:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=workers)
+        call = getattr(table, method_name)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=(table,))
+        call = partial(_call_worker_table, method_name)
+
+    with executor:
+        in_flight = deque()
+        for segment in segments:
+            in_flight.append(executor.submit(call, _to_picklable(segment)))
+            if len(in_flight) >= workers * _SEGMENTS_IN_FLIGHT_PER_WORKER:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def map_batches(table: Any, method_name: str, values: Iterable, batch_size: int, workers: int, pool: str = PROCESS_POOL) -> Iterator:
+    """
+    Groups the values into batches, calls the named method of the table with each batch and yields the individual
+    results of every batch in the same order as the values. The method must return one result per value.
+
+    :param table: The compiled table, such as an Encoder or Decoder, whose method will be called.
+    :param method_name: The name of the method to call with each batch of values.
+    :param values: The values to process.
+    :param batch_size: The maximum number of values in each batch.
+    :param workers: The number of workers to use.
+    :param pool: The kind of pool used when more than one worker is requested. Either PROCESS_POOL or THREAD_POOL.
+    :return: An iterator over the result for each value in the order of the values.
+    """
+
+    if batch_size <= 0:
+        raise ValueError(f'The batch size must be greater than 0. Instead received: [{batch_size}]')
+
+    remaining = iter(values)
+    batches = iter(lambda: list(islice(remaining, batch_size)), [])
+    for results in map_segments(table, method_name, batches, workers, pool):
+        yield from results
@@ -0,0 +1,137 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+
+# Called with the stage name, the elapsed seconds, the input and output lengths and the number of symbols processed
+# every time a stage is recorded.
+StageCallback = Callable[[str, float, int, int, int], None]
+
+
+class StageStats:
+
+    """
+    The totals recorded for a single stage. The input and output lengths are counted in bytes for binary values and
+    in characters for encoded strings.
+    """
+
+    __slots__ = ('calls', 'seconds', 'bytes_in', 'bytes_out', 'symbols')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.symbols = 0
+
+
+class CodecStats:
+
+    """
+    Collects the time spent, the number of calls, the input and output lengths and the number of symbols processed by
+    each stage of an Encoder or Decoder. Stages are kept in the order they were first recorded. An optional callback
+    is notified of every recorded stage, for example to forward the timings to a metrics system.
+    """
+
+    def __init__(self, callback: StageCallback | None = None):
+        self._callback = callback
+        self._stages: Dict[str, StageStats] = {}
+        self._lock = Lock()
+
+    @property
+    def stages(self) -> Dict[str, StageStats]:
+        return self._stages
+
+    def record(self, stage: str, seconds: float, bytes_in: int = 0, bytes_out: int = 0, symbols: int = 0):
+        """
+        Adds a single call of a stage to its totals.
+
+        :param stage: The name of the stage.
+        :param seconds: The time, in seconds, the call took.
+        :param bytes_in: The length of the input to the call.
+        :param bytes_out: The length of the output of the call.
+        :param symbols: The number of representations encoded or decoded by the call.
+        """
+
+        with self._lock:
+            totals = self._stages.get(stage)
+            if totals is None:
+                totals = self._stages[stage] = StageStats()
+            totals.calls = totals.calls + 1
+            totals.seconds = totals.seconds + seconds
+            totals.bytes_in = totals.bytes_in + bytes_in
+            totals.bytes_out = totals.bytes_out + bytes_out
+            totals.symbols = totals.symbols + symbols
+        if self._callback is not None:
+            self._callback(stage, seconds, bytes_in, bytes_out, symbols)
+
+    def iter_stage(self, stage: str, values: Iterable) -> Iterator:
+        """
+        Records the time taken to produce each value of an iterable, such as the chunks read from a file.
+
+        :param stage: The name of the stage.
+        :param values: The values to time.
+        :return: An iterator over the values.
+        """
+
+        iterator = iter(values)
+        while True:
+            start = perf_counter()
+            try:
+                value = next(iterator)
+            except StopIteration:
+                return
+            self.record(stage, perf_counter() - start, len(value), len(value))
+            yield value
+
+    def reset(self):
+        """Removes every recorded stage."""
+
+        with self._lock:
+            self._stages.clear()
+
+    def format(self) -> str:
+        """
+        Formats the recorded stages as a table with one row per stage and a final row with the total time.
+
+        :return: The formatted breakdown.
+        """
+
+        total_seconds = sum(totals.seconds for totals in self._stages.values()) or 1.0
+        rows = [('stage', 'calls', 'ms', '%', 'in', 'out', 'symbols')]
+        for stage, totals in self._stages.items():
+            rows.append((stage, str(totals.calls), f'{totals.seconds * 1000:.3f}', f'{totals.seconds / total_seconds * 100:.1f}',
+                         str(totals.bytes_in), str(totals.bytes_out), str(totals.symbols)))
+        rows.append(('total', '', f'{sum(totals.seconds for totals in self._stages.values()) * 1000:.3f}', '', '', '', ''))
+
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        return '\n'.join('  '.join(value.ljust(width) if column == 0 else value.rjust(width)
+                                   for column, (value, width) in enumerate(zip(row, widths))).rstrip() for row in rows)
+
+
+def profiled_stage(stage: str, measure: Callable[[Any, Any, Any], Tuple[int, int, int]]):
+    """
+    Decorates a method of an Encoder or Decoder that takes a single value so each call is recorded as the given stage
+    whenever profiling has been enabled on the table. When profiling is disabled the only cost is a single attribute
+    check per call, and the methods decorated are only called once per chunk or batch rather than per symbol.
+
+    :param stage: The name of the stage.
+    :param measure: Called with the table, the input and the output of the method to work out the input length,
+        output length and number of symbols of the call. Only called while profiling.
+    :return: The decorator.
+    """
+
+    def decorate(method: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+        @wraps(method)
+        def profiled(table: Any, value: Any) -> Any:
+            stats = table._stats
+            if stats is None:
+                return method(table, value)
+            start = perf_counter()
+            result = method(table, value)
+            elapsed = perf_counter() - start
+            stats.record(stage, elapsed, *measure(table, value, result))
+            return result
+        return profiled
+    return decorate
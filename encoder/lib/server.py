@@ -0,0 +1,178 @@
+from typing import Any, Callable, Collection, Dict, Iterator, Tuple, Type
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from urllib.parse import parse_qs, urlsplit
+import codecs
+
+from .encode import Encoder
+from .decode import Decoder
+from .stream import DEFAULT_CHUNK_SIZE
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Sent with every response so clients can tell the server apart from any other service listening on the same port.
+SERVER_HEADER = 'X-Encoder-Server'
+
+_HEALTH_PATH = '/health'
+_ENCODE_PATH = '/encode'
+_DECODE_PATH = '/decode'
+
+_TEXT_CONTENT_TYPE = 'text/plain; charset=utf-8'
+_BINARY_CONTENT_TYPE = 'application/octet-stream'
+
+
+class EncoderServer(ThreadingHTTPServer):
+
+    """
+    A local HTTP server that keeps the compiled Encoder and Decoder of every dictionary in memory so requests only
+    pay for encoding or decoding. Each request is handled on its own thread.
+
+    Request bodies are streamed through the codec a chunk at a time and the result is sent back using chunked
+    transfer encoding as it is produced:
+
+    - POST /encode?dictionary=NAME[&wrap=N] encodes the request body and responds with the UTF-8 encoded text.
+    - POST /decode?dictionary=NAME decodes the UTF-8 encoded text in the request body and responds with the bytes.
+    - GET /health responds with the names of the available dictionaries.
+
+    Invalid requests, and input that cannot be decoded before the response has started, get a 400 response with the
+    error as the body. An error after the response has started closes the connection before the final chunk.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], load_table: Callable[[Type[Any], str], Any], dictionaries: Collection[str]):
+        """
+        :param address: The host and port to listen on.
+        :param load_table: Called with Encoder or Decoder and a dictionary name to build the table of a dictionary.
+        :param dictionaries: The names of the dictionaries that can be requested. Every table is built up front.
+        """
+
+        super().__init__(address, _RequestHandler)
+        self._load_table = load_table
+        self._dictionaries = frozenset(dictionaries)
+        self._tables: Dict[Tuple[Type[Any], str], Any] = {}
+        self._lock = Lock()
+        for dictionary in sorted(self._dictionaries):
+            self.get_table(Encoder, dictionary)
+            self.get_table(Decoder, dictionary)
+
+    @property
+    def dictionaries(self) -> Collection[str]:
+        return self._dictionaries
+
+    def get_table(self, table_type: Type[Any], dictionary: str) -> Any:
+        """
+        Gets the already built table of a dictionary, building it the first time it is requested.
+
+        :param table_type: Either Encoder or Decoder.
+        :param dictionary: The name of the dictionary.
+        :return: The table.
+        """
+
+        if dictionary not in self._dictionaries:
+            raise LookupError(f'[{dictionary}] is not one of the available dictionaries.')
+        key = (table_type, dictionary)
+        table = self._tables.get(key)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(key)
+                if table is None:
+                    table = self._tables[key] = self._load_table(table_type, dictionary)
+        return table
+
+
+def _read_body(reader: Any, length: int, chunk_size: int) -> Iterator[bytes]:
+    while length > 0:
+        chunk = reader.read(min(length, chunk_size))
+        if not chunk:
+            raise ValueError('The request body ended before the length given by its Content-Length header.')
+        length = length - len(chunk)
+        yield chunk
+
+
+def _iter_text(chunks: Iterator[bytes]) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'py-encoder'
+    # The headers and each chunk are written separately so Nagle's algorithm would hold back every small response.
+    disable_nagle_algorithm = True
+    server: EncoderServer
+
+    def log_message(self, format: str, *args: Any):
+        # Logging every request to stderr would cost more than handling a small request.
+        pass
+
+    def do_GET(self):
+        if urlsplit(self.path).path != _HEALTH_PATH:
+            return self._send_error(404, f'Unknown path [{self.path}].')
+        self._send_body(200, '\n'.join(sorted(self.server.dictionaries)).encode('utf-8'))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        if url.path not in (_ENCODE_PATH, _DECODE_PATH):
+            return self._send_error(404, f'Unknown path [{url.path}].')
+        if 'Content-Length' not in self.headers:
+            return self._send_error(411, 'The request must have a Content-Length header.')
+
+        try:
+            if url.path == _ENCODE_PATH:
+                wrap = int(query['wrap']) if 'wrap' in query else None
+                encoder = self.server.get_table(Encoder, query.get('dictionary', ''))
+                chunks = _read_body(self.rfile, int(self.headers['Content-Length']), DEFAULT_CHUNK_SIZE)
+                results = (encoded.encode('utf-8') for encoded in encoder.iter_encode(chunks, wrap=wrap))
+            else:
+                decoder = self.server.get_table(Decoder, query.get('dictionary', ''))
+                chunks = _read_body(self.rfile, int(self.headers['Content-Length']), DEFAULT_CHUNK_SIZE)
+                results = decoder.iter_decode(chunks if decoder.accepts_bytes else _iter_text(chunks))
+            # The first result is produced before the response starts so most errors can still be reported.
+            first = next(results, b'')
+        except LookupError as error:
+            return self._send_error(404, str(error))
+        except ValueError as error:
+            return self._send_error(400, str(error))
+
+        self._send_chunks(_TEXT_CONTENT_TYPE if url.path == _ENCODE_PATH else _BINARY_CONTENT_TYPE, first, results)
+
+    def _send_chunks(self, content_type: str, first: bytes, results: Iterator[bytes]):
+        self.send_response(200)
+        self.send_header(SERVER_HEADER, '1')
+        self.send_header('Content-Type', content_type)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            self._write_chunk(first)
+            for result in results:
+                self._write_chunk(result)
+        except ValueError:
+            # The status has already been sent so the connection is closed without the final chunk to tell the
+            # client the response is incomplete.
+            self.close_connection = True
+            return
+        self.wfile.write(b'0\r\n\r\n')
+
+    def _write_chunk(self, chunk: bytes):
+        if chunk:
+            self.wfile.write(b'%x\r\n%b\r\n' % (len(chunk), chunk))
+
+    def _send_error(self, status: int, message: str):
+        # Any unread request body would otherwise be read as the next request on the connection.
+        self.close_connection = True
+        self._send_body(status, message.encode('utf-8'))
+
+    def _send_body(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header(SERVER_HEADER, '1')
+        self.send_header('Content-Type', _TEXT_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,114 @@
+from typing import Callable, NamedTuple, Sequence
+import binascii
+
+
+class _NativeCodec(NamedTuple):
+    # The characters the C implementation encodes each binary key to, in order of the integer value of the key.
+    alphabet: bytes
+    encode: Callable[[bytes], bytes]
+    decode: Callable[[bytes], bytes]
+    # Every aligned group of this many encoded characters decodes to bytes_per_group bytes.
+    characters_per_group: int
+    bytes_per_group: int
+
+
+def _encode_base64(value: bytes) -> bytes:
+    return binascii.b2a_base64(value, newline=False)
+
+
+# Only the binary key lengths with a C implementation in binascii are dispatched. Base32 is implemented in Python by
+# the base64 module and is slower than the generic engines.
+_NATIVE_CODECS = {
+    6: _NativeCodec(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/', _encode_base64, binascii.a2b_base64, 4, 3),
+    4: _NativeCodec(b'0123456789abcdef', binascii.b2a_hex, binascii.a2b_hex, 2, 1),
+}
+
+# Every byte that is not a character of the alphabet is translated to this byte, which none of the C implementations
+# accept, so unknown representations are never mistaken for a character of the native alphabet.
+_INVALID_BYTE = ord('!')
+
+
+class StdlibTable:
+
+    """
+    Encodes and decodes the aligned part of an input with the C implementations in binascii when every representation
+    of a dictionary is a single ASCII character and the binary keys are 6 bits, as in base64, or 4 bits, as in hex.
+    Alphabets other than the native alphabets of binascii, such as the URL safe base64 alphabet or the letters A to P
+    used for 4 bit keys, are supported by translating the encoded bytes with bytes.translate.
+
+    Padding is never part of an aligned input so it is left to the generic engines, which handle the trailing bytes.
+    """
+
+    def __init__(self, codec: _NativeCodec, alphabet: bytes):
+        self._codec = codec
+        self._encode_translation = None if alphabet == codec.alphabet else bytes.maketrans(codec.alphabet, alphabet)
+        # Decoding always translates, even for the native alphabet, as binascii.a2b_hex also accepts the uppercase
+        # hex digits which are not part of a lowercase hex dictionary.
+        decode_translation = bytearray([_INVALID_BYTE]) * 256
+        for native_character, character in zip(codec.alphabet, alphabet):
+            decode_translation[character] = native_character
+        self._decode_translation = bytes(decode_translation)
+
+    def encode(self, value: bytes) -> str:
+        """
+        Encodes the input bytes. The length of the input must be a multiple of the aligned block length.
+
+        :param value: The aligned bytes to encode.
+        :return: The encoded representation of the input bytes.
+        """
+
+        return str(self.encode_to_bytes(value), 'ascii')
+
+    def encode_to_bytes(self, value: bytes) -> bytes:
+        """
+        Encodes the input bytes into the ASCII bytes of their encoded representation. The length of the input must be
+        a multiple of the aligned block length.
+
+        :param value: The aligned bytes to encode.
+        :return: The ASCII encoded bytes of the encoded representation of the input bytes.
+        """
+
+        encoded = self._codec.encode(value)
+        return encoded if self._encode_translation is None else encoded.translate(self._encode_translation)
+
+    def decode(self, encoded: str | bytes) -> bytes:
+        """
+        Decodes the input encoded string. The length of the input must be a multiple of the aligned group length and
+        the input must not contain any padding.
+
+        :param encoded: The aligned encoded string to decode, or the ASCII bytes of the encoded string.
+        :return: The decoded bytes.
+        :raises ValueError: If the input contains a character that is not part of the alphabet. The error does not
+            say where, so the input should be decoded again with a generic engine to find the offending character.
+        """
+
+        if isinstance(encoded, str):
+            if not encoded.isascii():
+                raise ValueError('The encoded value contains characters that are not part of the alphabet.')
+            encoded = encoded.encode('ascii')
+        elif not isinstance(encoded, bytes):
+            encoded = bytes(encoded)
+        encoded = encoded.translate(self._decode_translation)
+
+        decoded = self._codec.decode(encoded)
+        # binascii.a2b_base64 skips characters outside of the alphabet rather than rejecting them.
+        if len(decoded) != len(encoded) // self._codec.characters_per_group * self._codec.bytes_per_group:
+            raise ValueError('The encoded value contains characters that are not part of the alphabet.')
+        return decoded
+
+
+def build_stdlib_table(binary_key_length: int, representations: Sequence[str]) -> StdlibTable | None:
+    """
+    Recognises dictionaries that can be encoded and decoded with the C implementations in binascii.
+
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param representations: The encoded representations indexed by the integer value of their binary key.
+    :return: The table that dispatches to binascii, or None if the dictionary must use the generic engines.
+    """
+
+    codec = _NATIVE_CODECS.get(binary_key_length)
+    if codec is None or len(representations) != len(codec.alphabet):
+        return None
+    if not all(len(representation) == 1 and representation.isascii() for representation in representations):
+        return None
+    return StdlibTable(codec, ''.join(representations).encode('ascii'))
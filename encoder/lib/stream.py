@@ -0,0 +1,81 @@
+from typing import Any, Iterable, Iterator
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def aligned_chunk_size(chunk_size: int, alignment: int) -> int:
+    """
+    Rounds the chunk size down to the nearest multiple of the alignment without going below the alignment itself.
+
+    :param chunk_size: The requested chunk size.
+    :param alignment: The value the chunk size must be a multiple of.
+    :return: The largest multiple of the alignment that is no greater than chunk_size, or the alignment if chunk_size
+        is smaller than the alignment.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError(f'The chunk size must be greater than 0. Instead received: [{chunk_size}]')
+    return max(alignment, chunk_size - chunk_size % alignment)
+
+
+def iter_chunks(source: Any | Iterable, chunk_size: int) -> Iterator:
+    """
+    Iterates over the chunks of a file like object or an iterable of chunks. If the source has a read method
+    then it will be read from chunk_size at a time until it returns an empty value. Otherwise the source is
+    assumed to already be an iterable of chunks and each chunk will be yielded as is.
+
+    :param source: A readable file like object or an iterable of chunks.
+    :param chunk_size: The number of bytes, or characters, to read per chunk from a readable source.
+    :return: An iterator over the non-empty chunks of the source.
+    """
+
+    if hasattr(source, 'read'):
+        read = source.read
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+class AlignedChunkIterator:
+
+    """
+    Utility class that regroups chunks of bytes, or characters, so every yielded chunk has a length that is a
+    multiple of the alignment. Any trailing values that do not fill a complete aligned chunk are held back and,
+    once iteration has finished, can be read from the remainder property.
+
+    The hold_back_length constructor argument can be used to always keep at least that many trailing values pending
+    so they can be processed separately once the end of the input has been reached.
+    """
+
+    def __init__(self, chunks: Iterable, alignment: int, hold_back_length: int = 0):
+        self._chunks = chunks
+        self._alignment = alignment
+        self._hold_back_length = hold_back_length
+        self._remainder = None
+
+    @property
+    def remainder(self):
+        return self._remainder
+
+    def __iter__(self):
+        pending = None
+        for chunk in self._chunks:
+            if not pending:
+                pending = chunk
+            elif isinstance(pending, memoryview):
+                pending = bytes(pending) + chunk
+            else:
+                pending = pending + chunk
+            aligned_length = len(pending) - self._hold_back_length
+            aligned_length = aligned_length - aligned_length % self._alignment
+            if aligned_length > 0:
+                yield pending[:aligned_length]
+                pending = pending[aligned_length:]
+        self._remainder = pending
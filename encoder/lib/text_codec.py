@@ -0,0 +1,250 @@
+from typing import Dict, Tuple
+import codecs
+
+from .codec_cache import get_codec
+from .encode import Encoder
+from .decode import Decoder
+
+
+_TEXT_ENCODING = 'utf-8'
+
+_REGISTERED_CODECS: Dict[str, codecs.CodecInfo] = {}
+
+
+def _normalize_codec_name(name: str) -> str:
+    return name.lower().replace('-', '_').replace(' ', '_')
+
+
+def _pack_state(buffered: bytes) -> int:
+    # A leading marker byte keeps leading zero bytes when the buffered bytes are packed into an integer.
+    return int.from_bytes(b'\x01' + buffered, 'big') if buffered else 0
+
+
+def _unpack_state(state: int) -> bytes:
+    return state.to_bytes((state.bit_length() + 7) // 8, 'big')[1:] if state else b''
+
+
+class _IncrementalEncoder(codecs.IncrementalEncoder):
+
+    """
+    Encodes text, as its UTF-8 bytes, a piece at a time. Bytes that do not yet fill a complete aligned block are
+    carried over to the next call and only encoded, and padded, once final is True.
+    """
+
+    encoder: Encoder
+
+    def __init__(self, errors: str = 'strict'):
+        super().__init__(errors)
+        self._text_encoder = codecs.getincrementalencoder(_TEXT_ENCODING)(errors)
+        self._pending = b''
+
+    def encode(self, input: str, final: bool = False) -> bytes:
+        data = self._pending + self._text_encoder.encode(input, final)
+        aligned_length = len(data) if final else len(data) - len(data) % self.encoder._block_length
+        self._pending = data[aligned_length:]
+        return self.encoder.encode_to_bytes(data[:aligned_length])
+
+    def reset(self):
+        self._text_encoder.reset()
+        self._pending = b''
+
+    def getstate(self) -> int:
+        return _pack_state(self._pending)
+
+    def setstate(self, state: int):
+        self._text_encoder.reset()
+        self._pending = _unpack_state(state)
+
+
+class _IncrementalDecoder(codecs.IncrementalDecoder):
+
+    """
+    Decodes encoded bytes back into text a piece at a time. Representations that do not yet fill a complete aligned
+    group, along with the trailing characters that may contain padding, are carried over to the next call and only
+    decoded once final is True. The decoded bytes are read as UTF-8 text and any partial character is also carried
+    over to the next call.
+    """
+
+    decoder: Decoder
+
+    def __init__(self, errors: str = 'strict'):
+        super().__init__(errors)
+        self._input_decoder = codecs.getincrementaldecoder(_TEXT_ENCODING)()
+        self._text_decoder = codecs.getincrementaldecoder(_TEXT_ENCODING)(errors)
+        self._pending = ''
+
+    def decode(self, input: bytes, final: bool = False) -> str:
+        encoded = self._pending + self.decoder._prepare_chunk(self._input_decoder.decode(input, final))
+        if final:
+            decoded = self.decoder.decode(encoded)
+            self._pending = ''
+        else:
+            aligned_length = max(0, len(encoded) - self.decoder._hold_back_length)
+            aligned_length = aligned_length - aligned_length % self.decoder._group_length
+            decoded = self.decoder._decode_aligned(encoded[:aligned_length]) if aligned_length > 0 else b''
+            self._pending = encoded[aligned_length:]
+        return self._text_decoder.decode(decoded, final)
+
+    def reset(self):
+        self._input_decoder.reset()
+        self._text_decoder.reset()
+        self._pending = ''
+
+    def getstate(self) -> Tuple[bytes, int]:
+        buffered_input, _ = self._input_decoder.getstate()
+        buffered_text, _ = self._text_decoder.getstate()
+        return self._pending.encode(_TEXT_ENCODING) + buffered_input, _pack_state(buffered_text)
+
+    def setstate(self, state: Tuple[bytes, int]):
+        buffered_input, flags = state
+        self.reset()
+        self._input_decoder.setstate((buffered_input, 0))
+        self._text_decoder.setstate((_unpack_state(flags), 0))
+
+
+class _StreamWriter(codecs.StreamWriter):
+
+    """
+    Writes text to a binary stream through an incremental encoder. The final, padded, block is only written by
+    reset, or when the writer is used as a context manager, as the writer cannot otherwise know the text has ended.
+    """
+
+    incremental_encoder: type
+
+    def __init__(self, stream, errors: str = 'strict'):
+        super().__init__(stream, errors)
+        self._encoder = self.incremental_encoder(errors)
+
+    def write(self, object: str):
+        self.stream.write(self._encoder.encode(object))
+
+    def reset(self):
+        self.stream.write(self._encoder.encode('', final=True))
+
+    def seek(self, offset: int, whence: int = 0):
+        self._encoder.reset()
+        self.stream.seek(offset, whence)
+
+    def __exit__(self, type, value, tb):
+        if type is None:
+            self.reset()
+        self.stream.close()
+
+
+class _StreamReader(codecs.StreamReader):
+
+    """
+    Reads text from a binary stream through an incremental decoder so the carried over representations are decoded
+    once the end of the stream has been reached.
+    """
+
+    incremental_decoder: type
+
+    def __init__(self, stream, errors: str = 'strict'):
+        super().__init__(stream, errors)
+        self._decoder = self.incremental_decoder(errors)
+
+    def read(self, size: int = -1, chars: int = -1, firstline: bool = False) -> str:
+        if self.linebuffer:
+            self.charbuffer = ''.join(self.linebuffer)
+            self.linebuffer = None
+
+        if chars < 0:
+            chars = size
+
+        while chars < 0 or len(self.charbuffer) < chars:
+            data = self.stream.read() if size < 0 else self.stream.read(size)
+            self.charbuffer += self._decoder.decode(data, final=not data)
+            if not data:
+                break
+
+        if chars < 0:
+            result, self.charbuffer = self.charbuffer, ''
+        else:
+            result, self.charbuffer = self.charbuffer[:chars], self.charbuffer[chars:]
+        return result
+
+    def reset(self):
+        super().reset()
+        self._decoder.reset()
+
+
+def _search_codec(name: str) -> codecs.CodecInfo | None:
+    return _REGISTERED_CODECS.get(_normalize_codec_name(name))
+
+
+def _refresh_search_function():
+    # The codecs module caches the result of every lookup. Unregistering the search function clears that cache so a
+    # name that has been registered again, or unregistered, is looked up again.
+    codecs.unregister(_search_codec)
+    codecs.register(_search_codec)
+
+
+def build_codec_info(name: str, encoding_dictionary: Dict[str, str] | None = None,
+                     padding_character: str | None = None) -> codecs.CodecInfo:
+    """
+    Builds the codecs module description of a text encoding that encodes text, as its UTF-8 bytes, into the encoded
+    representation of those bytes and decodes the representation back into text. If no dictionary or padding
+    character have been provided then this will fall back to the default base64 dictionary and padding character.
+
+    :param name: The name of the codec.
+    :param encoding_dictionary: The dictionary containing the binary keys and encoded character representations.
+    :param padding_character: The padding character.
+    :return: The codec information including the incremental and stream encoders and decoders.
+    """
+
+    encoder = get_codec(Encoder, encoding_dictionary, padding_character)
+    decoder = get_codec(Decoder, encoding_dictionary, padding_character)
+
+    def encode(input: str, errors: str = 'strict') -> Tuple[bytes, int]:
+        return encoder.encode_to_bytes(input.encode(_TEXT_ENCODING, errors)), len(input)
+
+    def decode(input: bytes, errors: str = 'strict') -> Tuple[str, int]:
+        encoded = input if decoder.accepts_bytes else str(input, _TEXT_ENCODING)
+        return str(decoder.decode(encoded), _TEXT_ENCODING, errors), len(input)
+
+    incremental_encoder = type('IncrementalEncoder', (_IncrementalEncoder,), {'encoder': encoder})
+    incremental_decoder = type('IncrementalDecoder', (_IncrementalDecoder,), {'decoder': decoder})
+    return codecs.CodecInfo(
+        name=name,
+        encode=encode,
+        decode=decode,
+        incrementalencoder=incremental_encoder,
+        incrementaldecoder=incremental_decoder,
+        streamwriter=type('StreamWriter', (_StreamWriter,), {'incremental_encoder': incremental_encoder}),
+        streamreader=type('StreamReader', (_StreamReader,), {'incremental_decoder': incremental_decoder}),
+        _is_text_encoding=True)
+
+
+def register_codec(name: str, encoding_dictionary: Dict[str, str] | None = None,
+                   padding_character: str | None = None) -> codecs.CodecInfo:
+    """
+    Registers an encoding dictionary with the codecs module under the given name so it can be used anywhere a text
+    encoding is accepted, such as codecs.open, codecs.iterencode or io.TextIOWrapper. Text is encoded as its UTF-8
+    bytes. Registering a name again replaces the previously registered dictionary.
+
+    The codecs module never tells the encoder of an io.TextIOWrapper that the text has ended so when writing, rather
+    than reading, through one the final, padded, block is not written. Write through the codec's StreamWriter, or
+    an incremental encoder called with final=True, instead.
+
+    :param name: The name of the codec. Names are case insensitive and hyphens and spaces are treated as underscores.
+    :param encoding_dictionary: The dictionary containing the binary keys and encoded character representations.
+    :param padding_character: The padding character.
+    :return: The codec information that was registered.
+    """
+
+    codec_info = build_codec_info(name, encoding_dictionary, padding_character)
+    _REGISTERED_CODECS[_normalize_codec_name(name)] = codec_info
+    _refresh_search_function()
+    return codec_info
+
+
+def unregister_codec(name: str):
+    """
+    Removes a codec previously registered with register_codec.
+
+    :param name: The name the codec was registered under.
+    """
+
+    _REGISTERED_CODECS.pop(_normalize_codec_name(name), None)
+    _refresh_search_function()
@@ -0,0 +1,76 @@
+from typing import Any, Dict, List, Sequence
+from itertools import product
+
+
+_BITS_IN_BYTE = 8
+_MAX_WIDE_KEY_LENGTH = 16
+
+# A rough estimate of the bytes used by each table entry for the list or dict slot and the str and int objects.
+_ESTIMATED_ENTRY_SIZE = 120
+
+DEFAULT_WIDE_TABLE_MEMORY_BUDGET = 16 * 1024 * 1024
+
+
+def _estimated_table_size(binary_key_length: int, representation_length: int, symbol_count: int) -> int:
+    return (1 << (binary_key_length * symbol_count)) * (_ESTIMATED_ENTRY_SIZE + representation_length * symbol_count)
+
+
+def wide_symbol_count(binary_key_length: int,
+                      representation_length: int,
+                      memory_budget: int = DEFAULT_WIDE_TABLE_MEMORY_BUDGET) -> int:
+    """
+    Determines how many binary keys should be combined into a single lookup of a wide table. Keys that evenly divide
+    a byte are combined so each lookup covers exactly one byte, otherwise as many keys as fit into 16 bits are
+    combined. The count is then reduced until the estimated size of the table fits within the memory budget.
+
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param representation_length: The number of characters in each encoded representation.
+    :param memory_budget: The maximum estimated number of bytes a single wide table may use.
+    :return: The number of binary keys per wide lookup. A value of 1 means a wide table should not be used.
+    """
+
+    if _BITS_IN_BYTE % binary_key_length == 0:
+        symbol_count = _BITS_IN_BYTE // binary_key_length
+    else:
+        symbol_count = _MAX_WIDE_KEY_LENGTH // binary_key_length
+
+    while symbol_count > 1 and _estimated_table_size(binary_key_length, representation_length, symbol_count) > memory_budget:
+        symbol_count = symbol_count - 1
+    return max(symbol_count, 1)
+
+
+def build_wide_representations(representations: Sequence[str | bytes], symbol_count: int) -> List[Any]:
+    """
+    Builds a table containing the concatenated representations of every combination of symbol_count binary keys
+    indexed by the integer value of the concatenated binary keys.
+
+    :param representations: The encoded representations, as either str or bytes, indexed by the integer value of
+        their binary key.
+    :param symbol_count: The number of binary keys to combine into each entry.
+    :return: The concatenated representations indexed by the integer value of their concatenated binary keys.
+    """
+
+    empty = representations[0][:0]
+    return [empty.join(combination) for combination in product(representations, repeat=symbol_count)]
+
+
+def build_wide_symbol_values(symbol_values: Dict[Any, int], binary_key_length: int, symbol_count: int) -> Dict[Any, int]:
+    """
+    Builds a reverse index mapping the concatenated representations of every combination of symbol_count binary keys
+    to the integer value of the concatenated binary keys.
+
+    :param symbol_values: The integer value of the binary key of each representation keyed by the representation as
+        either str or bytes.
+    :param binary_key_length: The length, in bits, of each binary key.
+    :param symbol_count: The number of representations to combine into each entry.
+    :return: The integer value of the concatenated binary keys keyed by the concatenated representations.
+    """
+
+    empty = next(iter(symbol_values))[:0]
+    wide_symbol_values: Dict[Any, int] = {}
+    for combination in product(symbol_values.items(), repeat=symbol_count):
+        value = 0
+        for _, symbol_value in combination:
+            value = value << binary_key_length | symbol_value
+        wide_symbol_values[empty.join(representation for representation, _ in combination)] = value
+    return wide_symbol_values
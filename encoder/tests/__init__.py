@@ -0,0 +1,7 @@
+import os
+
+from encoder.lib.engines import ENGINE_CACHE_VARIABLE
+
+
+# Engines tuned while running the tests are kept in memory rather than saved to the cache file of the user.
+os.environ.setdefault(ENGINE_CACHE_VARIABLE, '')
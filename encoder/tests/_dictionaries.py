@@ -0,0 +1,18 @@
+from typing import Dict, Iterator, Tuple
+from pathlib import Path
+
+import yaml
+
+
+_DICTIONARY_FOLDER = Path(__file__).parent.parent.parent.joinpath('dictionaries')
+
+
+def read_dictionary(dictionary_file: Path) -> Tuple[Dict[str, str], str]:
+    with open(dictionary_file, 'r') as file:
+        contents = yaml.safe_load(file)
+        return contents['mappings'], contents['padding']
+
+
+def shipped_dictionaries() -> Iterator[Tuple[str, Dict[str, str], str]]:
+    for dictionary_file in sorted(_DICTIONARY_FOLDER.glob('*.yml')):
+        yield dictionary_file.stem, *read_dictionary(dictionary_file)
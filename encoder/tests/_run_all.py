@@ -1,9 +1,28 @@
 import unittest
 
 
+from .batch_test import BatchTest
+from .benchmark_test import BenchmarkTest
+from .bit_packing_test import BitPackingTest
+from .cli_forwarding_test import CliForwardingTest
+from .codec_cache_test import CodecCacheTest
+from .compact_table_test import CompactTableTest
+from .compiled_dictionary_test import CompiledDictionaryTest
+from .decode_range_test import DecodeRangeTest
 from .encode_decode_test import EncodeDecodeTest
 from .encoding_definition_table_test import EncodingDefinitionTableTest
+from .engines_test import EnginesTest
 from .generator_test import generate_encoding_dictionary
+from .mapped_file_test import MappedFileTest
+from .numpy_engine_test import NumpyEngineTest
+from .parallel_test import ParallelTest
+from .profiling_test import ProfilingTest
+from .server_test import ServerTest
+from .startup_test import StartupTest
+from .stdlib_engine_test import StdlibEngineTest
+from .stream_test import StreamTest
+from .text_codec_test import TextCodecTest
+from .wide_table_test import WideTableTest
 
 
 if __name__ == '__main__':
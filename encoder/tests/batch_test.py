@@ -0,0 +1,65 @@
+import os
+import unittest
+
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.parallel import THREAD_POOL
+
+from ._dictionaries import shipped_dictionaries
+
+
+class BatchTest(unittest.TestCase):
+
+    def test_batches_match_single_values(self):
+        values = [os.urandom(length % 40) for length in range(200)] + [os.urandom(1000)]
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            with self.subTest(dictionary=name):
+                encoded = encoder.encode_many(values, batch_size=16)
+                self.assertEqual([encoder.encode_bytes(value) for value in values], encoded)
+                self.assertEqual(values, decoder.decode_many(encoded, batch_size=16))
+
+    def test_strings_and_bytes_records(self):
+        encoder = Encoder({'0': 'A', '1': 'B'}, '=')
+        decoder = Decoder({'0': 'A', '1': 'B'}, '=')
+
+        encoded = encoder.encode_many(['id-1', b'id-2'])
+
+        self.assertEqual([encoder.encode_string('id-1'), encoder.encode_bytes(b'id-2')], encoded)
+        self.assertEqual([b'id-1', b'id-2'], decoder.decode_many([encoded[0], memoryview(encoded[1].encode('ascii'))]))
+
+    def test_batches_in_pools(self):
+        mappings, padding = next(shipped_dictionaries())[1:]
+        encoder = Encoder(mappings, padding)
+        decoder = Decoder(mappings, padding)
+        values = [os.urandom(length % 30) for length in range(500)]
+        expected = [encoder.encode_bytes(value) for value in values]
+
+        for pool in ('process', THREAD_POOL):
+            with self.subTest(pool=pool):
+                encoded = encoder.encode_many(iter(values), workers=2, batch_size=64, pool=pool, lazy=True)
+                self.assertNotIsInstance(encoded, list)
+                self.assertEqual(expected, list(encoded))
+                self.assertEqual(values, decoder.decode_many(expected, workers=2, batch_size=64, pool=pool))
+
+    def test_malformed_records_are_rejected(self):
+        decoder = Decoder({'00': 'A', '01': 'B', '10': 'C', '11': 'D'}, '=')
+
+        for encoded in ('ABCD', 'ABCX', 'ABXD'):
+            with self.subTest(encoded=encoded):
+                if 'X' in encoded:
+                    with self.assertRaisesRegex(Exception, r'representation: \[X\]'):
+                        decoder.decode_many([encoded])
+                else:
+                    self.assertEqual([b'\x1b'], decoder.decode_many([encoded]))
+        with self.assertRaises(ValueError):
+            decoder.decode_many(['ABC='])
+
+    def test_invalid_batch_options(self):
+        encoder = Encoder({'0': 'A', '1': 'B'}, '=')
+
+        with self.assertRaises(ValueError):
+            encoder.encode_many([b'a'], batch_size=0)
+        with self.assertRaises(ValueError):
+            encoder.encode_many([b'a'], workers=2, pool='fibre')
@@ -0,0 +1,39 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from benchmarks.suite import BenchmarkResult, available_dictionaries, run_benchmarks, save_results, load_results, find_regressions
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_run_benchmarks_for_every_dictionary(self):
+        results = run_benchmarks(available_dictionaries(), [16])
+
+        self.assertEqual(len(available_dictionaries()) * 2, len(results))
+        for result in results:
+            with self.subTest(dictionary=result.dictionary, operation=result.operation):
+                self.assertGreater(result.mb_per_second, 0)
+                self.assertGreater(result.peak_memory, 0)
+
+    def test_results_round_trip_through_json(self):
+        results = [BenchmarkResult('Default', 'encode', 16, 1.5, 100)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('results.json')
+            save_results(results, path)
+            loaded = load_results(path)
+
+        self.assertEqual([result.to_json() for result in results], [result.to_json() for result in loaded])
+
+    def test_find_regressions(self):
+        baseline = [BenchmarkResult('Default', 'encode', 16, 10.0, 1000), BenchmarkResult('Default', 'decode', 16, 10.0, 1000)]
+        arguments = [
+            ('Within threshold.', [BenchmarkResult('Default', 'encode', 16, 8.5, 1100)], 0),
+            ('Slower.', [BenchmarkResult('Default', 'encode', 16, 7.9, 1000)], 1),
+            ('More memory.', [BenchmarkResult('Default', 'decode', 16, 10.0, 1201)], 1),
+            ('Slower and more memory.', [BenchmarkResult('Default', 'decode', 16, 1.0, 5000)], 2),
+            ('No baseline.', [BenchmarkResult('Generated', 'decode', 16, 1.0, 5000)], 0)
+        ]
+        for message, results, expected_regressions in arguments:
+            with self.subTest(msg=message):
+                self.assertEqual(expected_regressions, len(find_regressions(results, baseline, 0.2)))
@@ -0,0 +1,25 @@
+import os
+import unittest
+
+from encoder.lib.encode import Encoder
+from encoder.lib.convert import bytes_to_binary
+from encoder.lib.bit_packing import aligned_block_length
+
+from ._dictionaries import shipped_dictionaries
+
+
+class BitPackingTest(unittest.TestCase):
+
+    def test_aligned_block_length(self):
+        arguments = [(3, 3), (4, 1), (6, 3), (8, 1), (11, 11), (16, 2), (20, 5)]
+        for binary_key_length, expected_block_length in arguments:
+            with self.subTest(binary_key_length=binary_key_length):
+                self.assertEqual(expected_block_length, aligned_block_length(binary_key_length))
+
+    def test_encode_bytes_matches_binary_string_encoding(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            for length in list(range(0, 25)) + [257]:
+                with self.subTest(dictionary=name, length=length):
+                    value = os.urandom(length)
+                    self.assertEqual(encoder.encode(bytes_to_binary(value)), encoder.encode_bytes(value))
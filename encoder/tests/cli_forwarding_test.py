@@ -0,0 +1,174 @@
+from typing import Any, List, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from pathlib import Path
+from threading import Thread
+from unittest import mock
+import base64
+import os
+import socket
+import tempfile
+import unittest
+
+from encoder.lib.server import EncoderServer
+
+from ._dictionaries import shipped_dictionaries
+
+
+_RUN_SCRIPT = Path(__file__).parent.parent.parent.joinpath('run.py')
+_SERVER_VARIABLE = 'PY_ENCODER_SERVER'
+
+
+def _load_run_script() -> Any:
+    spec = spec_from_file_location('run', _RUN_SCRIPT)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _OtherServiceHandler(BaseHTTPRequestHandler):
+
+    """Answers every request like an unrelated service listening on the port, without the encoder server header."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+def _unused_address() -> str:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return f'127.0.0.1:{sock.getsockname()[1]}'
+
+
+@unittest.skipUnless(find_spec('click') is not None, 'The CLI requires click to be installed.')
+class CliForwardingTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from click.testing import CliRunner
+        cls.cli = _load_run_script()
+        cls.runner = CliRunner()
+        dictionaries = {name: (mappings, padding) for name, mappings, padding in shipped_dictionaries()}
+        cls.server = EncoderServer(('127.0.0.1', 0), lambda table_type, name: table_type(*dictionaries[name]), dictionaries)
+        cls.address = f'127.0.0.1:{cls.server.server_address[1]}'
+        cls.thread = Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._value = os.urandom(5000)
+        self._encoded = base64.b64encode(self._value).decode('ascii')
+        self._value_path = Path(self._directory.name).joinpath('value.bin')
+        self._value_path.write_bytes(self._value)
+        self._encoded_path = Path(self._directory.name).joinpath('encoded.txt')
+        self._encoded_path.write_text(self._encoded)
+        self._output_path = Path(self._directory.name).joinpath('output.bin')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _invoke(self, arguments: List[str], address: str | None) -> Tuple[Any, int]:
+        """
+        Runs the CLI in this process with PY_ENCODER_SERVER set to the address, or unset when it is None.
+
+        :return: The result of the command and the number of requests the server handled while it ran.
+        """
+
+        # Every request looks up the table of its dictionary so the lookups count the forwarded requests.
+        with mock.patch.dict(os.environ, {_SERVER_VARIABLE: address or ''}), \
+                mock.patch.object(self.server, 'get_table', wraps=self.server.get_table) as get_table:
+            result = self.runner.invoke(self.cli.main, arguments)
+        return result, get_table.call_count
+
+    def test_commands_only_forward_when_the_server_is_configured(self):
+        for address, expected_requests in ((None, 0), (self.address, 1)):
+            with self.subTest(address=address):
+                result, requests = self._invoke(['encode', 'string', 'hello'], address)
+
+                self.assertEqual(0, result.exit_code, result.output)
+                self.assertEqual('aGVsbG8=\n', result.output)
+                self.assertEqual(expected_requests, requests)
+
+    def test_prompted_value_is_never_forwarded(self):
+        with mock.patch.object(self.cli, 'getpass', return_value='hello') as prompt:
+            result, requests = self._invoke(['encode', 'string', '?'], self.address)
+
+        prompt.assert_called_once()
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertEqual('aGVsbG8=\n', result.output)
+        self.assertEqual(0, requests)
+
+    def test_forwarded_commands_match_local_commands(self):
+        arguments = [
+            (['encode', 'string', 'hello'], 'aGVsbG8=\n', None),
+            (['decode', 'string', 'aGVsbG8='], 'hello\n', None),
+            (['encode', 'file', str(self._value_path)], f'{self._encoded}\n', None),
+            (['decode', 'file', str(self._encoded_path), str(self._output_path)], '', self._value),
+        ]
+        for command, expected_output, expected_file in arguments:
+            with self.subTest(command=command[:2]):
+                result, requests = self._invoke(command, self.address)
+
+                self.assertEqual(0, result.exit_code, result.output)
+                self.assertEqual(expected_output, result.output)
+                self.assertEqual(1, requests)
+                if expected_file is not None:
+                    self.assertEqual(expected_file, self._output_path.read_bytes())
+
+    def test_commands_run_locally_without_an_encoder_server(self):
+        other_service = ThreadingHTTPServer(('127.0.0.1', 0), _OtherServiceHandler)
+        Thread(target=other_service.serve_forever, daemon=True).start()
+        try:
+            for name, address in (('other service', f'127.0.0.1:{other_service.server_address[1]}'), ('unreachable', _unused_address())):
+                with self.subTest(server=name):
+                    result, _ = self._invoke(['encode', 'string', 'hello'], address)
+                    self.assertEqual(0, result.exit_code, result.output)
+                    self.assertEqual('aGVsbG8=\n', result.output)
+
+                    result, _ = self._invoke(['decode', 'file', str(self._encoded_path), str(self._output_path)], address)
+                    self.assertEqual(0, result.exit_code, result.output)
+                    self.assertEqual(self._value, self._output_path.read_bytes())
+        finally:
+            other_service.shutdown()
+            other_service.server_close()
+
+    def test_server_errors_fail_the_command(self):
+        result, requests = self._invoke(['decode', 'string', 'aGVsbG8!'], self.address)
+
+        self.assertEqual(1, result.exit_code)
+        self.assertIn('Position: [7]', result.output)
+        self.assertEqual(1, requests)
+
+    def test_parallel_and_range_commands_never_connect(self):
+        arguments = [
+            (['encode', 'file', str(self._value_path), '--jobs', '2'], f'{self._encoded}\n', None),
+            (['decode', 'file', str(self._encoded_path), str(self._output_path), '--jobs', '2'], '', self._value),
+            (['decode', 'file', str(self._encoded_path), str(self._output_path), '--offset', '100'], '', self._value[100:]),
+            (['decode', 'file', str(self._encoded_path), str(self._output_path), '--length', '100'], '', self._value[:100]),
+        ]
+        for command, expected_output, expected_file in arguments:
+            with self.subTest(command=command):
+                with mock.patch.object(self.cli, '_connect_to_server', wraps=self.cli._connect_to_server) as connect_to_server:
+                    result, requests = self._invoke(command, self.address)
+
+                self.assertEqual(0, result.exit_code, result.output)
+                self.assertEqual(expected_output, result.output)
+                if expected_file is not None:
+                    self.assertEqual(expected_file, self._output_path.read_bytes())
+                connect_to_server.assert_not_called()
+                self.assertEqual(0, requests)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from encoder.lib.codec_cache import CodecCache, get_codec, codec_cache_info, clear_codec_cache
+from encoder.lib.encode import Encoder, encode_string
+from encoder.lib.decode import Decoder
+
+
+class CodecCacheTest(unittest.TestCase):
+
+    def test_equal_dictionaries_share_a_table(self):
+        cache = CodecCache()
+        first = cache.get(Encoder, {'0': 'A', '1': 'B'}, '=')
+        second = cache.get(Encoder, {'1': 'B', '0': 'A'}, '=')
+
+        self.assertIs(first, second)
+        self.assertEqual((1, 1, 32, 1), tuple(cache.info()))
+
+    def test_modified_dictionary_gets_a_new_table(self):
+        cache = CodecCache()
+        mappings = {'0': 'A', '1': 'B'}
+        first = cache.get(Encoder, mappings, '=')
+        self.assertIs(first, cache.get(Encoder, mappings, '='))
+
+        mappings['1'] = 'C'
+        second = cache.get(Encoder, mappings, '=')
+        self.assertIsNot(first, second)
+        self.assertEqual('AC', second.encode_bytes(b'\x55')[:2])
+        self.assertEqual((1, 2, 32, 2), tuple(cache.info()))
+
+    def test_tables_are_keyed_by_type_and_padding(self):
+        cache = CodecCache()
+        encoder = cache.get(Encoder, None, None)
+        decoder = cache.get(Decoder, None, None)
+        padded = cache.get(Encoder, None, '#')
+
+        self.assertIsInstance(encoder, Encoder)
+        self.assertIsInstance(decoder, Decoder)
+        self.assertIsNot(encoder, padded)
+        self.assertEqual(0, cache.info().hits)
+        self.assertEqual(3, cache.info().currsize)
+
+    def test_least_recently_used_table_is_evicted(self):
+        cache = CodecCache(maxsize=2)
+        first = cache.get(Encoder, {'0': 'A', '1': 'B'}, '=')
+        cache.get(Encoder, {'0': 'C', '1': 'D'}, '=')
+        cache.get(Encoder, {'0': 'A', '1': 'B'}, '=')
+        cache.get(Encoder, {'0': 'E', '1': 'F'}, '=')
+
+        self.assertIs(first, cache.get(Encoder, {'0': 'A', '1': 'B'}, '='))
+        self.assertEqual(2, cache.info().currsize)
+        self.assertEqual(3, cache.info().misses)
+
+    def test_invalid_dictionary_is_not_cached(self):
+        cache = CodecCache()
+        with self.assertRaises(ValueError):
+            cache.get(Encoder, {'0': 'A', '1': 'BB'}, '=')
+        self.assertEqual(0, cache.info().currsize)
+
+    def test_module_level_functions_use_shared_cache(self):
+        clear_codec_cache()
+        encode_string('first')
+        encode_string('second')
+
+        self.assertEqual(1, codec_cache_info().misses)
+        self.assertEqual(1, codec_cache_info().hits)
+        self.assertIs(get_codec(Encoder, None, '='), get_codec(Encoder, None, None))
@@ -0,0 +1,92 @@
+from pathlib import Path
+import os
+import tempfile
+import unittest
+
+from encoder.lib.bit_packing import MalformedEncodingError
+from encoder.lib.compact_table import CompactSymbolIndex, CompactTable, build_representation_table
+from encoder.lib.compiled_dictionary import compile_dictionary, load_compiled_dictionary
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.generator import generate_compact_table, generate_mappings
+
+
+class CompactTableTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._mappings = dict(generate_mappings(16, 3, seed=7))
+        cls._table = generate_compact_table(16, 3, seed=7)
+
+    def test_generated_table_matches_generated_mappings(self):
+        self.assertEqual(1 << 16, len(self._table))
+        self.assertTrue(self._table.ascii)
+        self.assertEqual(list(self._mappings.values()), list(self._table))
+        self.assertEqual(self._mappings['0000000000000101'], self._table[5])
+        self.assertEqual(self._mappings['1111111111111111'], self._table[-1])
+        self.assertEqual((1 << 16) * 3, len(self._table.buffer))
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self._table[1 << 16]
+
+    def test_symbol_index_finds_binary_keys(self):
+        symbol_index = self._table.symbol_index()
+        for value in (0, 1, 12345, (1 << 16) - 1):
+            with self.subTest(value=value):
+                self.assertEqual(value, symbol_index[self._table[value]])
+                self.assertEqual(value, symbol_index[self._table[value].encode('ascii')])
+        self.assertNotIn('===', symbol_index)
+        self.assertNotIn('äöü', symbol_index)
+        self.assertEqual(1 << 16, len(symbol_index))
+
+    def test_non_ascii_representations(self):
+        table = CompactTable.from_representations(['ä', '€', 'a', '𝄞'], 1)
+
+        self.assertFalse(table.ascii)
+        self.assertEqual(16, len(table.buffer))
+        self.assertEqual(['ä', '€', 'a', '𝄞'], list(table))
+        self.assertEqual(3, table.symbol_index()['𝄞'])
+        with self.assertRaises(ValueError):
+            table.byte_representations()
+
+    def test_only_long_binary_keys_use_a_compact_table(self):
+        self.assertIsInstance(build_representation_table(['A', 'B'], 1), list)
+        self.assertIsInstance(Encoder(self._mappings, '=')._representations, CompactTable)
+        self.assertIsInstance(Decoder(self._mappings, '=')._symbol_values, CompactSymbolIndex)
+
+    def test_encode_decode_round_trip(self):
+        encoder = Encoder.from_representations(self._table, '=')
+        decoder = Decoder.from_representations(self._table, '=')
+        value = os.urandom(5001)
+
+        self.assertEqual(self._table[0x1234], encoder.encode_bytes(b'\x12\x34'))
+        self.assertEqual(self._table[0x1200] + '=' * 4, encoder.encode_bytes(b'\x12'))
+        for length in (0, 1, 2, 3, 100, 5001):
+            with self.subTest(length=length):
+                encoded = encoder.encode_bytes(value[:length])
+                self.assertEqual(encoded.encode('utf-8'), encoder.encode_to_bytes(value[:length]))
+                self.assertEqual(encoded, Encoder(self._mappings, '=').encode_bytes(value[:length]))
+                self.assertEqual(value[:length], decoder.decode(encoded))
+                self.assertEqual(value[:length], decoder.decode(encoded.encode('ascii')))
+
+    def test_malformed_input_reports_position(self):
+        decoder = Decoder.from_representations(self._table, '=')
+        encoded = Encoder.from_representations(self._table, '=').encode_bytes(os.urandom(10))
+
+        with self.assertRaises(MalformedEncodingError) as context:
+            decoder.decode(encoded[:6] + '"""' + encoded[9:])
+        self.assertEqual(6, context.exception.position)
+
+    def test_compiled_dictionary_loads_a_compact_table(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('dictionary.encdict')
+            compile_dictionary(self._mappings, '=', path)
+            compiled = load_compiled_dictionary(path)
+
+        self.assertIsInstance(compiled.representations, CompactTable)
+        self.assertEqual(self._table.buffer, compiled.representations.buffer)
+
+
+if __name__ == '__main__':
+    unittest.main()
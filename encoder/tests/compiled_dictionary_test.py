@@ -0,0 +1,69 @@
+from pathlib import Path
+import os
+import tempfile
+import unittest
+
+from encoder.lib.compiled_dictionary import compile_dictionary, load_compiled_dictionary
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+
+from ._dictionaries import shipped_dictionaries
+
+
+class CompiledDictionaryTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name).joinpath('dictionary.encdict')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_compiled_dictionaries_match_yaml_dictionaries(self):
+        value = os.urandom(5000)
+        for name, mappings, padding in shipped_dictionaries():
+            with self.subTest(dictionary=name):
+                compile_dictionary(mappings, padding, self._path)
+                compiled = load_compiled_dictionary(self._path)
+
+                self.assertEqual(padding, compiled.padding_character)
+                encoder = Encoder.from_representations(compiled.representations, compiled.padding_character)
+                decoder = Decoder.from_representations(compiled.representations, compiled.padding_character)
+                encoded = encoder.encode_bytes(value)
+                self.assertEqual(Encoder(mappings, padding).encode_bytes(value), encoded)
+                self.assertEqual(value, decoder.decode(encoded))
+
+    def test_non_ascii_representations_are_preserved(self):
+        mappings = {'0': 'ä', '1': '€'}
+        compile_dictionary(mappings, '=', self._path)
+
+        self.assertEqual(['ä', '€'], load_compiled_dictionary(self._path).representations)
+
+    def test_incomplete_dictionary_cannot_be_compiled(self):
+        with self.assertRaises(ValueError):
+            compile_dictionary({'00': 'A', '01': 'B'}, '=', self._path)
+
+    def test_corrupt_table_is_rejected(self):
+        compile_dictionary({'0': 'A', '1': 'B'}, '=', self._path)
+        contents = bytearray(self._path.read_bytes())
+        contents[-1] = ord('C')
+        self._path.write_bytes(contents)
+
+        with self.assertRaises(ValueError):
+            load_compiled_dictionary(self._path)
+
+    def test_corrupt_header_is_rejected(self):
+        compile_dictionary({'0': 'A', '1': 'B'}, '=', self._path)
+        contents = bytearray(self._path.read_bytes())
+        # The padding code point is stored just before the checksum at the end of the header.
+        contents[14:18] = ord('#').to_bytes(4, 'big')
+        self._path.write_bytes(contents)
+
+        with self.assertRaises(ValueError):
+            load_compiled_dictionary(self._path)
+
+    def test_other_files_are_rejected(self):
+        self._path.write_bytes(b'padding: =\nmappings: {}\n')
+
+        with self.assertRaises(ValueError):
+            load_compiled_dictionary(self._path)
@@ -0,0 +1,72 @@
+import os
+import random
+import unittest
+
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.bit_packing import MalformedEncodingError
+from encoder.lib.line_layout import find_line_layout
+
+from ._dictionaries import shipped_dictionaries
+
+
+class DecodeRangeTest(unittest.TestCase):
+
+    def test_ranges_match_slices_of_decoded_value(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            random_generator = random.Random(name)
+            # Every length of the final partial block is covered, as the padded tail of odd key lengths can be longer
+            # than a single aligned group.
+            for value_length in range(2001, 2001 + encoder._block_length):
+                value = os.urandom(value_length)
+                wrap = encoder._representation_value_length * 20
+                wrapped = encoder.encode_bytes(value, wrap)
+                sources = [encoder.encode_bytes(value), wrapped, wrapped.replace('\n', '\r\n') + '\r\n']
+                if decoder.accepts_bytes:
+                    sources.extend(memoryview(source.encode('ascii')) for source in list(sources))
+
+                ranges = [(0, 0), (0, 1), (0, None), (1995, None), (value_length, 5), (1990, 100)]
+                ranges.extend((random_generator.randrange(value_length), random_generator.randrange(300)) for _ in range(10))
+                for source in sources:
+                    for start, length in ranges:
+                        with self.subTest(dictionary=name, value_length=value_length, type=type(source).__name__, start=start, length=length):
+                            end = None if length is None else start + length
+                            self.assertEqual(value[start:end], decoder.decode_range(source, start, length))
+
+    def test_short_values(self):
+        mappings = {'000': 'a', '001': 'b', '010': 'c', '011': 'd', '100': 'e', '101': 'f', '110': 'g', '111': 'h'}
+        encoder = Encoder(mappings, '=')
+        decoder = Decoder(mappings, '=')
+        for length in range(8):
+            value = os.urandom(length)
+            encoded = encoder.encode_bytes(value, 5)
+            for start in range(length + 1):
+                for range_length in range(length + 2):
+                    with self.subTest(length=length, start=start, range_length=range_length):
+                        self.assertEqual(value[start:start + range_length], decoder.decode_range(encoded, start, range_length))
+
+    def test_malformed_range_reports_position(self):
+        decoder = Decoder(*next(shipped_dictionaries())[1:])
+        encoded = 'QUJD' * 1000
+        malformed = encoded[:2000] + '!' + encoded[2001:]
+        with self.assertRaises(MalformedEncodingError) as context:
+            decoder.decode_range(malformed, 1499, 2)
+        self.assertEqual(2000, context.exception.position)
+
+    def test_invalid_ranges(self):
+        decoder = Decoder(*next(shipped_dictionaries())[1:])
+        for start, length in [(-1, 1), (0, -1)]:
+            with self.subTest(start=start, length=length):
+                with self.assertRaises(ValueError):
+                    decoder.decode_range('QUJD', start, length)
+
+    def test_find_line_layout(self):
+        self.assertEqual((0, 0, 4, 4), find_line_layout('QUJD\n'))
+        self.assertEqual((4, 2, 10, 14), find_line_layout(memoryview(b'QUJD\r\nQUJD\r\nQU\r\n')))
+        self.assertEqual(7, find_line_layout('QUJD\nQUJD\nQU').offset(6))
+        for encoded in ['\nQUJD', 'QUJD\nQUJDQ\nQU', 'QUJD\nQUJDQU']:
+            with self.subTest(encoded=encoded):
+                with self.assertRaises(ValueError):
+                    find_line_layout(encoded)
@@ -1,13 +1,18 @@
 from typing import List
+import os
 import string
 from random import randrange
 import unittest
 from base64 import b64encode
 
-from encoder.lib.encode import encode_string
-from encoder.lib.decode import decode_to_string
+from encoder.lib.encode import encode_string, Encoder
+from encoder.lib.decode import decode_to_string, Decoder
+from encoder.lib.bit_packing import MalformedEncodingError
+from encoder.lib.codec_cache import get_codec
 from encoder.lib.generator import generate_encoding_dictionary
 
+from ._dictionaries import shipped_dictionaries
+
 
 class EncodeDecodeTest(unittest.TestCase):
 
@@ -41,6 +46,75 @@ class EncodeDecodeTest(unittest.TestCase):
                 decode_result = decode_to_string(encode_result, dictionary.mappings, dictionary.padding_character)
                 self.assertEqual(decode_result, generated_string)
 
+    def test_encoding_shipped_dictionaries(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            for length in range(0, 25):
+                with self.subTest(dictionary=name, length=length):
+                    value = os.urandom(length)
+                    self.assertEqual(value, decoder.decode(encoder.encode_bytes(value)))
+
+    def test_decoding_bytes_like_objects(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            for length in (0, 1, 7, 25, 5000):
+                value = os.urandom(length)
+                encoded = encoder.encode_to_bytes(value)
+                for encoded_type in (bytes, bytearray, memoryview):
+                    with self.subTest(dictionary=name, length=length, type=encoded_type.__name__):
+                        self.assertEqual(encoder.encode_bytes(value).encode('utf-8'), encoded)
+                        self.assertEqual(value, decoder.decode(encoded_type(encoded)))
+
+    def test_decoding_memoryview_slices_with_line_breaks(self):
+        for name, mappings, padding in shipped_dictionaries():
+            value = os.urandom(3000)
+            encoded = Encoder(mappings, padding).encode_to_bytes(value)
+            wrapped = memoryview(b'\r\n'.join(encoded[i:i + 76] for i in range(0, len(encoded), 76)))
+            with self.subTest(dictionary=name):
+                decoded = Decoder(mappings, padding).iter_decode(wrapped[i:i + 100] for i in range(0, len(wrapped), 100))
+                self.assertEqual(value, b''.join(decoded))
+
+    def test_decoding_bytes_requires_ascii_representations(self):
+        mappings = {'0': 'ä', '1': 'ö'}
+        encoded = Encoder(mappings, '=').encode_to_bytes(b'hello')
+
+        self.assertFalse(Decoder(mappings, '=').accepts_bytes)
+        with self.assertRaises(ValueError):
+            Decoder(mappings, '=').decode(encoded)
+        self.assertEqual(b'hello', Decoder(mappings, '=').decode(str(encoded, 'utf-8')))
+
+    def test_decoding_unknown_bytes(self):
+        for encoded in (b'ABAB\xffBAB', b'AB' * 5000 + b'\xff' + b'B' * 7):
+            with self.subTest(length=len(encoded)):
+                with self.assertRaisesRegex(Exception, 'Could not find a binary key'):
+                    Decoder({'0': 'A', '1': 'B'}, '=').decode(encoded)
+
+    def test_malformed_input_reports_position(self):
+        encoded = get_codec(Encoder, None, None).encode_bytes(os.urandom(30000))
+        decoder = get_codec(Decoder, None, None)
+        for position in (0, 5, 4099, 25000, len(encoded) - 3):
+            malformed = encoded[:position] + '!' + encoded[position + 1:]
+            wrapped = '\n'.join(malformed[i:i + 76] for i in range(0, len(malformed), 76))
+            for chunk_size in (64, 4096):
+                with self.subTest(position=position, chunk_size=chunk_size):
+                    with self.assertRaises(MalformedEncodingError) as context:
+                        b''.join(decoder.iter_decode([wrapped], chunk_size))
+                    self.assertEqual(position, context.exception.position)
+                    self.assertIn('[!]', str(context.exception))
+
+    def test_malformed_tail_reports_position(self):
+        with self.assertRaises(MalformedEncodingError) as context:
+            get_codec(Decoder, None, None).decode('QUJD' * 100 + 'QUJ')
+        self.assertEqual(402, context.exception.position)
+
+        mappings = generate_encoding_dictionary(4, 2, '=', seed=1).mappings
+        encoded = Encoder(mappings, '=').encode_bytes(b'abcdef')
+        with self.assertRaises(MalformedEncodingError) as context:
+            Decoder(mappings, '=').decode(encoded[:-1])
+        self.assertEqual(22, context.exception.position)
+
     def _generate_test_strings(self) -> List[str]:
         generated_strings = set()
         while len(generated_strings) < 50:
@@ -14,7 +14,11 @@ class EncodingDefinitionTableTest(unittest.TestCase):
             ('Binary key with more than 0 and 1.', 'only contain the characters 0 and 1', '=', {'2': '-'}),
             ('Dictionary with 0 length value.', 'greater than 0', '=', {'1': ''}),
             ('Different length representations.', 'does not match length of first', '=', {'1': '-', '0': '++'}),
-            ('Padding matching trailing representation character.', 'the trailing characters for the character representation', '=', {'1': '_='})
+            ('Padding matching trailing representation character.', 'the trailing characters for the character representation', '=', {'1': '_='}),
+            ('Missing binary key.', 'Missing binary key: [10]', '=', {'00': 'a', '01': 'b', '11': 'c'}),
+            ('Duplicate representations.', 'Every representation must be unique.', '=', {'0': 'a', '1': 'a'}),
+            ('Representation containing a line break.', 'contains a line break', '=', {'0': 'a', '1': '\n'}),
+            ('Line break padding.', 'cannot be a line break', '\r', {'0': 'a', '1': 'b'})
         ]
         for args in arguments:
             with self.subTest(msg=args[0]):
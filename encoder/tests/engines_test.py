@@ -0,0 +1,103 @@
+from pathlib import Path
+from unittest import mock
+import json
+import os
+import tempfile
+import unittest
+
+from encoder.lib import engine_table, engines
+from encoder.lib.base64_defaults import get_or_default_dictionary
+from encoder.lib.encode import Encoder
+from encoder.lib.engine_table import EngineTable
+from encoder.lib.decode import Decoder
+from encoder.lib.engines import (AUTO_ENGINE, ENGINE_CACHE_VARIABLE, ENGINE_VARIABLE, ENGINES, NUMPY_ENGINE, PYTHON_ENGINE,
+                                 SIZE_BUCKETS, STDLIB_ENGINE, EngineCache, resolve_engine, size_bucket)
+from encoder.lib.generator import generate_encoding_dictionary
+from encoder.lib.numpy_engine import is_numpy_available
+
+
+class EnginesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._cache_path = Path(self._directory.name).joinpath('engines.json')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_resolve_engine(self):
+        with mock.patch.dict(os.environ, {ENGINE_VARIABLE: ''}):
+            self.assertEqual(AUTO_ENGINE, resolve_engine(None))
+            self.assertEqual(PYTHON_ENGINE, resolve_engine(PYTHON_ENGINE))
+        with mock.patch.dict(os.environ, {ENGINE_VARIABLE: STDLIB_ENGINE}):
+            self.assertEqual(STDLIB_ENGINE, resolve_engine(None))
+            self.assertEqual(STDLIB_ENGINE, Encoder(get_or_default_dictionary(None), '=').engine)
+            self.assertEqual(PYTHON_ENGINE, Encoder(get_or_default_dictionary(None), '=', engine=PYTHON_ENGINE).engine)
+        with self.assertRaises(ValueError):
+            resolve_engine('fortran')
+
+    def test_engine_table_is_abstract(self):
+        with self.assertRaises(TypeError):
+            EngineTable(get_or_default_dictionary(None), '=')
+
+    def test_size_bucket(self):
+        self.assertEqual(0, size_bucket(0))
+        self.assertEqual(0, size_bucket(SIZE_BUCKETS[0] - 1))
+        self.assertEqual(1, size_bucket(SIZE_BUCKETS[0]))
+        self.assertEqual(len(SIZE_BUCKETS), size_bucket(1 << 30))
+
+    def test_every_engine_produces_identical_output(self):
+        mappings = get_or_default_dictionary(None)
+        value = os.urandom(70000)
+        expected = Encoder(mappings, '=', engine=PYTHON_ENGINE).encode_bytes(value)
+        for engine in (STDLIB_ENGINE, NUMPY_ENGINE) if is_numpy_available() else (STDLIB_ENGINE,):
+            with self.subTest(engine=engine):
+                self.assertEqual(expected, Encoder(mappings, '=', engine=engine).encode_bytes(value))
+                self.assertEqual(expected.encode('ascii'), Encoder(mappings, '=', engine=engine).encode_to_bytes(value))
+                self.assertEqual(value, Decoder(mappings, '=', engine=engine).decode(expected))
+
+    def test_unsupported_engine(self):
+        mappings = generate_encoding_dictionary(5, 2, seed=1).mappings
+        with self.assertRaises(ValueError):
+            Encoder(mappings, '=', engine=STDLIB_ENGINE)
+
+    def test_unsupported_environment_engine_falls_back_to_auto(self):
+        mappings = generate_encoding_dictionary(5, 2, seed=1).mappings
+        value = os.urandom(SIZE_BUCKETS[0])
+        with mock.patch.dict(os.environ, {ENGINE_VARIABLE: STDLIB_ENGINE}):
+            encoder = Encoder(mappings, '=')
+            decoder = Decoder(mappings, '=')
+        self.assertEqual(AUTO_ENGINE, encoder.engine)
+        self.assertEqual(AUTO_ENGINE, decoder.engine)
+        self.assertEqual(value, decoder.decode(encoder.encode_bytes(value)))
+
+    def test_tuned_engines_are_saved_and_reused(self):
+        mappings = generate_encoding_dictionary(6, 2, seed=3).mappings
+        value = os.urandom(SIZE_BUCKETS[-1])
+        with mock.patch.dict(os.environ, {ENGINE_CACHE_VARIABLE: str(self._cache_path), ENGINE_VARIABLE: ''}):
+            encoder = Encoder(mappings, '=')
+            encoded = encoder.encode_bytes(value)
+
+            entries = json.loads(self._cache_path.read_text())
+            self.assertEqual(1, len(entries))
+            tuned = next(iter(entries.values()))
+            self.assertEqual(len(SIZE_BUCKETS) + 1, len(tuned))
+            self.assertEqual(PYTHON_ENGINE, tuned[0])
+            self.assertTrue(all(engine in ENGINES for engine in tuned))
+
+            # Another process reading the cache file uses the saved engines without running the benchmarks again.
+            engines._ENGINE_CACHES.clear()
+            with mock.patch.object(engine_table, 'tune_engines', side_effect=AssertionError('The engines were tuned again.')):
+                self.assertEqual(encoded, Encoder(mappings, '=').encode_bytes(value))
+
+    def test_corrupt_cache_file_is_ignored(self):
+        self._cache_path.write_text('{not json')
+        cache = EngineCache(self._cache_path)
+
+        self.assertIsNone(cache.get('fingerprint'))
+        cache.put('fingerprint', [PYTHON_ENGINE] * (len(SIZE_BUCKETS) + 1))
+        self.assertEqual([PYTHON_ENGINE] * (len(SIZE_BUCKETS) + 1), EngineCache(self._cache_path).get('fingerprint'))
+
+
+if __name__ == '__main__':
+    unittest.main()
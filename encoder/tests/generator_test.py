@@ -1,6 +1,9 @@
+import io
 import unittest
 
-from encoder.lib.generator import generate_encoding_dictionary
+import yaml
+
+from encoder.lib.generator import generate_encoding_dictionary, generate_mappings, dump_encoding_dictionary
 from encoder.lib.encoding_definition_table import EncodingDefinitionTable
 
 
@@ -33,3 +36,27 @@ class GeneratorTest(unittest.TestCase):
             with self.subTest(binary_key_length=args[0], representation_length=args[1], padding_character=args[2]):
                 with self.assertRaises(ValueError):
                     generate_encoding_dictionary(args[0], args[1], args[2])
+
+    def test_generate_unique_representations(self):
+        dictionary = generate_encoding_dictionary(12, 2, '=')
+        representations = list(dictionary.mappings.values())
+
+        self.assertEqual(4096, len(representations))
+        self.assertEqual(len(representations), len(set(representations)))
+        self.assertEqual([format(i, '012b') for i in range(4096)], list(dictionary.mappings.keys()))
+
+    def test_generate_with_seed_is_reproducible(self):
+        first = generate_encoding_dictionary(8, 3, '=', seed=42)
+        second = generate_encoding_dictionary(8, 3, '=', seed=42)
+        third = generate_encoding_dictionary(8, 3, '=', seed=43)
+
+        self.assertEqual(first.mappings, second.mappings)
+        self.assertNotEqual(first.mappings, third.mappings)
+
+    def test_dump_encoding_dictionary_is_valid_yaml(self):
+        writer = io.StringIO()
+        dump_encoding_dictionary("'", generate_mappings(6, 1, "'", seed=1), writer)
+        contents = yaml.safe_load(writer.getvalue())
+
+        self.assertEqual("'", contents['padding'])
+        self.assertEqual(dict(generate_mappings(6, 1, "'", seed=1)), contents['mappings'])
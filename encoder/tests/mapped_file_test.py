@@ -0,0 +1,61 @@
+from pathlib import Path
+import os
+import tempfile
+import unittest
+
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.mapped_file import map_file, map_output_file, iter_slices, iter_text, count_encoded_characters
+
+from ._dictionaries import shipped_dictionaries
+
+
+class MappedFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._folder = Path(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_decoded_length_matches_decoded_bytes(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            for length in range(0, 30):
+                with self.subTest(dictionary=name, length=length):
+                    encoded = encoder.encode_bytes(os.urandom(length))
+                    padding_count = len(encoded) - len(encoded.rstrip(padding))
+                    self.assertEqual(length, decoder.decoded_length(len(encoded), padding_count))
+
+    def test_decode_mapped_file_into_mapped_output(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            for length in (0, 1, 2, 5000):
+                with self.subTest(dictionary=name, length=length):
+                    value = os.urandom(length)
+                    encoded = encoder.encode_bytes(value)
+                    lines = [encoded[i:i + 64] for i in range(0, len(encoded), 64)]
+                    self._folder.joinpath('encoded.txt').write_text('\r\n'.join(lines) + '\n', 'utf-8')
+
+                    with map_file(self._folder.joinpath('encoded.txt')) as view:
+                        character_count, padding_count = count_encoded_characters(view, padding, 100)
+                        self.assertEqual(len(encoded), character_count)
+                        with map_output_file(self._folder.joinpath('decoded.bin'), decoder.decoded_length(character_count, padding_count)) as output:
+                            decoder.decode_into(iter_text(view, 100), output, 100)
+
+                    self.assertEqual(value, self._folder.joinpath('decoded.bin').read_bytes())
+
+    def test_iter_text_handles_characters_split_across_chunks(self):
+        text = 'αβγδε' * 20
+        self._folder.joinpath('text.txt').write_text(text, 'utf-8')
+        with map_file(self._folder.joinpath('text.txt')) as view:
+            self.assertEqual(text, ''.join(iter_text(view, 3)))
+            self.assertEqual(len(text), count_encoded_characters(view, '=', 7)[0])
+
+    def test_iter_slices(self):
+        self._folder.joinpath('data.bin').write_bytes(b'abcdefg')
+        with map_file(self._folder.joinpath('data.bin')) as view:
+            self.assertEqual([b'abc', b'def', b'g'], [bytes(chunk) for chunk in iter_slices(view, 3)])
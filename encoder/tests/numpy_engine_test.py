@@ -0,0 +1,63 @@
+import os
+import unittest
+
+from encoder.lib.bit_packing import aligned_block_length, aligned_group_length, encode_aligned
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.generator import generate_encoding_dictionary
+from encoder.lib.numpy_engine import NumpyEncodingTable, NumpyDecodingTable, is_numpy_available, is_numpy_supported
+
+from ._dictionaries import shipped_dictionaries
+
+
+def _table(mappings):
+    representations = [''] * len(mappings)
+    for binary_key, representation in mappings.items():
+        representations[int(binary_key, 2)] = representation
+    return representations
+
+
+@unittest.skipUnless(is_numpy_available(), 'NumPy is not installed.')
+class NumpyEngineTest(unittest.TestCase):
+
+    def test_matches_pure_python_engine(self):
+        dictionaries = list(shipped_dictionaries())
+        for binary_key_length in (5, 9, 13):
+            generated = generate_encoding_dictionary(binary_key_length, 3)
+            dictionaries.append((f'Generated{binary_key_length}', generated.mappings, generated.padding_character))
+        dictionaries.append(('Unicode', {'00': 'αβ', '01': 'γδ', '10': 'εζ', '11': 'ηθ'}, '='))
+
+        for name, mappings, padding in dictionaries:
+            with self.subTest(dictionary=name):
+                representations = _table(mappings)
+                binary_key_length = len(next(iter(mappings)))
+                representation_length = len(representations[0])
+                value = os.urandom(aligned_block_length(binary_key_length) * 700)
+                symbol_values = {representation: i for i, representation in enumerate(representations)}
+
+                encoded = NumpyEncodingTable(representations, binary_key_length).encode(value)
+                decoded = NumpyDecodingTable(symbol_values, binary_key_length, representation_length).decode(encoded)
+
+                self.assertEqual(encode_aligned(value, representations, binary_key_length), encoded)
+                self.assertEqual(value, decoded)
+                self.assertEqual(0, len(encoded) % aligned_group_length(binary_key_length, representation_length))
+
+    def test_encoder_and_decoder_round_trip_large_inputs(self):
+        value = os.urandom(100003)
+        for name, mappings, padding in shipped_dictionaries():
+            with self.subTest(dictionary=name):
+                encoded = Encoder(mappings, padding).encode_bytes(value)
+                self.assertEqual(value, Decoder(mappings, padding).decode(encoded))
+
+    def test_decode_unknown_representation(self):
+        table = NumpyDecodingTable({'A': 0, 'B': 1}, 1, 1)
+        for encoded in ['ABAC' * 2, 'ABAé' * 2]:
+            with self.subTest(encoded=encoded):
+                with self.assertRaises(Exception) as context:
+                    table.decode(encoded)
+                self.assertIn(f'representation: [{encoded[3]}]', str(context.exception))
+
+    def test_is_numpy_supported(self):
+        self.assertTrue(is_numpy_supported(6, ['AB', 'CD']))
+        self.assertFalse(is_numpy_supported(40, ['AB', 'CD']))
+        self.assertFalse(is_numpy_supported(6, ['αβγδ', 'εζηθ']))
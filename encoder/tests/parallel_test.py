@@ -0,0 +1,57 @@
+import io
+import os
+import unittest
+
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.parallel import map_segments, resolve_worker_count
+
+from ._dictionaries import shipped_dictionaries
+
+
+class ParallelTest(unittest.TestCase):
+
+    def test_encode_parallel_matches_encode_bytes(self):
+        value = os.urandom(10001)
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            with self.subTest(dictionary=name):
+                self.assertEqual(encoder.encode_bytes(value), encoder.encode_parallel(value, workers=2, segment_size=1000))
+
+    def test_encode_stream_with_workers(self):
+        value = os.urandom(5000)
+        encoder = Encoder(*next(shipped_dictionaries())[1:])
+        writer = io.StringIO()
+
+        encoder.encode_stream(io.BytesIO(value), writer, 512, workers=3)
+
+        self.assertEqual(encoder.encode_bytes(value), writer.getvalue())
+
+    def test_decode_parallel_round_trip(self):
+        value = os.urandom(10001)
+        for name, mappings, padding in shipped_dictionaries():
+            encoded = Encoder(mappings, padding).encode_bytes(value)
+            wrapped = '\n'.join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+            with self.subTest(dictionary=name):
+                self.assertEqual(value, Decoder(mappings, padding).decode_parallel(wrapped, workers=2, segment_size=1000))
+
+    def test_decode_stream_with_workers(self):
+        mappings, padding = next(shipped_dictionaries())[1:]
+        value = os.urandom(5000)
+        writer = io.BytesIO()
+
+        Decoder(mappings, padding).decode_stream(io.StringIO(Encoder(mappings, padding).encode_bytes(value)), writer, 512, workers=3)
+
+        self.assertEqual(value, writer.getvalue())
+
+    def test_map_segments_preserves_order(self):
+        segments = [[str(i)] * (i + 1) for i in range(20)]
+        expected = ['-'.join(segment) for segment in segments]
+        self.assertEqual(expected, list(map_segments('-', 'join', segments, 1)))
+        self.assertEqual(expected, list(map_segments('-', 'join', segments, 2)))
+
+    def test_resolve_worker_count(self):
+        self.assertEqual(3, resolve_worker_count(3))
+        self.assertGreater(resolve_worker_count(None), 0)
+        with self.assertRaises(ValueError):
+            resolve_worker_count(0)
@@ -0,0 +1,65 @@
+import io
+import os
+import pickle
+import unittest
+
+from encoder.lib.base64_defaults import get_or_default_dictionary, get_or_default_padding
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.profiling import CodecStats
+
+
+class ProfilingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = Encoder(get_or_default_dictionary(None), get_or_default_padding(None))
+        self.decoder = Decoder(get_or_default_dictionary(None), get_or_default_padding(None))
+
+    def test_stages_are_recorded(self):
+        value = os.urandom(3001)
+        encoder_stats = self.encoder.enable_profiling()
+        decoder_stats = self.decoder.enable_profiling()
+
+        encoded = io.StringIO()
+        self.encoder.encode_stream(io.BytesIO(value), encoded, chunk_size=1024)
+        decoded = io.BytesIO()
+        self.decoder.decode_stream(io.StringIO(encoded.getvalue()), decoded, chunk_size=1024)
+
+        self.assertEqual(value, decoded.getvalue())
+        self.assertEqual(['read', 'encode aligned', 'write', 'encode tail'], list(encoder_stats.stages))
+        self.assertEqual(['read', 'strip line breaks', 'decode aligned', 'write', 'decode tail'], list(decoder_stats.stages))
+
+        aligned = encoder_stats.stages['encode aligned']
+        tail = encoder_stats.stages['encode tail']
+        self.assertEqual(3000, aligned.bytes_in)
+        self.assertEqual(4000, aligned.symbols)
+        self.assertEqual(1, tail.bytes_in)
+        self.assertEqual(2, tail.symbols)
+        self.assertEqual(len(encoded.getvalue()), aligned.bytes_out + tail.bytes_out)
+        self.assertEqual(3001, decoder_stats.stages['write'].bytes_out)
+        self.assertIn('decode aligned', decoder_stats.format())
+
+    def test_callback_is_notified_of_every_stage(self):
+        recorded = []
+        self.encoder.enable_profiling(CodecStats(lambda stage, *_: recorded.append(stage)))
+
+        self.encoder.encode_many([b'a', b'bc', b'def'])
+        self.encoder.encode_bytes(b'abcd')
+
+        self.assertEqual(['encode batch', 'encode aligned', 'encode tail'], recorded)
+
+    def test_disabled_profiling_records_nothing(self):
+        stats = self.decoder.enable_profiling()
+        self.decoder.disable_profiling()
+
+        self.decoder.decode('aGVsbG8=')
+
+        self.assertEqual({}, stats.stages)
+
+    def test_stats_are_not_copied_to_worker_processes(self):
+        self.encoder.enable_profiling(CodecStats(lambda *_: None))
+
+        copied = pickle.loads(pickle.dumps(self.encoder))
+
+        self.assertIsNone(copied._stats)
+        self.assertEqual(self.encoder.encode_bytes(b'hello'), copied.encode_bytes(b'hello'))
@@ -0,0 +1,85 @@
+from typing import Tuple
+from http.client import HTTPConnection, HTTPResponse
+from threading import Thread
+import os
+import unittest
+
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.server import SERVER_HEADER, EncoderServer
+
+from ._dictionaries import shipped_dictionaries
+
+
+class ServerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionaries = {name: (mappings, padding) for name, mappings, padding in shipped_dictionaries()}
+        cls.server = EncoderServer(('127.0.0.1', 0), lambda table_type, name: table_type(*cls.dictionaries[name]), cls.dictionaries)
+        cls.thread = Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _post(self, path: str, body: bytes) -> Tuple[HTTPResponse, bytes]:
+        connection = HTTPConnection(*self.server.server_address)
+        try:
+            connection.request('POST', path, body=body)
+            response = connection.getresponse()
+            return response, response.read()
+        finally:
+            connection.close()
+
+    def test_encode_and_decode_every_dictionary(self):
+        for name, (mappings, padding) in self.dictionaries.items():
+            value = os.urandom(200_000)
+            with self.subTest(dictionary=name):
+                response, encoded = self._post(f'/encode?dictionary={name}', value)
+                self.assertEqual(200, response.status)
+                self.assertEqual('1', response.getheader(SERVER_HEADER))
+                self.assertEqual(Encoder(mappings, padding).encode_bytes(value), encoded.decode('utf-8'))
+
+                response, decoded = self._post(f'/decode?dictionary={name}', encoded)
+                self.assertEqual(200, response.status)
+                self.assertEqual(value, decoded)
+
+    def test_encode_with_wrap(self):
+        mappings, padding = self.dictionaries['Default']
+        response, encoded = self._post('/encode?dictionary=Default&wrap=76', b'a' * 1000)
+        self.assertEqual(Encoder(mappings, padding).encode_bytes(b'a' * 1000, 76), encoded.decode('utf-8'))
+
+    def test_connection_is_reused(self):
+        connection = HTTPConnection(*self.server.server_address)
+        try:
+            for value in (b'a', b'bc', b'def'):
+                connection.request('POST', '/encode?dictionary=Default', body=value)
+                self.assertEqual(value, Decoder(*self.dictionaries['Default']).decode(connection.getresponse().read().decode('ascii')))
+        finally:
+            connection.close()
+
+    def test_errors(self):
+        arguments = [
+            ('/decode?dictionary=Default', b'aGVsbG8!', 400, 'Position: [7]'),
+            ('/encode?dictionary=Default&wrap=0', b'hello', 400, 'line length'),
+            ('/encode?dictionary=../Default', b'hello', 404, 'not one of the available dictionaries'),
+            ('/unknown', b'hello', 404, 'Unknown path')
+        ]
+        for path, body, status, message in arguments:
+            with self.subTest(path=path):
+                response, error = self._post(path, body)
+                self.assertEqual(status, response.status)
+                self.assertIn(message, error.decode('utf-8'))
+
+    def test_health(self):
+        connection = HTTPConnection(*self.server.server_address)
+        try:
+            connection.request('GET', '/health')
+            response = connection.getresponse()
+            self.assertEqual(200, response.status)
+            self.assertEqual(sorted(self.dictionaries), response.read().decode('utf-8').split('\n'))
+        finally:
+            connection.close()
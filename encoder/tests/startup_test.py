@@ -0,0 +1,58 @@
+from typing import Dict, List, Tuple
+from importlib.util import find_spec
+from pathlib import Path
+import subprocess
+import sys
+import unittest
+
+
+_RUN_SCRIPT = Path(__file__).parent.parent.parent.joinpath('run.py')
+
+# A generous upper bound on the time spent importing modules when starting the CLI. Starting the CLI only needs
+# click, which takes a few tens of milliseconds to import, so this will only fail if a heavy import sneaks back in.
+_MAX_STARTUP_IMPORT_MICROSECONDS = 250_000
+
+
+def _measure_import_times(arguments: List[str]) -> Tuple[Dict[str, int], int]:
+    """
+    Runs the CLI with python -X importtime and collects the cumulative import time, in microseconds, of each
+    module imported while running it along with the total time spent importing modules.
+    """
+
+    completed = subprocess.run([sys.executable, '-X', 'importtime', str(_RUN_SCRIPT), *arguments],
+                               capture_output=True, text=True, check=True)
+    import_times: Dict[str, int] = {}
+    total_import_time = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.split('|')
+        import_times[module.strip()] = int(cumulative)
+        # Nested imports are indented under the module that imported them and are included in its cumulative time.
+        if not module.startswith('  '):
+            total_import_time = total_import_time + int(cumulative)
+    return import_times, total_import_time
+
+
+@unittest.skipUnless(find_spec('click') is not None, 'The CLI requires click to be installed.')
+class StartupTest(unittest.TestCase):
+
+    def test_help_does_not_import_the_encoder(self):
+        import_times, _ = _measure_import_times(['--help'])
+
+        for module in ('yaml', 'encoder', 'numpy', 'concurrent.futures'):
+            with self.subTest(module=module):
+                self.assertNotIn(module, import_times)
+
+    def test_encode_string_does_not_import_optional_engines(self):
+        import_times, _ = _measure_import_times(['encode', 'string', 'hello'])
+
+        self.assertIn('encoder', import_times)
+        for module in ('numpy', 'concurrent.futures'):
+            with self.subTest(module=module):
+                self.assertNotIn(module, import_times)
+
+    def test_startup_import_time(self):
+        _, total_import_time = _measure_import_times(['--help'])
+
+        self.assertLess(total_import_time, _MAX_STARTUP_IMPORT_MICROSECONDS)
@@ -0,0 +1,81 @@
+import base64
+import os
+import string
+import unittest
+
+from encoder.lib.base64_defaults import get_or_default_dictionary
+from encoder.lib.bit_packing import MalformedEncodingError
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.stdlib_engine import build_stdlib_table
+
+from ._dictionaries import shipped_dictionaries
+
+
+_URL_SAFE_ALPHABET = string.ascii_uppercase + string.ascii_lowercase + string.digits + '-_'
+_HEX_TO_FOUR_BIT = bytes.maketrans(b'0123456789ABCDEF', b'ABCDEFGHIJKLMNOP')
+
+
+def _mappings(binary_key_length, alphabet):
+    return {format(value, f'0{binary_key_length}b'): character for value, character in enumerate(alphabet)}
+
+
+def _four_bit_encode(value):
+    return base64.b16encode(value).translate(_HEX_TO_FOUR_BIT)
+
+
+class StdlibEngineTest(unittest.TestCase):
+
+    def test_outputs_match_the_standard_library(self):
+        arguments = [
+            ('base64', get_or_default_dictionary(None), base64.b64encode),
+            ('urlsafe', _mappings(6, _URL_SAFE_ALPHABET), base64.urlsafe_b64encode),
+            ('hex', _mappings(4, '0123456789abcdef'), base64.b16encode),
+            ('HEX', _mappings(4, '0123456789ABCDEF'), base64.b16encode),
+            ('FourBit', _mappings(4, 'ABCDEFGHIJKLMNOP'), _four_bit_encode),
+        ]
+        for name, mappings, standard_encode in arguments:
+            encoder = Encoder(mappings, '=')
+            decoder = Decoder(mappings, '=')
+            self.assertIsNotNone(encoder._stdlib_table)
+            for length in (0, 1, 2, 3, 4, 5, 1000, 4099):
+                with self.subTest(alphabet=name, length=length):
+                    value = os.urandom(length)
+                    expected = standard_encode(value).decode('ascii')
+                    if name == 'hex':
+                        expected = expected.lower()
+                    self.assertEqual(expected, encoder.encode_bytes(value))
+                    self.assertEqual(expected.encode('ascii'), encoder.encode_to_bytes(value))
+                    self.assertEqual(value, decoder.decode(expected))
+                    self.assertEqual(value, decoder.decode(expected.encode('ascii')))
+
+    def test_only_standard_shapes_are_dispatched(self):
+        dispatched = {name: build_stdlib_table(len(next(iter(mappings))), list(mappings.values())) is not None
+                      for name, mappings, _ in shipped_dictionaries()}
+
+        self.assertEqual({'Default': True, 'FourBit': True, 'Generated': False, 'MultiLetter': False, 'ThreeBit': False}, dispatched)
+        self.assertIsNone(build_stdlib_table(6, ['ä'] + ['A'] * 63))
+
+    def test_unknown_representation_reports_position(self):
+        arguments = [('base64', get_or_default_dictionary(None), 'QUJD', 'Q*JD', 1),
+                     ('FourBit', _mappings(4, 'ABCDEFGHIJKLMNOP'), 'EBECED', 'EBE0ED', 3)]
+        for name, mappings, encoded, malformed, position in arguments:
+            with self.subTest(alphabet=name):
+                decoder = Decoder(mappings, '=')
+                self.assertEqual(b'ABC', decoder.decode(encoded))
+                with self.assertRaises(MalformedEncodingError) as context:
+                    decoder.decode(malformed)
+                self.assertEqual(position, context.exception.position)
+
+    def test_lowercase_hex_rejects_uppercase_input(self):
+        mappings = _mappings(4, '0123456789abcdef')
+        for engine in ('stdlib', 'auto'):
+            for encoded in ('AB' + 'ab' * 5000, 'AB' + 'ab' * 5):
+                with self.subTest(engine=engine, length=len(encoded)):
+                    with self.assertRaises(MalformedEncodingError) as context:
+                        Decoder(mappings, '=', engine=engine).decode(encoded)
+                    self.assertEqual(0, context.exception.position)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import io
+import os
+import unittest
+
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+
+from ._dictionaries import shipped_dictionaries
+
+
+class StreamTest(unittest.TestCase):
+
+    def test_encode_stream_matches_encode_bytes(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            for length, chunk_size in [(0, 1), (1, 1), (100, 1), (100, 7), (1000, 64), (1000, 5000)]:
+                with self.subTest(dictionary=name, length=length, chunk_size=chunk_size):
+                    value = os.urandom(length)
+                    writer = io.StringIO()
+
+                    written = encoder.encode_stream(io.BytesIO(value), writer, chunk_size)
+
+                    self.assertEqual(encoder.encode_bytes(value), writer.getvalue())
+                    self.assertEqual(len(writer.getvalue()), written)
+
+    def test_iter_encode_accepts_unaligned_byte_chunks(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            value = os.urandom(500)
+            chunks = [value[i:i + 13] for i in range(0, len(value), 13)]
+            with self.subTest(dictionary=name):
+                self.assertEqual(encoder.encode_bytes(value), ''.join(encoder.iter_encode(chunks)))
+
+    def test_decode_stream_round_trip(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            for length, chunk_size in [(0, 1), (1, 1), (2, 3), (100, 1), (100, 7), (1000, 64), (1000, 5000)]:
+                with self.subTest(dictionary=name, length=length, chunk_size=chunk_size):
+                    value = os.urandom(length)
+                    writer = io.BytesIO()
+
+                    written = decoder.decode_stream(io.StringIO(encoder.encode_bytes(value)), writer, chunk_size)
+
+                    self.assertEqual(value, writer.getvalue())
+                    self.assertEqual(length, written)
+
+    def test_iter_decode_skips_line_breaks(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            value = os.urandom(500)
+            encoded = encoder.encode_bytes(value)
+            lines = [encoded[i:i + 19] + '\r\n' for i in range(0, len(encoded), 19)]
+            with self.subTest(dictionary=name):
+                self.assertEqual(value, b''.join(decoder.iter_decode(lines)))
+
+    def test_encode_stream_wraps_lines(self):
+        for name, mappings, padding in shipped_dictionaries():
+            encoder = Encoder(mappings, padding)
+            decoder = Decoder(mappings, padding)
+            wrap = encoder._representation_value_length * 25
+            for length, chunk_size in [(0, 1), (10, 1), (1000, 7), (5000, 64 * 1024)]:
+                with self.subTest(dictionary=name, length=length, chunk_size=chunk_size):
+                    value = os.urandom(length)
+                    writer = io.StringIO()
+
+                    encoder.encode_stream(io.BytesIO(value), writer, chunk_size, wrap=wrap)
+
+                    lines = writer.getvalue().split('\n')
+                    self.assertTrue(all(len(line) == wrap for line in lines[:-1]))
+                    self.assertLessEqual(len(lines[-1]), wrap)
+                    self.assertEqual(encoder.encode_bytes(value), ''.join(lines))
+                    self.assertEqual(writer.getvalue(), encoder.encode_bytes(value, wrap))
+                    self.assertEqual(value, b''.join(decoder.iter_decode(io.StringIO(writer.getvalue()), chunk_size)))
+
+    def test_invalid_wrap(self):
+        encoder = Encoder({'0': 'AA', '1': 'BB'}, '=')
+        for wrap in (0, 3):
+            with self.subTest(wrap=wrap):
+                with self.assertRaises(ValueError):
+                    encoder.encode_bytes(b'abc', wrap)
+
+    def test_decode_malformed_tail(self):
+        decoder = Decoder(*next(shipped_dictionaries())[1:])
+        for encoded in ['QQ', 'QUI', 'Q===']:
+            with self.subTest(encoded=encoded):
+                with self.assertRaises(ValueError):
+                    decoder.decode(encoded)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(Encoder(*next(shipped_dictionaries())[1:]).iter_encode(io.BytesIO(b'abc'), 0))
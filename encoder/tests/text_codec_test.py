@@ -0,0 +1,84 @@
+from base64 import b64encode
+from pathlib import Path
+import codecs
+import io
+import tempfile
+import unittest
+
+from encoder.lib.text_codec import register_codec, unregister_codec
+
+from ._dictionaries import shipped_dictionaries
+
+
+_TEXT = 'Grüße, 世界! ' * 300
+
+
+class TextCodecTest(unittest.TestCase):
+
+    def setUp(self):
+        self._names = []
+        for name, mappings, padding in shipped_dictionaries():
+            register_codec(f'test-{name}', mappings, padding)
+            self._names.append(f'test-{name}')
+
+    def tearDown(self):
+        for name in self._names:
+            unregister_codec(name)
+
+    def test_encode_matches_base64(self):
+        self.assertEqual(b64encode(_TEXT.encode('utf-8')), _TEXT.encode('test-Default'))
+        self.assertEqual(_TEXT, b64encode(_TEXT.encode('utf-8')).decode('test-Default'))
+
+    def test_iterencode_and_iterdecode_one_character_at_a_time(self):
+        for name in self._names:
+            with self.subTest(codec=name):
+                encoded = b''.join(codecs.iterencode(iter(_TEXT), name))
+                self.assertEqual(_TEXT.encode(name), encoded)
+
+                pieces = (encoded[i:i + 1] for i in range(len(encoded)))
+                self.assertEqual(_TEXT, ''.join(codecs.iterdecode(pieces, name)))
+
+    def test_incremental_decoder_state_round_trips(self):
+        for name in self._names:
+            encoded = _TEXT.encode(name)
+            with self.subTest(codec=name):
+                decoder = codecs.getincrementaldecoder(name)()
+                decoded = decoder.decode(encoded[:101])
+
+                restored = codecs.getincrementaldecoder(name)()
+                restored.setstate(decoder.getstate())
+                self.assertEqual(_TEXT, decoded + restored.decode(encoded[101:], final=True))
+
+    def test_text_io_wrapper_reads_and_seeks(self):
+        for name in self._names:
+            with self.subTest(codec=name):
+                reader = io.TextIOWrapper(io.BytesIO(_TEXT.encode(name)), encoding=name)
+                self.assertEqual(_TEXT[:10], reader.read(10))
+                position = reader.tell()
+                self.assertEqual(_TEXT[10:], reader.read())
+                reader.seek(position)
+                self.assertEqual(_TEXT[10:20], reader.read(10))
+
+    def test_codecs_open_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('encoded.txt')
+            for name in self._names:
+                with self.subTest(codec=name):
+                    with codecs.getwriter(name)(open(path, 'wb')) as writer:
+                        for line in _TEXT.splitlines(keepends=True):
+                            writer.write(line)
+
+                    self.assertEqual(_TEXT.encode(name), path.read_bytes())
+                    with codecs.open(path, 'r', encoding=name) as reader:
+                        self.assertEqual(_TEXT, reader.read())
+
+    def test_registering_again_replaces_the_codec(self):
+        register_codec('test-Default', {'0': 'A', '1': 'B'}, '=')
+
+        self.assertEqual(b'ABBAABBA', 'f'.encode('test-Default'))
+
+    def test_unregistered_codec_cannot_be_found(self):
+        unregister_codec('test-Default')
+
+        with self.assertRaises(LookupError):
+            codecs.lookup('test-Default')
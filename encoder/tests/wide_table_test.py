@@ -0,0 +1,41 @@
+import os
+import unittest
+
+from encoder.lib.encode import Encoder
+from encoder.lib.decode import Decoder
+from encoder.lib.convert import bytes_to_binary
+from encoder.lib.wide_table import wide_symbol_count, build_wide_representations, build_wide_symbol_values
+
+from ._dictionaries import shipped_dictionaries
+
+
+class WideTableTest(unittest.TestCase):
+
+    def test_wide_symbol_count(self):
+        arguments = [(3, 1, 5), (4, 1, 2), (6, 1, 2), (6, 2, 2), (8, 1, 1), (11, 3, 1)]
+        for binary_key_length, representation_length, expected_symbol_count in arguments:
+            with self.subTest(binary_key_length=binary_key_length, representation_length=representation_length):
+                self.assertEqual(expected_symbol_count, wide_symbol_count(binary_key_length, representation_length))
+
+    def test_wide_symbol_count_respects_memory_budget(self):
+        self.assertEqual(4, wide_symbol_count(3, 1, 1 << 20))
+        self.assertEqual(1, wide_symbol_count(6, 1, 1024))
+
+    def test_wide_tables_combine_representations(self):
+        representations = ['A', 'B', 'C', 'D']
+        wide_representations = build_wide_representations(representations, 2)
+        wide_symbol_values = build_wide_symbol_values({'A': 0, 'B': 1, 'C': 2, 'D': 3}, 2, 2)
+
+        self.assertEqual(16, len(wide_representations))
+        self.assertEqual('BD', wide_representations[0b0111])
+        self.assertEqual(0b0111, wide_symbol_values['BD'])
+
+    def test_large_inputs_match_binary_string_encoding(self):
+        value = os.urandom(40000)
+        for name, mappings, padding in shipped_dictionaries():
+            with self.subTest(dictionary=name):
+                encoder = Encoder(mappings, padding)
+                encoded = encoder.encode_bytes(value)
+
+                self.assertEqual(encoder.encode(bytes_to_binary(value)), encoded)
+                self.assertEqual(value, Decoder(mappings, padding).decode(encoded))
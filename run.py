@@ -1,16 +1,33 @@
-from typing import List, Tuple, Dict
+from typing import Any, List, Tuple, Dict, Type, TypeVar
 from pathlib import Path
 import os
+import sys
+import time
 from getpass import getpass
 
 import click
-import yaml
 
-from encoder import encode_string, encode_bytes, decode_to_bytes, decode_to_string, generate_encoding_dictionary
+# The yaml parser and the encoder package are imported by the commands that need them, rather than here, so that
+# starting the CLI, and commands such as --help, stay fast.
 
 
 _DICTIONARY_FOLDER = Path(__file__).parent.joinpath('dictionaries').absolute()
 _DICTIONARY_NAME_TEMPLATE = '{}.yml'
+_DICTIONARY_EXTENSION = '.yml'
+_COMPILED_DICTIONARY_EXTENSION = '.encdict'
+_DEFAULT_DICTIONARY = 'Default'
+
+# The commands only forward their work to a serve command when this is set to its address, given as host:port. The
+# server is not authenticated so forwarding is opt in rather than trusting whatever is listening on the default port.
+_SERVER_VARIABLE = 'PY_ENCODER_SERVER'
+_DEFAULT_SERVER_HOST = '127.0.0.1'
+_DEFAULT_SERVER_PORT = 8765
+# Matches the SERVER_HEADER sent by encoder.lib.server, which is not imported so forwarding stays fast.
+_SERVER_HEADER = 'X-Encoder-Server'
+_SERVER_CONNECT_TIMEOUT = 0.5
+_SERVER_READ_SIZE = 64 * 1024
+
+T = TypeVar('T')
 
 
 def _remove_extension(file_name: str) -> str:
@@ -18,18 +35,164 @@ def _remove_extension(file_name: str) -> str:
 
 
 def _build_dictionary_list() -> List[str]:
-    return list(map(_remove_extension, os.listdir(_DICTIONARY_FOLDER)))
+    return [_remove_extension(file_name) for file_name in os.listdir(_DICTIONARY_FOLDER) if file_name.endswith(_DICTIONARY_EXTENSION)]
+
+
+def _get_dictionary_file(dictionary: str) -> Path:
+    return _DICTIONARY_FOLDER.joinpath(_DICTIONARY_NAME_TEMPLATE.format(dictionary)).absolute()
+
+
+def _get_compiled_dictionary_file(dictionary: str) -> Path:
+    return _get_dictionary_file(dictionary).with_suffix(_COMPILED_DICTIONARY_EXTENSION)
 
 
 def _read_dictionary_from_file(dictionary: str) -> Tuple[str, Dict[str, str]]:
-    dictionary_file_name = _DICTIONARY_NAME_TEMPLATE.format(dictionary)
-    dictionary_file = _DICTIONARY_FOLDER.joinpath(dictionary_file_name).absolute()
-    with open(dictionary_file, 'r') as file:
+    import yaml
+    with open(_get_dictionary_file(dictionary), 'r') as file:
         contents = yaml.safe_load(file)
         return contents['padding'], contents['mappings']
 
 
-_AVAILABLE_DICTIONARIES = _build_dictionary_list()
+def _is_compiled_dictionary_current(dictionary: str) -> bool:
+    compiled_file = _get_compiled_dictionary_file(dictionary)
+    return compiled_file.is_file() and compiled_file.stat().st_mtime >= _get_dictionary_file(dictionary).stat().st_mtime
+
+
+def _read_table(table_type: Type[T], dictionary: str) -> T:
+    if _is_compiled_dictionary_current(dictionary):
+        from encoder.lib.compiled_dictionary import load_compiled_dictionary
+        compiled = load_compiled_dictionary(_get_compiled_dictionary_file(dictionary))
+        return table_type.from_representations(compiled.representations, compiled.padding_character)
+    padding, mappings = _read_dictionary_from_file(dictionary)
+    return table_type(mappings, padding)
+
+
+def _load_table(table_type: Type[T], dictionary: str) -> T:
+    stats = click.get_current_context().obj
+    if stats is None:
+        return _read_table(table_type, dictionary)
+
+    start = time.perf_counter()
+    table = _read_table(table_type, dictionary)
+    stats.record('load dictionary', time.perf_counter() - start)
+    table.enable_profiling(stats)
+    return table
+
+
+def _connect_to_server() -> Any:
+    if click.get_current_context().obj is not None:
+        # Profiling measures the stages of the local encoder and decoder.
+        return None
+    address = os.environ.get(_SERVER_VARIABLE)
+    if not address:
+        return None
+
+    import socket
+    host, _, port = address.rpartition(':')
+    try:
+        # Connecting to a port nothing is listening on fails immediately so checking for a server is cheap.
+        sock = socket.create_connection((host, int(port)), timeout=_SERVER_CONNECT_TIMEOUT)
+    except (OSError, ValueError):
+        return None
+
+    from http.client import HTTPConnection
+    connection = HTTPConnection(host, int(port), blocksize=_SERVER_READ_SIZE)
+    sock.settimeout(None)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    connection.sock = sock
+    return connection
+
+
+def _send_body(sock: Any, body: Any):
+    # Writes to the socket itself as HTTPConnection.send would open a new connection once the response has taken over
+    # the socket of the connection.
+    try:
+        if isinstance(body, bytes):
+            sock.sendall(body)
+        else:
+            while block := body.read(_SERVER_READ_SIZE):
+                sock.sendall(block)
+    except OSError:
+        # The server closes the connection when it rejects a request before reading the whole body. The reason is
+        # read from its response.
+        pass
+
+
+def _forward_to_server(connection: Any, path: str, query: Dict[str, Any], body: Any, body_length: int, write: Any) -> bool:
+    from http.client import HTTPException
+    from threading import Thread
+    from urllib.parse import urlencode
+    import socket
+    sock = connection.sock
+    sender = None
+    try:
+        connection.putrequest('POST', f'{path}?{urlencode(query)}')
+        connection.putheader('Content-Length', str(body_length))
+        connection.endheaders()
+        # The server starts responding before it has read the whole body so the body is sent from another thread
+        # while the response is read. Files are streamed rather than read into memory first.
+        sender = Thread(target=_send_body, args=(sock, body), daemon=True)
+        sender.start()
+        response = connection.getresponse()
+        if response.getheader(_SERVER_HEADER) is None:
+            return False
+        if response.status != 200:
+            raise click.ClickException(response.read().decode('utf-8'))
+        while chunk := response.read(_SERVER_READ_SIZE):
+            write(chunk)
+    except (HTTPException, OSError) as error:
+        raise click.ClickException(f'The encoder server failed to complete the request: {error!r}')
+    finally:
+        if sender is not None:
+            # The caller closes the body once this returns so the sender is stopped, by shutting down the socket it
+            # may still be writing to, and waited for first.
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sender.join()
+        connection.close()
+    return True
+
+
+def _forward_text(connection: Any, path: str, query: Dict[str, Any], body: Any, body_length: int, writer: Any) -> bool:
+    import codecs
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    if not _forward_to_server(connection, path, query, body, body_length, lambda chunk: writer.write(decoder.decode(chunk))):
+        return False
+    writer.write(decoder.decode(b'', final=True))
+    return True
+
+
+def _forward_string(path: str, dictionary: str, value: str) -> bool:
+    connection = _connect_to_server()
+    if connection is None:
+        return False
+    body = value.encode('utf-8')
+    return _forward_text(connection, path, {'dictionary': dictionary}, body, len(body), sys.stdout)
+
+
+class DictionaryType(click.ParamType):
+
+    """
+    A dictionary name option that only lists the dictionaries folder when a name has to be checked or completed rather
+    than every time the CLI starts.
+    """
+
+    name = 'dictionary'
+
+    def convert(self, value: Any, param: click.Parameter | None, ctx: click.Context | None) -> str:
+        if _get_dictionary_file(value).is_file():
+            return value
+        available = ', '.join(sorted(_build_dictionary_list()))
+        self.fail(f'[{value}] is not one of the available dictionaries: {available}', param, ctx)
+
+    def shell_complete(self, ctx: click.Context, param: click.Parameter, incomplete: str) -> List[Any]:
+        from click.shell_completion import CompletionItem
+        return [CompletionItem(name) for name in sorted(_build_dictionary_list()) if name.startswith(incomplete)]
+
+
+_DICTIONARY_HELP = 'The name of a dictionary in the dictionaries folder.'
 
 
 @click.group('encode')
@@ -43,23 +206,41 @@ def _get_value_to_encode(value: str) -> str:
 
 @click.command('string')
 @click.argument('value')
-@click.option('--dictionary', '-d', type=click.Choice(list(_AVAILABLE_DICTIONARIES)), default='default')
+@click.option('--dictionary', '-d', type=DictionaryType(), default=_DEFAULT_DICTIONARY, help=_DICTIONARY_HELP)
 def encode_string_command(value: str, dictionary: str):
-    padding, mappings = _read_dictionary_from_file(dictionary)
-    print(encode_string(_get_value_to_encode(value), mappings, padding))
+    # A value entered at the prompt is treated as a secret and never sent to the server.
+    if value != '?' and _forward_string('/encode', dictionary, value):
+        return print()
+    value = _get_value_to_encode(value)
+    from encoder.lib.encode import Encoder
+    print(_load_table(Encoder, dictionary).encode_string(value))
 
 
 @click.command('file')
 @click.argument('file')
-@click.option('--dictionary', '-d', type=click.Choice(list(_AVAILABLE_DICTIONARIES)), default='default')
-def encode_file_command(file: str, dictionary: str):
+@click.option('--dictionary', '-d', type=DictionaryType(), default=_DEFAULT_DICTIONARY, help=_DICTIONARY_HELP)
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=1, help='The number of processes used to encode the file.')
+@click.option('--wrap', '-w', type=click.IntRange(min=1), help='Break the encoded output into lines of this many characters.')
+def encode_file_command(file: str, dictionary: str, jobs: int, wrap: int | None):
     file_path = Path(file)
     if not file_path.is_file():
         raise Exception('The provided path does not exist or does not point to a file.')
-    with open(file_path, 'rb') as file:
-        padding, mappings = _read_dictionary_from_file(dictionary)
-        encoded_value = encode_bytes(file.read(), mappings, padding)
-        print(encoded_value)
+    connection = _connect_to_server() if jobs == 1 else None
+    if connection is not None:
+        query = {'dictionary': dictionary} if wrap is None else {'dictionary': dictionary, 'wrap': wrap}
+        with open(file_path, 'rb') as data:
+            if _forward_text(connection, '/encode', query, data, file_path.stat().st_size, sys.stdout):
+                return print()
+
+    from encoder.lib.encode import Encoder
+    from encoder.lib.mapped_file import map_file, iter_slices
+    from encoder.lib.parallel import DEFAULT_SEGMENT_SIZE
+    from encoder.lib.stream import DEFAULT_CHUNK_SIZE
+    encoder = _load_table(Encoder, dictionary)
+    chunk_size = DEFAULT_SEGMENT_SIZE if jobs > 1 else DEFAULT_CHUNK_SIZE
+    with map_file(file_path) as data:
+        encoder.encode_stream(iter_slices(data, chunk_size), sys.stdout, chunk_size, jobs, wrap)
+    print()
 
 
 @click.group('decode')
@@ -69,21 +250,49 @@ def decode_group():
 
 @click.command('string')
 @click.argument('value')
-@click.option('--dictionary', '-d', type=click.Choice(list(_AVAILABLE_DICTIONARIES)), default='default')
+@click.option('--dictionary', '-d', type=DictionaryType(), default=_DEFAULT_DICTIONARY, help=_DICTIONARY_HELP)
 def decode_string_command(value: str, dictionary: str):
-    padding, mappings = _read_dictionary_from_file(dictionary)
-    print(decode_to_string(value, mappings, padding))
+    if _forward_string('/decode', dictionary, value):
+        return print()
+    from encoder.lib.decode import Decoder
+    print(_load_table(Decoder, dictionary).decode_string(value))
 
 
 @click.command('file')
 @click.argument('file_path')
 @click.argument('output')
-@click.option('--dictionary', '-d', type=click.Choice(list(_AVAILABLE_DICTIONARIES)), default='default')
-def decode_file_command(file_path: str, output: str, dictionary: str):
-    padding, mappings = _read_dictionary_from_file(dictionary)
-    with open(file_path, 'r') as file:
-        file_content = ''.join([line.strip() for line in file.readlines()])
-    decoded = decode_to_bytes(file_content, mappings, padding)
+@click.option('--dictionary', '-d', type=DictionaryType(), default=_DEFAULT_DICTIONARY, help=_DICTIONARY_HELP)
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=1, help='The number of processes used to decode the file.')
+@click.option('--offset', type=click.IntRange(min=0), help='The offset, in decoded bytes, of the first byte to decode.')
+@click.option('--length', type=click.IntRange(min=0), help='The number of decoded bytes to decode.')
+def decode_file_command(file_path: str, output: str, dictionary: str, jobs: int, offset: int | None, length: int | None):
+    connection = _connect_to_server() if jobs == 1 and offset is None and length is None else None
+    if connection is not None:
+        with open(file_path, 'rb') as encoded, open(output, 'wb') as decoded:
+            if _forward_to_server(connection, '/decode', {'dictionary': dictionary}, encoded, os.path.getsize(file_path), decoded.write):
+                return
+
+    from encoder.lib.decode import Decoder
+    from encoder.lib.mapped_file import map_file, map_output_file, iter_slices, iter_text, count_encoded_characters
+    from encoder.lib.parallel import DEFAULT_SEGMENT_SIZE
+    from encoder.lib.stream import DEFAULT_CHUNK_SIZE
+    decoder = _load_table(Decoder, dictionary)
+    if offset is not None or length is not None:
+        return _decode_file_range(decoder, file_path, output, offset or 0, length)
+    chunk_size = DEFAULT_SEGMENT_SIZE if jobs > 1 else DEFAULT_CHUNK_SIZE
+    with map_file(file_path) as encoded:
+        decoded_length = decoder.decoded_length(*count_encoded_characters(encoded, decoder.padding_character, DEFAULT_SEGMENT_SIZE))
+        with map_output_file(output, decoded_length) as decoded:
+            chunks = iter_slices(encoded, chunk_size) if decoder.accepts_bytes else iter_text(encoded, chunk_size)
+            decoder.decode_into(chunks, decoded, chunk_size, jobs)
+
+
+def _decode_file_range(decoder: Any, file_path: str, output: str, offset: int, length: int | None):
+    from encoder.lib.mapped_file import map_file
+    with map_file(file_path) as encoded:
+        # Dictionaries with non ASCII representations cannot locate characters by their byte offset so the file is
+        # read as text instead.
+        decoded = decoder.decode_range(encoded if decoder.accepts_bytes else str(encoded, 'utf-8'), offset, length)
     with open(output, 'wb') as file:
         file.write(decoded)
 
@@ -93,18 +302,53 @@ def decode_file_command(file_path: str, output: str, dictionary: str):
 @click.argument('encoded_character_length', type=int)
 @click.option('--padding-character', '-p', default='=')
 @click.option('--outfile', '-o')
-def generate_command(binary_key_length: int, encoded_character_length: int, padding_character: str, outfile: str):
-    generated = generate_encoding_dictionary(binary_key_length, encoded_character_length, padding_character)
-    generated_dict = dict(generated)
+@click.option('--seed', '-s', type=int, help='Seed the random number generator to generate the same dictionary again.')
+def generate_command(binary_key_length: int, encoded_character_length: int, padding_character: str, outfile: str, seed: int):
+    from encoder.lib.generator import generate_mappings, dump_encoding_dictionary
+    mappings = generate_mappings(binary_key_length, encoded_character_length, padding_character, seed)
     if outfile is None:
-        return print(yaml.safe_dump(generated_dict))
+        return dump_encoding_dictionary(padding_character, mappings, sys.stdout)
     with open(outfile, 'w') as file:
-        yaml.safe_dump(generated_dict, file)
+        dump_encoding_dictionary(padding_character, mappings, file)
+
+
+@click.command('compile')
+@click.argument('dictionaries', nargs=-1, type=DictionaryType())
+def compile_command(dictionaries: Tuple[str, ...]):
+    from encoder.lib.compiled_dictionary import compile_dictionary
+    for dictionary in dictionaries or _build_dictionary_list():
+        padding, mappings = _read_dictionary_from_file(dictionary)
+        compiled_file = _get_compiled_dictionary_file(dictionary)
+        compile_dictionary(mappings, padding, compiled_file)
+        print(f'Compiled [{dictionary}] to [{compiled_file}]')
+
+
+def _print_profile(stats: Any):
+    print(stats.format(), file=sys.stderr)
+
+
+@click.command('serve')
+@click.option('--host', default=_DEFAULT_SERVER_HOST, help='The address to listen on.')
+@click.option('--port', type=click.IntRange(min=0, max=65535), default=_DEFAULT_SERVER_PORT, help='The port to listen on.')
+def serve_command(host: str, port: int):
+    from encoder.lib.server import EncoderServer
+    dictionaries = _build_dictionary_list()
+    with EncoderServer((host, port), _read_table, dictionaries) as server:
+        print(f'Serving [{len(dictionaries)}] dictionaries on http://{host}:{server.server_address[1]}', file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
 
 
 @click.group()
-def main():
-    pass
+@click.option('--profile', is_flag=True, help='Print the time spent in each stage of the command to stderr.')
+@click.pass_context
+def main(ctx: click.Context, profile: bool):
+    if profile:
+        from encoder.lib.profiling import CodecStats
+        ctx.obj = CodecStats()
+        ctx.call_on_close(lambda: _print_profile(ctx.obj))
 
 
 encode_group.add_command(encode_string_command)
@@ -116,6 +360,8 @@ decode_group.add_command(decode_string_command)
 main.add_command(encode_group)
 main.add_command(decode_group)
 main.add_command(generate_command)
+main.add_command(compile_command)
+main.add_command(serve_command)
 
 
 if __name__ == '__main__':
@@ -8,5 +8,8 @@ if __name__ == '__main__':
         author='Andrew Cumming',
         author_email='andrew.e.cumming@gmail.com',
         url='https://github.com/AndrewEC/python-base64-encoder',
-        packages=['encoder', 'encoder.lib']
+        packages=['encoder', 'encoder.lib'],
+        extras_require={
+            'numpy': ['numpy']
+        }
     )